@@ -14,6 +14,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sql_relationship_plugin import SQLRelationshipPlugin
 
 
+# 커서 관계 추출용 정규식 (모듈 로드 시 1회 컴파일)
+_FROM_RE = re.compile(r'\bFROM\b', re.IGNORECASE)
+_DECLARE_CURSOR_RE = re.compile(r'DECLARE\s+(\w+)\s+CURSOR', re.IGNORECASE)
+_CURSOR_FOR_RE = re.compile(r'CURSOR\s+FOR\s+(.+)', re.IGNORECASE | re.DOTALL)
+
+
 class CursorRelationshipPlugin(SQLRelationshipPlugin):
     """
     Pro*C 코드에서 커서 관계를 감지하는 플러그인입니다.
@@ -30,7 +36,11 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
     
     def can_handle(self, sql_elements: List[Dict]) -> bool:
         """DECLARE CURSOR 문이 존재하는지 확인합니다."""
-        return any(self._is_declare_cursor(el) for el in sql_elements)
+        for el in sql_elements:
+            if (el.get('sql_type') == 'DECLARE' and
+                    'CURSOR' in el.get('normalized_sql', '').upper()):
+                return True
+        return False
     
     def extract_relationships(self, sql_elements: List[Dict], all_elements: List[Dict] = None) -> List[Dict]:
         """
@@ -41,9 +51,11 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
         relationships = []
         cursor_counter = {}
         
+        index = self._index_by_type(sql_elements)
+        
         # 모든 DECLARE CURSOR 문 찾기
-        for declare_el in sql_elements:
-            if not self._is_declare_cursor(declare_el):
+        for sql_upper, declare_el in self._entries_after(index, 'DECLARE'):
+            if 'CURSOR' not in sql_upper:
                 continue
             
             cursor_name = self._extract_cursor_name(declare_el)
@@ -64,33 +76,32 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
             fetch_elements = []
             
             # OPEN 문 검색
-            open_el = self._find_statement(sql_elements, 'OPEN', cursor_name, after_line=declare_el['line_start'])
+            open_el = self._find_statement(index, 'OPEN', cursor_name, after_line=declare_el['line_start'])
             if open_el:
                 related_sql_ids.append(open_el['sql_id'])
             
             # FETCH 문 검색 (루프 내에서 여러 번 가능)
-            fetch_els = self._find_all_statements(sql_elements, 'FETCH', cursor_name, after_line=declare_el['line_start'])
+            fetch_els = self._find_all_statements(index, 'FETCH', cursor_name, after_line=declare_el['line_start'])
+            all_output_vars = []
+            seen_output_vars = set()
             for fetch_el in fetch_els:
                 related_sql_ids.append(fetch_el['sql_id'])
                 fetch_elements.append(fetch_el)
+                # 출력 변수는 순서를 유지하면서 중복 제거
+                for var in fetch_el.get('output_host_vars', ()):
+                    if var not in seen_output_vars:
+                        seen_output_vars.add(var)
+                        all_output_vars.append(var)
             
             # CLOSE 문 검색
-            close_el = self._find_statement(sql_elements, 'CLOSE', cursor_name, after_line=declare_el['line_start'])
+            close_el = self._find_statement(index, 'CLOSE', cursor_name, after_line=declare_el['line_start'])
             if close_el:
                 related_sql_ids.append(close_el['sql_id'])
             
             # DECLARE 문에서 커서 쿼리 추출
             cursor_query = self._extract_cursor_query(declare_el)
             
-            # 모든 입력/출력 변수 집계
-            all_input_vars = list(declare_el.get('input_host_vars', []))
-            all_output_vars = []
-            for fetch_el in fetch_elements:
-                all_output_vars.extend(fetch_el.get('output_host_vars', []))
-            
-            # 순서를 유지하면서 중복 제거
-            all_input_vars = list(dict.fromkeys(all_input_vars))
-            all_output_vars = list(dict.fromkeys(all_output_vars))
+            all_input_vars = list(dict.fromkeys(declare_el.get('input_host_vars', [])))
             
             # 루프 기반인지 확인 (여러 FETCH 또는 동일한 함수의 FETCH)
             is_loop_based = len(fetch_elements) > 1 or self._is_likely_in_loop(fetch_elements)
@@ -104,17 +115,18 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
             merged_sql = cursor_query
             if all_output_vars:
                 # INTO 절 구성
-                into_clause = "INTO " + ", ".join([f":{v}" for v in all_output_vars])
+                into_clause = "INTO :" + ", :".join(all_output_vars)
                 
                 # SELECT 목록 뒤에 삽입 시도
                 # 간단한 휴리스틱: FROM 키워드 찾기
-                from_match = re.search(r'\bFROM\b', merged_sql, re.IGNORECASE)
+                from_match = _FROM_RE.search(merged_sql)
                 if from_match:
                     # FROM 앞에 삽입
-                    merged_sql = merged_sql[:from_match.start()] + into_clause + " " + merged_sql[from_match.start():]
+                    pos = from_match.start()
+                    merged_sql = f"{merged_sql[:pos]}{into_clause} {merged_sql[pos:]}"
                 else:
                     # 끝에 추가 (유효한 SELECT에는 드물지만 폴백)
-                    merged_sql = merged_sql + " " + into_clause
+                    merged_sql = f"{merged_sql} {into_clause}"
 
             # 관계 메타데이터 생성
             metadata = {
@@ -136,45 +148,37 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
         
         return relationships
     
-    def _is_declare_cursor(self, element: Dict) -> bool:
-        """Check if element is a DECLARE CURSOR statement."""
-        return (element.get('sql_type', '').upper() == 'DECLARE' and 
-                'CURSOR' in element.get('normalized_sql', '').upper())
-    
     def _extract_cursor_name(self, element: Dict) -> Optional[str]:
         """Extract cursor name from DECLARE statement."""
         # 신뢰할 수 있는 정규식 매칭을 위해 normalized_sql 사용 (공백 축소됨)
         normalized = element.get('normalized_sql', '')
-        match = re.search(r'DECLARE\s+(\w+)\s+CURSOR', normalized, re.IGNORECASE)
+        match = _DECLARE_CURSOR_RE.search(normalized)
         return match.group(1) if match else None
     
     def _extract_cursor_query(self, declare_el: Dict) -> str:
         """Extract the SELECT query from DECLARE CURSOR statement."""
         sql = declare_el.get('normalized_sql', '')
         # 패턴: DECLARE cursor_name CURSOR FOR <query>
-        match = re.search(r'CURSOR\s+FOR\s+(.+)', sql, re.IGNORECASE | re.DOTALL)
+        match = _CURSOR_FOR_RE.search(sql)
         return match.group(1).strip() if match else ''
     
-    def _find_statement(self, sql_elements: List[Dict], stmt_type: str, 
+    def _find_statement(self, index: Dict, stmt_type: str, 
                        cursor_name: str, after_line: int) -> Optional[Dict]:
         """Find a specific cursor-related statement (OPEN/CLOSE)."""
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                cursor_name in el.get('normalized_sql', '')):
+        name = cursor_name.upper()
+        for sql_upper, el in self._entries_after(index, stmt_type, after_line):
+            if name in sql_upper:
                 return el
         return None
     
-    def _find_all_statements(self, sql_elements: List[Dict], stmt_type: str,
+    def _find_all_statements(self, index: Dict, stmt_type: str,
                             cursor_name: str, after_line: int) -> List[Dict]:
         """Find all statements of a type referencing the cursor."""
-        results = []
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                cursor_name in el.get('normalized_sql', '')):
-                results.append(el)
-        return results
+        name = cursor_name.upper()
+        return [
+            el for sql_upper, el in self._entries_after(index, stmt_type, after_line)
+            if name in sql_upper
+        ]
     
     def _is_likely_in_loop(self, fetch_elements: List[Dict]) -> bool:
         """
@@ -8,7 +8,8 @@ PREPARE -> EXECUTE (-> DEALLOCATE)
 """
 
 import re
-from typing import List, Dict, Optional, Any
+from bisect import bisect_right
+from typing import List, Dict, Optional, Tuple, Any
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,6 +18,18 @@ from sql_relationship_plugin import SQLRelationshipPlugin
 from sql_converter import SQLConverter
 
 
+# 동적 SQL 관계 추출용 정규식 (모듈 로드 시 1회 컴파일)
+_PREPARE_NAME_RE = re.compile(r'PREPARE\s+(\w+)\s+FROM', re.IGNORECASE)
+_PREPARE_FROM_RE = re.compile(r'FROM\s+(.+)', re.IGNORECASE)
+_LITERAL_FROM_RE = re.compile(r'FROM\s+([\'"])(.*?)\1', re.IGNORECASE | re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+# EXECUTE/DEALLOCATE 문이 참조하는 statement 이름 (대문자 SQL 대상)
+_STMT_REF_RE = re.compile(r'\b(?:EXECUTE|DEALLOCATE)\s+(?:PREPARE\s+)?(\w+)')
+_CALL_ARGS_RE = re.compile(r'\w+\s*\((.*)\)', re.DOTALL)
+_FORMAT_SPEC_RE = re.compile(r'(%%|%[-+0-9.]*[a-zA-Z])')
+_C_ARG_SPECIAL_RE = re.compile(r'["\'(),]')
+
+
 class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
     """
     Pro*C 코드에서 동적 SQL 관계를 감지하는 플러그인입니다.
@@ -35,7 +48,10 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
 
     def can_handle(self, sql_elements: List[Dict]) -> bool:
         """PREPARE 문이 존재하는지 확인합니다."""
-        return any(el.get('sql_type', '').upper() == 'PREPARE' for el in sql_elements)
+        for el in sql_elements:
+            if el.get('sql_type') == 'PREPARE':
+                return True
+        return False
     
     def extract_relationships(self, sql_elements: List[Dict], all_elements: List[Dict] = None) -> List[Dict]:
         """
@@ -46,11 +62,11 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
         relationships = []
         stmt_counter = {}
         
+        index = self._index_by_type(sql_elements)
+        refs = self._index_by_statement_name(index, ('EXECUTE', 'DEALLOCATE'))
+        
         # 모든 PREPARE 문 찾기
-        for prepare_el in sql_elements:
-            if prepare_el.get('sql_type', '').upper() != 'PREPARE':
-                continue
-            
+        for _, prepare_el in self._entries_after(index, 'PREPARE'):
             stmt_name = self._extract_statement_name(prepare_el)
             if not stmt_name:
                 continue
@@ -70,15 +86,22 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
             
             # EXECUTE 문 검색
             execute_els = self._find_all_statements(
-                sql_elements, 'EXECUTE', stmt_name, after_line=prepare_el['line_start']
+                refs, 'EXECUTE', stmt_name, after_line=prepare_el['line_start']
             )
+            # EXECUTE 문의 모든 파라미터 집계 (순서를 유지하면서 중복 제거)
+            all_parameters = []
+            seen_parameters = set()
             for exec_el in execute_els:
                 related_sql_ids.append(exec_el['sql_id'])
                 execute_elements.append(exec_el)
+                for param in exec_el.get('input_host_vars', ()):
+                    if param not in seen_parameters:
+                        seen_parameters.add(param)
+                        all_parameters.append(param)
             
             # DEALLOCATE 문 검색 (선택 사항)
             deallocate_el = self._find_statement(
-                sql_elements, 'DEALLOCATE', stmt_name, after_line=prepare_el['line_start']
+                refs, 'DEALLOCATE', stmt_name, after_line=prepare_el['line_start']
             )
             if deallocate_el:
                 related_sql_ids.append(deallocate_el['sql_id'])
@@ -87,13 +110,6 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
             sql_source = self._extract_sql_source(prepare_el)
             is_literal = not sql_source.startswith(':')
             
-            # EXECUTE 문의 모든 파라미터 집계
-            all_parameters = []
-            for exec_el in execute_elements:
-                params = exec_el.get('input_host_vars', [])
-                all_parameters.extend(params)
-            all_parameters = list(dict.fromkeys(all_parameters))  # 중복 제거
-            
             # 관계 메타데이터 생성
             metadata = {
                 'statement_name': stmt_name,
@@ -180,7 +196,7 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
             
             raw_content = el.get('raw_content', '')
             # raw content에서 args 추출: func(arg1, arg2)
-            arg_str_match = re.search(r'\w+\s*\((.*)\)', raw_content, re.DOTALL)
+            arg_str_match = _CALL_ARGS_RE.search(raw_content)
             if not arg_str_match:
                 continue
             
@@ -258,65 +274,63 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
         Simulate sprintf formatting.
         Replaces %s, %d etc with values from args or placeholders.
         """
-        # % 지정자를 찾기 위한 간단한 정규식
+        # '%%' 또는 % 지정자만 찾아 치환 (지정자가 아닌 '%'는 그대로 둠)
         # 이것은 전체 printf 파서가 아니며 기본 지원만 함
-        parts = re.split(r'(%[-+0-9.]*[a-zA-Z])', fmt)
-        result = []
+        if '%' not in fmt:
+            return fmt
+        
+        # 분할 결과의 홀수 위치가 지정자이므로 그 자리만 값으로 교체
+        parts = _FORMAT_SPEC_RE.split(fmt)
         arg_idx = 0
         
-        for part in parts:
-            if part.startswith('%') and part != '%%':
-                if arg_idx < len(args):
-                    val = self._resolve_value(args[arg_idx], var_values)
-                    # val이 '?'인 경우 ? 또는 :var로 유지할 수 있음
-                    # SQL 조각인 경우 추가함.
-                    # 값(숫자나 문자열 리터럴 등)인 경우 유지할 수 있음?
-                    # 대개 동적 SQL에서 %s는 테이블 이름이나 절에 사용됨.
-                    # %d는 값일 수 있음.
-                    # 해결된 값을 사용하자.
-                    result.append(val)
-                    arg_idx += 1
-                else:
-                    result.append(part) # 인자가 충분하지 않음?
-            else:
-                result.append(part)
-                
-        return "".join(result)
+        for i in range(1, len(parts), 2):
+            if parts[i] == '%%':
+                # '%%'는 리터럴 '%'
+                parts[i] = '%'
+            elif arg_idx < len(args):
+                # 대개 동적 SQL에서 %s는 테이블 이름이나 절에 사용됨.
+                # %d는 값일 수 있음. 해결된 값을 사용하자.
+                parts[i] = self._resolve_value(args[arg_idx], var_values)
+                arg_idx += 1
+            # 인자가 충분하지 않으면 지정자 유지
+        
+        return "".join(parts)
 
     def _parse_c_args(self, arg_str: str) -> List[str]:
         """
         Split C argument string by comma, respecting quotes and parentheses.
+        
+        특수 문자(따옴표, 괄호, 쉼표) 사이의 일반 문자는 건너뛰고,
+        문자열 리터럴은 닫는 따옴표까지 str.find로 이동한 뒤 인자를 슬라이스로 잘라냅니다.
         """
         args = []
-        current_arg = []
-        in_quote = False
-        quote_char = ''
+        start = 0
         paren_depth = 0
+        search = _C_ARG_SPECIAL_RE.search
         
-        for char in arg_str:
-            if in_quote:
-                current_arg.append(char)
-                if char == quote_char and (len(current_arg) < 2 or current_arg[-2] != '\\'):
-                    in_quote = False
-            else:
-                if char == '"' or char == "'":
-                    in_quote = True
-                    quote_char = char
-                    current_arg.append(char)
-                elif char == '(':
-                    paren_depth += 1
-                    current_arg.append(char)
-                elif char == ')':
-                    paren_depth -= 1
-                    current_arg.append(char)
-                elif char == ',' and paren_depth == 0:
-                    args.append("".join(current_arg).strip())
-                    current_arg = []
-                else:
-                    current_arg.append(char)
+        match = search(arg_str)
+        while match is not None:
+            char = match.group()
+            pos = match.end()
+            if char == '"' or char == "'":
+                # 닫는 따옴표 찾기 (바로 앞이 백슬래시이면 이스케이프로 간주)
+                end = arg_str.find(char, pos)
+                while end > 0 and arg_str[end - 1] == '\\':
+                    end = arg_str.find(char, end + 1)
+                if end < 0:
+                    break
+                pos = end + 1
+            elif char == '(':
+                paren_depth += 1
+            elif char == ')':
+                paren_depth -= 1
+            elif paren_depth == 0:
+                args.append(arg_str[start:pos - 1].strip())
+                start = pos
+            match = search(arg_str, pos)
         
-        if current_arg:
-            args.append("".join(current_arg).strip())
+        if start < len(arg_str):
+            args.append(arg_str[start:].strip())
             
         return args
 
@@ -324,14 +338,14 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
         """Extract statement name from PREPARE statement."""
         sql = prepare_el.get('normalized_sql', '')
         # 패턴: PREPARE <stmt_name> FROM ...
-        match = re.search(r'PREPARE\s+(\w+)\s+FROM', sql, re.IGNORECASE)
+        match = _PREPARE_NAME_RE.search(sql)
         return match.group(1) if match else None
     
     def _extract_sql_source(self, prepare_el: Dict) -> str:
         """Extract the SQL source (host var or literal) from PREPARE."""
         sql = prepare_el.get('normalized_sql', '')
         # 패턴: PREPARE stmt FROM <source>
-        match = re.search(r'FROM\s+(.+)', sql, re.IGNORECASE)
+        match = _PREPARE_FROM_RE.search(sql)
         if match:
             source = match.group(1).strip()
             # 세미콜론이 있으면 제거
@@ -343,30 +357,44 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
         raw = prepare_el.get('raw_content', '')
         # 패턴: PREPARE ... FROM "SELECT ..." 또는 'SELECT ...'
         # 잠재적인 C 문자열 연결이나 여러 줄 문자열을 대략적으로 처리
-        match = re.search(r'FROM\s+([\'"])(.*?)\1', raw, re.IGNORECASE | re.DOTALL)
+        match = _LITERAL_FROM_RE.search(raw)
         if match:
             sql = match.group(2)
             # 기본 정리: 줄바꿈을 공백으로 대체, 공백 축소
-            return re.sub(r'\s+', ' ', sql).strip()
+            return _WS_RE.sub(' ', sql).strip()
         return ''
     
-    def _find_statement(self, sql_elements: List[Dict], stmt_type: str,
+    def _index_by_statement_name(self, index: Dict, stmt_types: Tuple[str, ...]) -> Dict[Tuple[str, str], Tuple[List[int], List[Dict]]]:
+        """
+        stmt_types 요소를 (sql_type, 참조 statement 이름) 별로 묶습니다.
+        
+        index 묶음이 이미 라인 순이므로 각 묶음도 라인 순으로 유지됩니다.
+        
+        Returns:
+            {(sql_type, 대문자 statement 이름): (line_start 목록, 요소 목록)}
+        """
+        refs = {}
+        for stmt_type in stmt_types:
+            for sql_upper, el in self._entries_after(index, stmt_type):
+                match = _STMT_REF_RE.search(sql_upper)
+                if not match:
+                    continue
+                lines, elements = refs.setdefault((stmt_type, match.group(1)), ([], []))
+                lines.append(el.get('line_start', 0))
+                elements.append(el)
+        return refs
+    
+    def _find_statement(self, refs: Dict, stmt_type: str,
                        stmt_name: str, after_line: int) -> Optional[Dict]:
         """Find a specific statement referencing the prepared statement."""
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                stmt_name in el.get('normalized_sql', '')):
-                return el
-        return None
+        statements = self._find_all_statements(refs, stmt_type, stmt_name, after_line)
+        return statements[0] if statements else None
     
-    def _find_all_statements(self, sql_elements: List[Dict], stmt_type: str,
+    def _find_all_statements(self, refs: Dict, stmt_type: str,
                             stmt_name: str, after_line: int) -> List[Dict]:
         """Find all statements of a type referencing the prepared statement."""
-        results = []
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                stmt_name in el.get('normalized_sql', '')):
-                results.append(el)
-        return results
+        bucket = refs.get((stmt_type, stmt_name.upper()))
+        if bucket is None:
+            return []
+        lines, elements = bucket
+        return elements[bisect_right(lines, after_line):]
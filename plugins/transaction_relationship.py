@@ -24,7 +24,7 @@ class TransactionRelationshipPlugin(SQLRelationshipPlugin):
     
     def can_handle(self, sql_elements: List[Dict]) -> bool:
         """COMMIT 또는 ROLLBACK 문이 존재하는지 확인합니다."""
-        return any(el.get('sql_type', '').upper() in ['COMMIT', 'ROLLBACK'] 
+        return any(el.get('sql_type') in ['COMMIT', 'ROLLBACK'] 
                   for el in sql_elements)
     
     def extract_relationships(self, sql_elements: List[Dict]) -> List[Dict]:
@@ -49,33 +49,36 @@ class TransactionRelationshipPlugin(SQLRelationshipPlugin):
             # 라인 번호로 정렬
             elements.sort(key=lambda x: x.get('line_start', 0))
             
-            # 트랜잭션 경계 찾기
-            boundaries = [el for el in elements 
-                         if el.get('sql_type', '').upper() in ['COMMIT', 'ROLLBACK']]
+            # 경계 이후 ROLLBACK 존재 여부 판단용 (마지막 ROLLBACK 라인)
+            last_rollback_line = max(
+                (el.get('line_start', 0) for el in elements if el.get('sql_type') == 'ROLLBACK'),
+                default=None
+            )
             
-            if not boundaries:
-                continue
-            
-            # 각 경계 이전의 문 그룹화
-            for boundary_el in boundaries:
+            # 한 번의 순회로 경계(COMMIT/ROLLBACK)까지의 문을 모아 트랜잭션으로 묶음
+            pending = []
+            for el in elements:
+                sql_type = el.get('sql_type')
+                if sql_type not in ('COMMIT', 'ROLLBACK'):
+                    if sql_type != 'CONNECT':
+                        pending.append(el)
+                    continue
+                boundary_el = el
+                
                 txn_counter += 1
+                boundary_line = boundary_el.get('line_start', 0)
                 
-                # 동일한 함수 내에서 이 경계 이전의 모든 SQL 문 찾기
-                txn_statements = []
-                for el in elements:
-                    if (el.get('line_start', 0) < boundary_el.get('line_start', 0) and
-                        el.get('sql_type', '').upper() not in ['COMMIT', 'ROLLBACK', 'CONNECT']):
-                        # 이미 다른 트랜잭션에 포함되지 않았는지 확인
-                        already_grouped = any(
-                            el['sql_id'] in r['sql_ids'] 
-                            for r in relationships
-                        )
-                        if not already_grouped:
-                            txn_statements.append(el)
+                # 경계와 같은 라인의 문은 다음 트랜잭션으로 넘김
+                cut = len(pending)
+                while cut and pending[cut - 1].get('line_start', 0) >= boundary_line:
+                    cut -= 1
                 
                 # 트랜잭션에 문이 있는 경우에만 관계 생성
-                if txn_statements:
-                    related_sql_ids = [el['sql_id'] for el in txn_statements]
+                if cut:
+                    txn_statements = pending[:cut]
+                    del pending[:cut]
+                    
+                    related_sql_ids = [stmt['sql_id'] for stmt in txn_statements]
                     related_sql_ids.append(boundary_el['sql_id'])
                     
                     relationship_id = self._generate_relationship_id(
@@ -83,12 +86,8 @@ class TransactionRelationshipPlugin(SQLRelationshipPlugin):
                     )
                     
                     # 트랜잭션 유형 결정
-                    is_commit = boundary_el.get('sql_type', '').upper() == 'COMMIT'
-                    has_rollback = any(
-                        el.get('sql_type', '').upper() == 'ROLLBACK' 
-                        for el in elements
-                        if el.get('line_start', 0) > boundary_el.get('line_start', 0)
-                    )
+                    is_commit = sql_type == 'COMMIT'
+                    has_rollback = last_rollback_line is not None and last_rollback_line > boundary_line
                     
                     # 메타데이터 생성
                     metadata = {
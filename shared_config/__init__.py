@@ -25,6 +25,7 @@ from .naming_rules import (
     COUNT_FIELD_PATTERNS,
     PRIMITIVE_TYPES,
     snake_to_camel,
+    snake_to_camel_batch,
     camel_to_pascal,
     find_count_field,
     is_primitive_type,
@@ -59,6 +60,7 @@ __all__ = [
     "COUNT_FIELD_PATTERNS",
     "PRIMITIVE_TYPES",
     "snake_to_camel",
+    "snake_to_camel_batch",
     "camel_to_pascal",
     "find_count_field",
     "is_primitive_type",
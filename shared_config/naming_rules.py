@@ -3,7 +3,8 @@
 필드명 변환, count 필드 탐지 패턴 등을 관리합니다.
 """
 import re
-from typing import Optional, List, Set
+from functools import lru_cache
+from typing import Iterable, Optional, List, Set
 
 # =============================================================================
 # count 필드 탐지 패턴 (우선순위 순)
@@ -15,6 +16,10 @@ COUNT_FIELD_PATTERNS = [
     "{field_name}Cnt",      # outrec1Cnt
 ]
 
+# 패턴은 모두 "{field_name}" + 접미사 형태이므로 접미사만 미리 추출해 둔다
+# (find_count_field에서 매 호출마다 str.format을 수행하지 않기 위함)
+_COUNT_SUFFIXES = tuple(p.replace("{field_name}", "", 1) for p in COUNT_FIELD_PATTERNS)
+
 # =============================================================================
 # 기본 타입 (커스텀 구조체 판별용)
 # =============================================================================
@@ -29,6 +34,7 @@ PRIMITIVE_TYPES = {
 # 헬퍼 함수
 # =============================================================================
 
+@lru_cache(maxsize=8192)
 def snake_to_camel(name: str) -> str:
     """
     snake_case를 camelCase로 변환
@@ -46,6 +52,15 @@ def snake_to_camel(name: str) -> str:
     return components[0].lower() + ''.join(x.title() for x in components[1:])
 
 
+def snake_to_camel_batch(names: Iterable[str]) -> List[str]:
+    """
+    여러 이름을 한 번에 camelCase로 변환 (DTO/MyBatis 생성 등 대량 변환용)
+    
+    동일 컬럼명이 반복되는 경우 snake_to_camel 캐시를 그대로 활용합니다.
+    """
+    return list(map(snake_to_camel, names))
+
+
 def camel_to_pascal(name: str) -> str:
     """
     camelCase를 PascalCase로 변환
@@ -80,8 +95,8 @@ def find_count_field(
         return snake_to_camel(manual_mapping[array_field_name])
     
     # 2. 패턴 매칭 시도
-    for pattern in COUNT_FIELD_PATTERNS:
-        candidate = pattern.format(field_name=array_field_name)
+    for suffix in _COUNT_SUFFIXES:
+        candidate = array_field_name + suffix
         if candidate in struct_fields:
             return snake_to_camel(candidate)
     
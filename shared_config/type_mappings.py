@@ -19,6 +19,12 @@ C_TO_JAVA_TYPE_MAP = {
     "unsigned short": ("Integer", "SMALLINT"),
 }
 
+# 대소문자/공백이 섞인 입력("Int", " unsigned  long ")용 정규화 키 테이블
+# 정확히 일치하는 키는 C_TO_JAVA_TYPE_MAP에서 먼저 찾고, 실패할 때만 사용합니다.
+_C_TO_JAVA_NORMALIZED = {
+    " ".join(k.split()).lower(): v for k, v in C_TO_JAVA_TYPE_MAP.items()
+}
+
 # =============================================================================
 # STP 타입 코드 설정
 # =============================================================================
@@ -45,9 +51,17 @@ STP_TYPE_TO_JAVA = {
 # 헬퍼 함수
 # =============================================================================
 
+def _lookup_type_mapping(c_type: str) -> Optional[Tuple[str, str]]:
+    """C 타입 매핑 조회 (정확 일치 → 정규화 일치 순)"""
+    mapping = C_TO_JAVA_TYPE_MAP.get(c_type)
+    if mapping is None and c_type:
+        mapping = _C_TO_JAVA_NORMALIZED.get(" ".join(c_type.split()).lower())
+    return mapping
+
+
 def get_java_type(c_type: str) -> str:
     """C 타입을 Java 타입으로 변환"""
-    mapping = C_TO_JAVA_TYPE_MAP.get(c_type)
+    mapping = _lookup_type_mapping(c_type)
     if mapping:
         return mapping[0]
     return "String"  # 기본값
@@ -55,7 +69,7 @@ def get_java_type(c_type: str) -> str:
 
 def get_jdbc_type(c_type: str) -> str:
     """C 타입을 JDBC 타입으로 변환"""
-    mapping = C_TO_JAVA_TYPE_MAP.get(c_type)
+    mapping = _lookup_type_mapping(c_type)
     if mapping:
         return mapping[1]
     return "VARCHAR"  # 기본값
@@ -63,4 +77,4 @@ def get_jdbc_type(c_type: str) -> str:
 
 def get_type_mapping(c_type: str) -> Tuple[str, str]:
     """C 타입을 (Java 타입, JDBC 타입) 튜플로 변환"""
-    return C_TO_JAVA_TYPE_MAP.get(c_type, ("String", "VARCHAR"))
+    return _lookup_type_mapping(c_type) or ("String", "VARCHAR")
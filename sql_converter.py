@@ -3,13 +3,66 @@ Pro*C SQL 문을 표준 SQL로 변환하고 호스트 변수를 처리하는 모
 호스트 변수 추출, 플레이스홀더 대체, 네이밍 컨벤션 적용 등을 수행합니다.
 """
 import re
+import sys
 from patterns import PATTERN_HOST_VAR
 from plugins.naming_convention import NamingConventionPlugin
 
+# sql_type으로 인정하는 첫 키워드
+_SQL_TYPE_KEYWORDS = frozenset({
+    "SELECT", "INSERT", "UPDATE", "DELETE", "DECLARE", "OPEN", "FETCH", "CLOSE",
+    "PREPARE", "EXECUTE", "CONNECT", "COMMIT", "ROLLBACK", "ALTER", "CREATE", "DROP",
+    "TRUNCATE", "MERGE", "CALL", "BEGIN", "END", "SET", "SAVEPOINT", "WHENEVER",
+})
+
+# 토큰화를 위한 Regex
+# 1. 문자열: '...' (이스케이프된 따옴표 '' 처리)
+# 2. 주석: --... (줄바꿈까지) 또는 /*...*/
+# 3. 호스트 변수: :var 또는 :var:indicator 또는 :arr[i]
+#    (hv_main: 인덱스 포함 변수, hv_name: 인덱스 제외 이름, hv_ind: 인디케이터)
+# 4. EXEC SQL 키워드 (제거용)
+# 5. FOR :array_size 절 (for_var 그룹으로 변수 캡처)
+# 6. INTO 절 키워드
+# 7. FROM 키워드
+# 8. 공백 (정규화용)
+# 9. 기타 텍스트
+_TOKEN_PATTERN = re.compile(
+    r"(?P<string>'([^']|'')*')|"
+    r"(?P<comment_single>--[^\n]*)|"
+    r"(?P<comment_multi>/\*[\s\S]*?\*/)|"
+    r"(?P<exec_sql>\bEXEC\s+SQL\s+)|"
+    r"(?P<for_clause>\bFOR\s+(?P<for_var>:?\w+(?:\[[^\]]+\])?)\s+)|"
+    r"(?P<host_var>:(?P<hv_main>(?P<hv_name>[a-zA-Z_]\w*)(?:\[[^\]]+\])?)"
+    r"(?::(?P<hv_ind>[a-zA-Z_]\w*))?)|"
+    r"(?P<into_keyword>\bINTO\b)|"
+    r"(?P<from_keyword>\bFROM\b)|"
+    r"(?P<whitespace>\s+)|"
+    r"(?P<semicolon>;)|"
+    r"(?P<other>.)",
+    re.IGNORECASE | re.DOTALL
+)
+
+# SQLConverter 인스턴스당 별칭 캐시 최대 크기 (초과 시 오래된 항목부터 제거)
+_ALIAS_CACHE_MAX = 8192
+
 class SQLConverter:
+    __slots__ = ('naming_convention', 'strip_semicolon', '_alias_cache')
+
     def __init__(self, naming_convention: NamingConventionPlugin = None, strip_semicolon: bool = True):
         self.naming_convention = naming_convention
         self.strip_semicolon = strip_semicolon
+        # 호스트 변수명 → 별칭 캐시 (같은 컬럼이 반복 등장하므로 convert 호출 절감)
+        self._alias_cache = {}
+
+    def _get_alias(self, clean_name):
+        """네이밍 컨벤션 별칭을 캐시를 거쳐 반환합니다."""
+        alias = self._alias_cache.get(clean_name)
+        if alias is None:
+            alias = sys.intern(self.naming_convention.convert(clean_name))
+            if len(self._alias_cache) >= _ALIAS_CACHE_MAX:
+                # FIFO 제거 (dict는 삽입 순서 유지)
+                del self._alias_cache[next(iter(self._alias_cache))]
+            self._alias_cache[clean_name] = alias
+        return alias
 
     def _strip_comments(self, sql):
         """
@@ -62,7 +115,8 @@ class SQLConverter:
         """
         # 타입 감지를 위해 주석을 먼저 제거
         clean_for_type = self._strip_comments(raw_sql)
-        clean_for_type = re.sub(r'\s+', ' ', clean_for_type).strip()
+        # 연속 공백을 하나로 축약 (split/join은 regex 엔진을 거치지 않음)
+        clean_for_type = ' '.join(clean_for_type.split())
         
         # EXEC SQL prefix 제거
         type_check_sql = re.sub(r'^EXEC\s+SQL\s+', '', clean_for_type, flags=re.IGNORECASE).strip()
@@ -70,49 +124,27 @@ class SQLConverter:
         # FOR :array_size 처리 (Array DML)
         type_check_sql = re.sub(r'^FOR\s+:?\w+(?:\[\w+\])?\s+', '', type_check_sql, flags=re.IGNORECASE).strip()
         
-        first_word = type_check_sql.split(' ')[0].upper() if type_check_sql else ""
+        # 첫 단어만 잘라내어 키워드 집합에서 조회 (split 리스트 생성 회피)
+        space_pos = type_check_sql.find(' ')
+        first_word = (type_check_sql[:space_pos] if space_pos != -1 else type_check_sql).upper()
         
-        sql_type = "UNKNOWN"
-        if first_word in ["SELECT", "INSERT", "UPDATE", "DELETE", "DECLARE", "OPEN", "FETCH", "CLOSE", "PREPARE", "EXECUTE", "CONNECT", "COMMIT", "ROLLBACK", "ALTER", "CREATE", "DROP", "TRUNCATE", "MERGE", "CALL", "BEGIN", "END", "SET", "SAVEPOINT", "WHENEVER"]:
-            sql_type = first_word
+        sql_type = first_word if first_word in _SQL_TYPE_KEYWORDS else "UNKNOWN"
         
         input_vars = []
         output_vars = []
         
-        # 토큰화를 위한 Regex
-        # 1. 문자열: '...' (이스케이프된 따옴표 '' 처리)
-        # 2. 주석: --... (줄바꿈까지) 또는 /*...*/
-        # 3. 호스트 변수: :var 또는 :var:indicator 또는 :arr[i]
-        # 4. EXEC SQL 키워드 (제거용)
-        # 5. INTO 절 키워드
-        # 6. FROM 키워드
-        # 7. 공백 (정규화용)
-        # 8. 기타 텍스트
-        
-        token_pattern = re.compile(
-            r"(?P<string>'([^']|'')*')|"
-            r"(?P<comment_single>--[^\n]*)|"
-            r"(?P<comment_multi>/\*[\s\S]*?\*/)|"
-            r"(?P<exec_sql>\bEXEC\s+SQL\s+)|"
-            r"(?P<for_clause>\bFOR\s+:?\w+(?:\[[^\]]+\])?\s+)|"
-            r"(?P<host_var>:[a-zA-Z_]\w*(?:\[[^\]]+\])?(?::[a-zA-Z_]\w*)?)|"
-            r"(?P<into_keyword>\bINTO\b)|"
-            r"(?P<from_keyword>\bFROM\b)|"
-            r"(?P<whitespace>\s+)|"
-            r"(?P<semicolon>;)|"
-            r"(?P<other>.)",
-            re.IGNORECASE | re.DOTALL
-        )
-        
         normalized_parts = []
         
-        is_select_or_fetch = sql_type in ["SELECT", "FETCH"]
+        is_select_or_fetch = sql_type in ("SELECT", "FETCH")
         is_insert = sql_type == "INSERT"
         
-        iterator = token_pattern.finditer(raw_sql)
+        iterator = _TOKEN_PATTERN.finditer(raw_sql)
         
         in_into_clause = False
         last_token_was_semicolon = False
+        # 마지막 숫자 토큰의 끝 위치 (HH:MM:SS 판정용)
+        # 숫자는 'other' 토큰으로만 소비되므로 raw_sql을 다시 인덱싱하지 않고 추적한다
+        last_digit_end = -1
         
         for match in iterator:
             token_type = match.lastgroup
@@ -138,58 +170,41 @@ class SQLConverter:
             elif token_type == "for_clause":
                 # FOR :array_size 절은 제거 (건너뜀)
                 # 하지만 array_size 변수는 input으로 추출
-                for_match = re.search(r':([a-zA-Z_]\w*(?:\[[^\]]+\])?)', token_value)
-                if for_match:
-                    input_vars.append(':' + for_match.group(1))
+                for_var = match.group('for_var')
+                if for_var[0] == ':':
+                    input_vars.append(for_var)
             
             elif token_type == "whitespace":
                 if not in_into_clause:
                     normalized_parts.append(" ")
             
             elif token_type == "host_var":
-                var_name = token_value
-                
-                # HH:MM:SS 엣지 케이스 확인
-                is_time_format = False
-                start_pos = match.start()
-                if start_pos > 0 and raw_sql[start_pos-1].isdigit():
-                     is_time_format = True
+                # HH:MM:SS 엣지 케이스 확인 (직전 문자가 ASCII 숫자)
+                is_time_format = match.start() == last_digit_end
                 
                 if is_time_format:
                     if not in_into_clause:
                         normalized_parts.append(token_value)
                 else:
-                    # 인디케이터 변수 분리 (:var:ind)
-                    if ':' in var_name[1:]:
-                        parts = var_name.split(':')
-                        main_var = ':' + parts[1]
-                        indicator_var = ':' + parts[2] if len(parts) > 2 else None
-                        
-                        if in_into_clause:
-                            output_vars.append(main_var)
-                            if indicator_var:
-                                output_vars.append(indicator_var)
-                        else:
-                            input_vars.append(main_var)
-                            if indicator_var:
-                                input_vars.append(indicator_var)
-                            if self.naming_convention:
-                                clean_name = main_var[1:].split('[')[0]  # 배열 인덱스 제거
-                                alias = self.naming_convention.convert(clean_name)
-                                normalized_parts.append(f"{main_var} AS {alias}")
-                            else:
-                                normalized_parts.append("?")
+                    # 인디케이터 변수 (:var:ind) 및 배열 인덱스는 토큰 정규식 그룹으로 이미 분리됨
+                    main_var = ':' + match.group('hv_main')
+                    indicator_var = match.group('hv_ind')
+                    if indicator_var:
+                        indicator_var = ':' + indicator_var
+                    
+                    if in_into_clause:
+                        output_vars.append(main_var)
+                        if indicator_var:
+                            output_vars.append(indicator_var)
                     else:
-                        if in_into_clause:
-                            output_vars.append(var_name)
+                        input_vars.append(main_var)
+                        if indicator_var:
+                            input_vars.append(indicator_var)
+                        if self.naming_convention:
+                            alias = self._get_alias(match.group('hv_name'))  # 배열 인덱스 제외
+                            normalized_parts.append(f"{main_var} AS {alias}")
                         else:
-                            input_vars.append(var_name)
-                            if self.naming_convention:
-                                clean_name = var_name[1:].split('[')[0]  # 배열 인덱스 제거
-                                alias = self.naming_convention.convert(clean_name)
-                                normalized_parts.append(f"{var_name} AS {alias}")
-                            else:
-                                normalized_parts.append("?")
+                            normalized_parts.append("?")
 
             elif token_type == "into_keyword":
                 if is_select_or_fetch and not is_insert:
@@ -212,6 +227,8 @@ class SQLConverter:
                         normalized_parts.append(token_value)
             
             elif token_type == "other":
+                if '0' <= token_value <= '9':
+                    last_digit_end = match.end()
                 if not in_into_clause:
                     normalized_parts.append(token_value)
         
@@ -12,21 +12,152 @@ SELECT 컬럼에 AS alias를 추가하여 MyBatis 변수 매핑을 지원합니
 """
 
 import re
+from functools import lru_cache
 from typing import List, Optional, Callable, Tuple
 from dataclasses import dataclass
 
+from .sql_text import remove_into_clause
+
 # sqlglot 사용 시도, 없으면 regex fallback
 try:
     import sqlglot
     from sqlglot import exp
+    from sqlglot.tokens import TokenType
     HAS_SQLGLOT = True
 except ImportError:
     HAS_SQLGLOT = False
 
 
+# ============================================================================
+# 정규식 패턴 (모듈 로드 시 1회 컴파일)
+# ============================================================================
+
+_EXEC_SQL_RE = re.compile(r'^\s*EXEC\s+SQL\s+', re.IGNORECASE)
+_CURSOR_FOR_RE = re.compile(r'CURSOR\s+FOR\s+(.+)', re.IGNORECASE | re.DOTALL)
+_SELECT_FROM_RE = re.compile(r'(\bSELECT\s+)(.*?)(\s+FROM\b)', re.IGNORECASE | re.DOTALL)
+_AS_TAIL_RE = re.compile(r'\bAS\s+\w+\s*$', re.IGNORECASE)
+# AS 없이 붙은 암시적 alias 후보 (예: "a b", "nvl(a, 0) old_a"), CASE ... END 제외
+_IMPLICIT_ALIAS_RE = re.compile(r'(?<=[\w)\'"])\s+(?!END\b)([A-Za-z_]\w*)\s*$', re.IGNORECASE)
+_SELECT_MODIFIER_RE = re.compile(r'^(?:DISTINCT|UNIQUE|ALL)\s+', re.IGNORECASE)
+_SQL_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+_RETURNING_INTO_RE = re.compile(r'\bRETURNING\s+(.*?)\s+INTO\s+[^;]+', re.IGNORECASE | re.DOTALL)
+_COLUMN_DELIM_RE = re.compile(r'[(),]')
+_SNAKE_SEGMENT_RE = re.compile(r'_+(.?)', re.DOTALL)
+_SELECT_KEYWORD_RE = re.compile(r'\bSELECT\b', re.IGNORECASE)
+_CASE_KEYWORD_RE = re.compile(r'\bCASE\b', re.IGNORECASE)
+_CURSOR_KEYWORD_RE = re.compile(r'\bCURSOR\b', re.IGNORECASE)
+_INTO_KEYWORD_RE = re.compile(r'\bINTO\b', re.IGNORECASE)
+
+# 뒤 단어와 함께 하나의 식을 이루는 키워드 (CURRENT TIMESTAMP, PRIOR col 등)
+# sqlglot 기본 dialect는 이를 "CURRENT AS TIMESTAMP" 형태의 alias로 파싱함
+_EXPRESSION_HEAD_KEYWORDS = frozenset({'CURRENT', 'PRIOR', 'CONNECT_BY_ROOT'})
+
+# _detect_sql_type에서 검사할 SQL 앞부분 길이와 (접두 키워드, SQL 타입) 목록
+_DETECT_HEAD_LEN = 64
+# SQL 앞쪽의 EXEC SQL과 주석 (선두 주석이 있을 때 타입 감지 전에 제거)
+_LEADING_NOISE_RE = re.compile(r'^(?:\s+|/\*.*?\*/|--[^\n]*|EXEC\s+SQL\b)+', re.IGNORECASE | re.DOTALL)
+_SQL_TYPE_PREFIXES = (
+    ('SELECT', 'select'),
+    ('INSERT', 'insert'),
+    ('UPDATE', 'update'),
+    ('DELETE', 'delete'),
+    ('FETCH', 'fetch_into'),
+)
+
+# SQL 타입 비트 플래그 (문자열 타입은 공개 API용, 내부 분기는 정수 마스크로 처리)
+_KIND_SELECT = 1
+_KIND_INSERT = 2
+_KIND_UPDATE = 4
+_KIND_DELETE = 8
+_KIND_FETCH = 16
+_KIND_CURSOR = 32
+
+_SQL_KINDS = {
+    'select': _KIND_SELECT,
+    'insert': _KIND_INSERT,
+    'update': _KIND_UPDATE,
+    'delete': _KIND_DELETE,
+    'fetch_into': _KIND_FETCH,
+    'declare_cursor': _KIND_CURSOR,
+}
+
+_ALIASABLE_MASK = _KIND_SELECT | _KIND_CURSOR | _KIND_FETCH
+_RETURNING_MASK = _KIND_INSERT | _KIND_UPDATE | _KIND_DELETE
+
+# add_aliases 결과 캐시 설정 (DECLARE/OPEN/FETCH 등 반복 SQL 재파싱 방지)
+_RESULT_CACHE_MAX = 2048           # 최대 항목 수 (초과 시 오래된 항목부터 제거)
+_RESULT_CACHE_MAX_SQL_LEN = 4096   # 이보다 긴 SQL은 캐시하지 않음
+_AST_CACHE_MAX = 512               # sqlglot AST 캐시 최대 항목 수 (초과 시 비움)
+
+
+def _strip_exec_sql(sql: str) -> str:
+    """선행 EXEC SQL 제거 (접두어가 없어 보이면 정규식 호출 생략)"""
+    if 'EXEC' not in sql[:32].upper() and not sql[:1].isspace():
+        return sql
+    return _EXEC_SQL_RE.sub('', sql, count=1)
+
+
+def _is_plain_select(sql: str) -> bool:
+    """
+    sqlglot 파싱 없이 regex 경로로 처리해도 되는 단순 SELECT ... FROM인지 확인
+    
+    괄호/서브쿼리/CASE/INTO가 없고 모든 컬럼이 `col`, `col AS alias` 형태여야 합니다.
+    (CURRENT TIMESTAMP 같은 키워드 식은 한 컬럼으로 봄)
+    """
+    if ('(' in sql or len(_SELECT_KEYWORD_RE.findall(sql)) != 1
+            or _CASE_KEYWORD_RE.search(sql) or _INTO_KEYWORD_RE.search(sql)):
+        return False
+    match = _SELECT_FROM_RE.search(sql)
+    if not match:
+        return False
+    for col in match.group(2).split(','):
+        words = col.split()
+        if words and words[0].upper() in _EXPRESSION_HEAD_KEYWORDS:
+            words = words[1:]
+        if len(words) != 1 and not (len(words) == 3 and words[1].upper() == 'AS'):
+            return False
+    return True
+
+
+def _implicit_alias_start(col: str) -> int:
+    """
+    regex 경로 컬럼 문자열에서 AS 없이 붙은 alias 식별자의 시작 위치
+    
+    주석 속 단어, DISTINCT 등 수식어, CURRENT TIMESTAMP/PRIOR col 같은 키워드 식은
+    alias로 보지 않습니다.
+    
+    Returns:
+        col 내 alias 시작 위치 (없거나 위치를 특정할 수 없으면 -1)
+    """
+    body = col
+    if '--' in body or '/*' in body:
+        body = _SQL_COMMENT_RE.sub(' ', body).rstrip()
+    body = _SELECT_MODIFIER_RE.sub('', body.lstrip(), count=1)
+    match = _IMPLICIT_ALIAS_RE.search(body)
+    if match is None:
+        return -1
+    head = body[:match.start()].split()
+    if len(head) == 1 and head[0].upper() in _EXPRESSION_HEAD_KEYWORDS:
+        return -1
+    if not col.endswith(body):
+        # 주석 제거로 원본 위치를 특정할 수 없음: alias는 있으나 교체하지 않음
+        return len(col)
+    return len(col) - len(body) + match.start(1)
+
+
+def _has_alias(col) -> bool:
+    """sqlglot 컬럼 식에 실제 alias가 있는지 확인 (CURRENT TIMESTAMP 등 오파싱 제외)"""
+    if not isinstance(col, exp.Alias):
+        return False
+    inner = col.this
+    return not (isinstance(inner, exp.Column) and inner.name.upper() in _EXPRESSION_HEAD_KEYWORDS)
+
+
 @dataclass
 class AliasMapping:
     """컬럼-alias 매핑 정보"""
+    __slots__ = ('original_column', 'alias', 'position')
+    
     original_column: str
     alias: str
     position: int
@@ -36,6 +167,12 @@ class AliasMapping:
 # 기본 alias 포맷터 함수들 (커스터마이징 가능)
 # ============================================================================
 
+def _upper_segment(match) -> str:
+    """_SNAKE_SEGMENT_RE 치환 콜백: 언더스코어 뒤 글자를 대문자로"""
+    return match.group(1).upper()
+
+
+@lru_cache(maxsize=4096)
 def snake_to_camel(var_name: str) -> str:
     """
     snake_case를 camelCase로 변환
@@ -46,24 +183,22 @@ def snake_to_camel(var_name: str) -> str:
     Returns:
         camelCase 변환 결과 (예: outEmpName)
     """
-    # 선행 콜론 제거
-    clean_name = var_name.lstrip(':')
-    
-    # 언더스코어로 분리
-    parts = clean_name.split('_')
-    
-    # 첫 단어는 소문자, 나머지는 첫 글자 대문자
-    if not parts:
+    # 선행 콜론 제거 후 전체 소문자화
+    clean_name = var_name.lstrip(':').lower()
+    if '_' not in clean_name:
         return clean_name
     
-    return parts[0].lower() + ''.join(p.capitalize() for p in parts[1:])
+    # 언더스코어(연속 포함) 뒤 첫 글자만 대문자로 (split + capitalize와 동일한 결과)
+    return _SNAKE_SEGMENT_RE.sub(_upper_segment, clean_name)
 
 
+@lru_cache(maxsize=4096)
 def keep_original(var_name: str) -> str:
     """원본 변수명 유지 (콜론만 제거)"""
     return var_name.lstrip(':')
 
 
+@lru_cache(maxsize=4096)
 def uppercase_first(var_name: str) -> str:
     """첫 글자 대문자"""
     clean_name = var_name.lstrip(':')
@@ -88,18 +223,10 @@ class ColumnAliasMapper:
     """
     
     # Alias 처리가 필요한 SQL 타입
-    ALIASABLE_TYPES = {
-        'select',
-        'declare_cursor',
-        'fetch_into',
-    }
+    ALIASABLE_TYPES = frozenset(t for t, k in _SQL_KINDS.items() if k & _ALIASABLE_MASK)
     
     # RETURNING 절을 지원하는 SQL 타입 (Oracle/PostgreSQL)
-    RETURNING_TYPES = {
-        'insert',
-        'update', 
-        'delete',
-    }
+    RETURNING_TYPES = frozenset(t for t, k in _SQL_KINDS.items() if k & _RETURNING_MASK)
     
     def __init__(
         self,
@@ -115,7 +242,15 @@ class ColumnAliasMapper:
         """
         self.alias_formatter = alias_formatter or snake_to_camel
         self.overwrite_existing = overwrite_existing
-        self._use_sqlglot = HAS_SQLGLOT
+        # sqlglot 가용 여부에 따라 구현을 생성 시 한 번만 바인딩
+        if HAS_SQLGLOT:
+            self._impl_add = self._add_aliases_with_sqlglot
+            self._impl_extract = self._extract_columns_with_sqlglot
+        else:
+            self._impl_add = self._add_aliases_with_regex
+            self._impl_extract = self._extract_columns_with_regex
+        self._result_cache = {}
+        self._ast_cache = {}  # 정제된 SQL → sqlglot AST
     
     def add_aliases(
         self,
@@ -137,19 +272,40 @@ class ColumnAliasMapper:
         if not output_vars:
             return sql
         
+        if len(sql) > _RESULT_CACHE_MAX_SQL_LEN:
+            return self._add_aliases(sql, output_vars, sql_type)
+        
+        key = (sql, tuple(output_vars), sql_type, self.overwrite_existing, self.alias_formatter)
+        result = self._result_cache.get(key)
+        if result is None:
+            result = self._add_aliases(sql, output_vars, sql_type)
+            if len(self._result_cache) >= _RESULT_CACHE_MAX:
+                del self._result_cache[next(iter(self._result_cache))]
+            self._result_cache[key] = result
+        return result
+    
+    def _add_aliases(self, sql: str, output_vars: List[str], sql_type: Optional[str]) -> str:
+        """add_aliases 실제 처리 (캐시 미적용)"""
         # SQL 타입 자동 감지
         if sql_type is None:
             sql_type = self._detect_sql_type(sql)
         
+        kind = _SQL_KINDS.get(sql_type, 0)
+        is_returning = kind & _RETURNING_MASK
+        
+        # alias 대상 타입이 아니고 SELECT도 없으면 파싱 없이 반환 (예: FETCH 외 명령문)
+        if not (kind & _ALIASABLE_MASK or is_returning or _SELECT_KEYWORD_RE.search(sql)):
+            return sql
+        
+        # alias는 변수당 한 번만 계산하여 하위 처리에 전달
+        aliases = [self.alias_formatter(var) for var in output_vars]
+        
         # RETURNING 절 처리
-        if sql_type in self.RETURNING_TYPES:
-            return self._add_returning_aliases(sql, output_vars)
+        if is_returning:
+            return self._add_returning_aliases(sql, aliases)
         
         # SELECT 컬럼 처리
-        if self._use_sqlglot:
-            return self._add_aliases_with_sqlglot(sql, output_vars)
-        else:
-            return self._add_aliases_with_regex(sql, output_vars)
+        return self._impl_add(sql, aliases)
     
     def extract_select_columns(self, sql: str) -> List[str]:
         """
@@ -161,39 +317,47 @@ class ColumnAliasMapper:
         Returns:
             컬럼명 목록
         """
-        if self._use_sqlglot:
-            return self._extract_columns_with_sqlglot(sql)
-        else:
-            return self._extract_columns_with_regex(sql)
+        return self._impl_extract(sql)
     
     def needs_alias(self, sql_type: str) -> bool:
         """해당 SQL 타입이 alias 처리가 필요한지 확인"""
-        return sql_type in self.ALIASABLE_TYPES or sql_type in self.RETURNING_TYPES
+        return bool(_SQL_KINDS.get(sql_type, 0) & (_ALIASABLE_MASK | _RETURNING_MASK))
     
     # =========================================================================
     # sqlglot 기반 구현
     # =========================================================================
     
-    def _add_aliases_with_sqlglot(self, sql: str, output_vars: List[str]) -> str:
+    def _parse(self, clean_sql: str):
+        """sqlglot 파싱 (AST 캐시 사용, 호출측 변경에 대비해 복사본 반환)"""
+        ast = self._ast_cache.get(clean_sql)
+        if ast is None:
+            ast = sqlglot.parse_one(clean_sql)
+            if len(self._ast_cache) >= _AST_CACHE_MAX:
+                self._ast_cache.clear()
+            self._ast_cache[clean_sql] = ast
+        return ast.copy()
+    
+    def _add_aliases_with_sqlglot(self, sql: str, aliases: List[str]) -> str:
         """sqlglot을 사용하여 alias 추가"""
-        if not HAS_SQLGLOT:
-            return self._add_aliases_with_regex(sql, output_vars)
+        # EXEC SQL 제거
+        clean_sql = _strip_exec_sql(sql)
+        # 끝 세미콜론 제거
+        clean_sql = clean_sql.rstrip(';').strip()
+        
+        # 단순 SELECT ... FROM은 regex 경로로 충분 (AST 파싱 생략)
+        if _is_plain_select(clean_sql):
+            return self._add_aliases_with_regex(clean_sql, aliases)
         
         try:
-            # EXEC SQL 제거
-            clean_sql = re.sub(r'^\s*EXEC\s+SQL\s+', '', sql, flags=re.IGNORECASE)
-            # 끝 세미콜론 제거
-            clean_sql = clean_sql.rstrip(';').strip()
-            
             # CURSOR FOR 처리
-            cursor_match = re.search(r'CURSOR\s+FOR\s+(.+)', clean_sql, re.IGNORECASE | re.DOTALL)
+            cursor_match = _CURSOR_FOR_RE.search(clean_sql)
             if cursor_match:
                 inner_sql = cursor_match.group(1).strip()
-                aliased_inner = self._add_aliases_with_sqlglot(inner_sql, output_vars)
+                aliased_inner = self._add_aliases_with_sqlglot(inner_sql, aliases)
                 return clean_sql[:cursor_match.start(1)] + aliased_inner
             
             # SQL 파싱
-            parsed = sqlglot.parse_one(clean_sql)
+            parsed = self._parse(clean_sql)
             
             # SELECT 표현식 찾기
             select_exprs = list(parsed.find_all(exp.Select))
@@ -204,10 +368,17 @@ class ColumnAliasMapper:
             top_select = select_exprs[0]
             columns = list(top_select.expressions)
             
-            # 컬럼 수와 변수 수 매칭
-            for i, (col, var) in enumerate(zip(columns, output_vars)):
-                alias_name = self.alias_formatter(var)
-                
+            # CURRENT TIMESTAMP 등이 alias로 오파싱된 경우 regex 경로 사용
+            if any(isinstance(col, exp.Alias) and not _has_alias(col) for col in columns):
+                return self._add_aliases_with_regex(clean_sql, aliases)
+            
+            # 원본 SQL에 alias를 직접 삽입 (포맷 유지, AST → SQL 재생성 생략)
+            spliced = self._splice_select_aliases(clean_sql, columns, aliases)
+            if spliced is not None:
+                return spliced
+            
+            # 토큰 위치로 컬럼 경계를 확정하지 못한 경우 AST 수정 후 재생성
+            for i, (col, alias_name) in enumerate(zip(columns, aliases)):
                 # 이미 alias가 있는 경우
                 if isinstance(col, exp.Alias):
                     if self.overwrite_existing:
@@ -224,18 +395,73 @@ class ColumnAliasMapper:
             
         except Exception as e:
             # 파싱 실패시 regex fallback
-            return self._add_aliases_with_regex(sql, output_vars)
+            return self._add_aliases_with_regex(sql, aliases)
+    
+    def _splice_select_aliases(
+        self,
+        clean_sql: str,
+        columns: list,
+        aliases: List[str]
+    ) -> Optional[str]:
+        """
+        sqlglot 토큰 위치를 이용해 원본 SQL 문자열에 alias를 직접 삽입
+        
+        최상위 SELECT의 컬럼 경계(괄호 깊이 0의 쉼표/FROM/INTO)를 토큰으로 찾고,
+        각 컬럼 끝에 " AS alias"를 삽입합니다. 기존 alias 덮어쓰기 시에는
+        컬럼의 마지막 토큰(alias 식별자)을 교체합니다.
+        
+        Returns:
+            alias가 삽입된 SQL, 경계가 AST 컬럼 수와 맞지 않으면 None
+        """
+        ends = []           # 컬럼별 마지막 토큰
+        last_token = None
+        depth = 0
+        in_select = False
+        
+        for token in sqlglot.tokenize(clean_sql):
+            token_type = token.token_type
+            if token_type == TokenType.L_PAREN:
+                depth += 1
+            elif token_type == TokenType.R_PAREN:
+                depth -= 1
+            elif depth == 0:
+                if not in_select:
+                    in_select = token_type == TokenType.SELECT
+                    continue
+                if token_type == TokenType.COMMA:
+                    ends.append(last_token)
+                    last_token = None
+                    continue
+                if token_type in (TokenType.FROM, TokenType.INTO):
+                    break
+            if in_select:
+                last_token = token
+        
+        if last_token is not None:
+            ends.append(last_token)
+        
+        if len(ends) != len(columns) or None in ends:
+            return None
+        
+        # 뒤쪽 컬럼부터 적용하여 앞쪽 오프셋 유지
+        result = clean_sql
+        for col, end_token, alias_name in reversed(list(zip(columns, ends, aliases))):
+            end = end_token.end + 1
+            if isinstance(col, exp.Alias):
+                if self.overwrite_existing:
+                    result = result[:end_token.start] + alias_name + result[end:]
+            else:
+                result = result[:end] + f" AS {alias_name}" + result[end:]
+        
+        return result
     
     def _extract_columns_with_sqlglot(self, sql: str) -> List[str]:
         """sqlglot을 사용하여 컬럼 추출"""
-        if not HAS_SQLGLOT:
-            return self._extract_columns_with_regex(sql)
-        
         try:
-            clean_sql = re.sub(r'^\s*EXEC\s+SQL\s+', '', sql, flags=re.IGNORECASE)
+            clean_sql = _strip_exec_sql(sql)
             clean_sql = clean_sql.rstrip(';').strip()
             
-            parsed = sqlglot.parse_one(clean_sql)
+            parsed = self._parse(clean_sql)
             select_exprs = list(parsed.find_all(exp.Select))
             
             if not select_exprs:
@@ -259,93 +485,74 @@ class ColumnAliasMapper:
     # Regex 기반 구현 (fallback)
     # =========================================================================
     
-    def _add_aliases_with_regex(self, sql: str, output_vars: List[str]) -> str:
+    def _add_aliases_with_regex(self, sql: str, aliases: List[str]) -> str:
         """정규식을 사용하여 alias 추가 (fallback)"""
         # EXEC SQL 제거
-        clean_sql = re.sub(r'^\s*EXEC\s+SQL\s+', '', sql, flags=re.IGNORECASE)
+        clean_sql = _strip_exec_sql(sql)
         
         # INTO 절 제거
-        clean_sql = re.sub(
-            r'\bINTO\s+[^F]+(?=\bFROM\b)',
-            '',
-            clean_sql,
-            flags=re.IGNORECASE | re.DOTALL
-        )
-        
-        # SELECT ... FROM 사이의 컬럼 추출
-        select_match = re.search(
-            r'\bSELECT\s+(.*?)\s+FROM\b',
-            clean_sql,
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        if not select_match:
-            return sql
-        
-        columns_str = select_match.group(1)
-        columns = self._split_columns(columns_str)
+        clean_sql = remove_into_clause(clean_sql)
         
-        if len(columns) != len(output_vars):
-            # 컬럼 수와 변수 수 불일치 - 가능한 만큼만 처리
-            pass
-        
-        # alias 추가
-        new_columns = []
-        for i, col in enumerate(columns):
-            col = col.strip()
-            if i < len(output_vars):
-                alias = self.alias_formatter(output_vars[i])
+        def replace(match):
+            columns = self._split_columns(match.group(2))
+            
+            # alias 추가 (컬럼 수와 변수 수가 다르면 가능한 만큼만 처리)
+            new_columns = []
+            for i, col in enumerate(columns):
+                if i < len(aliases):
+                    alias = aliases[i]
+                    
+                    # 이미 AS가 있는지 확인
+                    if _AS_TAIL_RE.search(col):
+                        if self.overwrite_existing:
+                            col = _AS_TAIL_RE.sub(f'AS {alias}', col)
+                    else:
+                        # AS 없는 기존 alias는 유지 (덮어쓰기 시 식별자만 교체)
+                        implicit = _implicit_alias_start(col)
+                        if implicit < 0:
+                            col = f"{col} AS {alias}"
+                        elif self.overwrite_existing and implicit < len(col):
+                            col = col[:implicit] + alias
                 
-                # 이미 AS가 있는지 확인
-                if re.search(r'\bAS\s+\w+\s*$', col, re.IGNORECASE):
-                    if self.overwrite_existing:
-                        col = re.sub(r'\bAS\s+\w+\s*$', f'AS {alias}', col, flags=re.IGNORECASE)
-                else:
-                    col = f"{col} AS {alias}"
+                new_columns.append(col)
             
-            new_columns.append(col)
-        
-        new_columns_str = ', '.join(new_columns)
-        result = clean_sql[:select_match.start(1)] + new_columns_str + clean_sql[select_match.end(1):]
+            return match.group(1) + ', '.join(new_columns) + match.group(3)
         
-        return result
+        # SELECT ... FROM 사이의 컬럼을 한 번의 치환으로 alias 적용
+        result, count = _SELECT_FROM_RE.subn(replace, clean_sql, count=1)
+        return result if count else sql
     
     def _extract_columns_with_regex(self, sql: str) -> List[str]:
         """정규식을 사용하여 컬럼 추출"""
-        clean_sql = re.sub(r'^\s*EXEC\s+SQL\s+', '', sql, flags=re.IGNORECASE)
+        clean_sql = _strip_exec_sql(sql)
         
-        select_match = re.search(
-            r'\bSELECT\s+(.*?)\s+FROM\b',
-            clean_sql,
-            re.IGNORECASE | re.DOTALL
-        )
+        select_match = _SELECT_FROM_RE.search(clean_sql)
         
         if not select_match:
             return []
         
-        return self._split_columns(select_match.group(1))
+        return self._split_columns(select_match.group(2))
     
     def _split_columns(self, columns_str: str) -> List[str]:
         """컬럼 문자열을 쉼표로 분리 (괄호 고려)"""
+        # 구분자 위치만 regex로 찾고, 최상위 쉼표에서만 슬라이싱
         columns = []
-        current = []
         paren_depth = 0
+        start = 0
         
-        for char in columns_str:
+        for match in _COLUMN_DELIM_RE.finditer(columns_str):
+            char = match.group()
             if char == '(':
                 paren_depth += 1
-                current.append(char)
             elif char == ')':
                 paren_depth -= 1
-                current.append(char)
-            elif char == ',' and paren_depth == 0:
-                columns.append(''.join(current).strip())
-                current = []
-            else:
-                current.append(char)
+            elif paren_depth == 0:
+                columns.append(columns_str[start:match.start()].strip())
+                start = match.end()
         
-        if current:
-            columns.append(''.join(current).strip())
+        tail = columns_str[start:].strip()
+        if tail:
+            columns.append(tail)
         
         return columns
     
@@ -353,67 +560,47 @@ class ColumnAliasMapper:
     # RETURNING 절 처리 (Oracle/PostgreSQL)
     # =========================================================================
     
-    def _add_returning_aliases(self, sql: str, output_vars: List[str]) -> str:
+    def _add_returning_aliases(self, sql: str, aliases: List[str]) -> str:
         """
         INSERT/UPDATE/DELETE RETURNING 절에 alias 추가
         
         Oracle: INSERT ... RETURNING col1, col2 INTO :var1, :var2
         → INSERT ... RETURNING col1 AS var1, col2 AS var2
-        """
-        # RETURNING ... INTO 패턴 찾기
-        returning_match = re.search(
-            r'\bRETURNING\s+(.*?)\s+INTO\b',
-            sql,
-            re.IGNORECASE | re.DOTALL
-        )
-        
-        if not returning_match:
-            return sql
-        
-        columns_str = returning_match.group(1)
-        columns = self._split_columns(columns_str)
-        
-        # alias 추가
-        new_columns = []
-        for i, col in enumerate(columns):
-            col = col.strip()
-            if i < len(output_vars):
-                alias = self.alias_formatter(output_vars[i])
-                col = f"{col} AS {alias}"
-            new_columns.append(col)
-        
-        new_columns_str = ', '.join(new_columns)
         
-        # INTO 절 제거하고 alias 적용
-        result = sql[:returning_match.start(1)] + new_columns_str
-        
-        # INTO 이후 부분 (세미콜론 등) 유지
-        into_end = re.search(r'\bINTO\s+[^;]+', sql[returning_match.end():], re.IGNORECASE)
-        if into_end:
-            result += sql[returning_match.end() + into_end.end():]
-        
-        return result
+        RETURNING ... INTO ... 구간을 한 번의 치환으로 처리하며,
+        INTO 변수 목록 이후 부분(세미콜론 등)은 그대로 유지합니다.
+        """
+        def replace(match):
+            columns = self._split_columns(match.group(1))
+            new_columns = [
+                f"{col} AS {aliases[i]}" if i < len(aliases) else col
+                for i, col in enumerate(columns)
+            ]
+            # "RETURNING" 키워드와 뒤따르는 공백은 원본 그대로 유지
+            prefix = match.group(0)[:match.start(1) - match.start()]
+            return prefix + ', '.join(new_columns)
+        
+        return _RETURNING_INTO_RE.sub(replace, sql, count=1)
     
     # =========================================================================
     # 유틸리티
     # =========================================================================
     
     def _detect_sql_type(self, sql: str) -> str:
-        """SQL 타입 자동 감지"""
-        clean_sql = sql.upper().strip()
-        
-        if clean_sql.startswith('SELECT') or 'EXEC SQL SELECT' in clean_sql.upper():
-            return 'select'
-        elif 'DECLARE' in clean_sql and 'CURSOR' in clean_sql:
+        """SQL 타입 자동 감지 (SQL 앞부분만 대문자화하여 검사)"""
+        head = sql[:_DETECT_HEAD_LEN].lstrip().upper()
+        if head.startswith('EXEC'):
+            head = _EXEC_SQL_RE.sub('', head)
+        if head.startswith(('/*', '--')):
+            # 주석이 앞부분 길이를 넘을 수 있으므로 원본에서 제거 후 다시 추출
+            head = _LEADING_NOISE_RE.sub('', sql, count=1)[:_DETECT_HEAD_LEN].upper()
+        
+        for prefix, sql_type in _SQL_TYPE_PREFIXES:
+            if head.startswith(prefix):
+                return sql_type
+        
+        if head.startswith('DECLARE') and _CURSOR_KEYWORD_RE.search(sql):
             return 'declare_cursor'
-        elif clean_sql.startswith('INSERT') or 'EXEC SQL INSERT' in clean_sql.upper():
-            return 'insert'
-        elif clean_sql.startswith('UPDATE') or 'EXEC SQL UPDATE' in clean_sql.upper():
-            return 'update'
-        elif clean_sql.startswith('DELETE') or 'EXEC SQL DELETE' in clean_sql.upper():
-            return 'delete'
-        elif clean_sql.startswith('FETCH') or 'EXEC SQL FETCH' in clean_sql.upper():
-            return 'fetch_into'
         
         return 'unknown'
 
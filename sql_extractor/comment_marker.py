@@ -5,13 +5,37 @@ SQL 주석 마커 모듈
 주석 포맷은 커스터마이징 가능합니다.
 """
 
+import string
+from functools import lru_cache
 from typing import Callable, Optional
 
 
+# 포맷 결과 캐시 크기 (동일 sql_id가 반복 마킹되는 경우 재사용)
+_COMMENT_CACHE_SIZE = 4096
+
+
 # ============================================================================
 # 기본 주석 포맷터 함수들 (커스터마이징 가능)
 # ============================================================================
 
+@lru_cache(maxsize=_COMMENT_CACHE_SIZE)
+def _default_comment(sql_id: str, sql_type: str) -> str:
+    """기본 주석 문자열 생성 (캐시)"""
+    return f"/* sql extracted: {sql_id} */"
+
+
+@lru_cache(maxsize=_COMMENT_CACHE_SIZE)
+def _mybatis_ref_comment(sql_id: str, sql_type: str) -> str:
+    """MyBatis 참조 주석 문자열 생성 (캐시)"""
+    return f"/* @mybatis:{sql_id} ({sql_type}) */"
+
+
+@lru_cache(maxsize=_COMMENT_CACHE_SIZE)
+def _c_style_marker(sql_id: str, sql_type: str) -> str:
+    """C 스타일 마커 문자열 생성 (캐시)"""
+    return f"// SQL_MARKER: {sql_id}"
+
+
 def default_comment_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
     """
     기본 주석 포맷터
@@ -24,7 +48,7 @@ def default_comment_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
     Returns:
         주석 문자열
     """
-    return f"/* sql extracted: {sql_id} */"
+    return _default_comment(sql_id, sql_type)
 
 
 def detailed_comment_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
@@ -55,7 +79,7 @@ def mybatis_ref_comment_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
     Returns:
         MyBatis 참조 스타일 주석
     """
-    return f"/* @mybatis:{sql_id} ({sql_type}) */"
+    return _mybatis_ref_comment(sql_id, sql_type)
 
 
 def c_style_marker_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
@@ -69,7 +93,15 @@ def c_style_marker_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
     Returns:
         C 스타일 주석
     """
-    return f"// SQL_MARKER: {sql_id}"
+    return _c_style_marker(sql_id, sql_type)
+
+
+# kwargs를 사용하지 않는 내장 포맷터 (mark 시 kwargs 전달 생략)
+_KWARGS_FREE_FORMATTERS = frozenset({
+    default_comment_formatter,
+    mybatis_ref_comment_formatter,
+    c_style_marker_formatter,
+})
 
 
 class SQLCommentMarker:
@@ -102,11 +134,11 @@ class SQLCommentMarker:
                              예: "/* sql: {sql_id} - {sql_type} */"
         """
         if formatter:
-            self._formatter = formatter
+            self.set_formatter(formatter)
         elif format_template:
-            self._formatter = self._create_template_formatter(format_template)
+            self.set_template(format_template)
         else:
-            self._formatter = default_comment_formatter
+            self.set_formatter(default_comment_formatter)
     
     def mark(self, sql_id: str, sql_type: str, **kwargs) -> str:
         """
@@ -120,6 +152,8 @@ class SQLCommentMarker:
         Returns:
             주석 문자열
         """
+        if self._ignores_kwargs:
+            return self._formatter(sql_id, sql_type)
         return self._formatter(sql_id, sql_type, **kwargs)
     
     def mark_with_call(
@@ -146,15 +180,38 @@ class SQLCommentMarker:
     def set_formatter(self, formatter: Callable[..., str]):
         """포맷터 변경"""
         self._formatter = formatter
+        self._ignores_kwargs = formatter in _KWARGS_FREE_FORMATTERS
     
     def set_template(self, template: str):
         """템플릿 문자열로 포맷터 설정"""
-        self._formatter = self._create_template_formatter(template)
+        self.set_formatter(self._create_template_formatter(template))
     
     def _create_template_formatter(self, template: str) -> Callable[..., str]:
-        """템플릿 문자열로부터 포맷터 함수 생성"""
+        """템플릿 문자열로부터 포맷터 함수 생성
+        
+        템플릿은 생성 시 한 번만 (리터럴, 필드명) 조각으로 분해해 두고,
+        호출 시에는 조각을 이어 붙이기만 합니다. 포맷 스펙/변환(!r)이나
+        속성/인덱스 접근이 있는 템플릿은 str.format을 그대로 사용합니다.
+        """
+        parsed = list(string.Formatter().parse(template))
+        
+        if any(
+            spec or conversion or (field is not None and not field.isidentifier())
+            for _, field, spec, conversion in parsed
+        ):
+            def template_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
+                return template.format(sql_id=sql_id, sql_type=sql_type, **kwargs)
+            return template_formatter
+        
+        pieces = tuple((literal, field) for literal, field, _, _ in parsed)
+        
         def template_formatter(sql_id: str, sql_type: str, **kwargs) -> str:
-            return template.format(sql_id=sql_id, sql_type=sql_type, **kwargs)
+            kwargs['sql_id'] = sql_id
+            kwargs['sql_type'] = sql_type
+            return ''.join([
+                literal + format(kwargs[field]) if field is not None else literal
+                for literal, field in pieces
+            ])
         return template_formatter
 
 
@@ -4,16 +4,20 @@ SQL 추출기 설정 모듈
 SQLExtractorConfig 클래스를 통해 추출 동작을 설정합니다.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Tuple, Set, FrozenSet
+from functools import lru_cache
+from typing import Dict, Tuple, Set, FrozenSet, Optional
 
 
 # ============================================================================
 # 기본 블랙리스트 상수 정의
 # ============================================================================
+# 키워드는 sys.intern으로 등록하여 모든 블랙리스트가 같은 문자열 객체를 공유하도록 함
+# (interned 문자열끼리의 집합 조회는 내용 비교 없이 포인터 비교로 끝남)
 
 # 시간/날짜 포맷 키워드 (Oracle, DB2, PostgreSQL 공통)
-DEFAULT_TIME_FORMAT_BLACKLIST: FrozenSet[str] = frozenset({
+DEFAULT_TIME_FORMAT_BLACKLIST: FrozenSet[str] = frozenset(map(sys.intern, {
     # 시간 관련
     'HH', 'HH12', 'HH24', 'MI', 'SS', 'SSSSS', 'FF', 'FF1', 'FF2', 'FF3', 'FF4', 'FF5', 'FF6',
     'AM', 'PM', 'A', 'P',
@@ -22,32 +26,61 @@ DEFAULT_TIME_FORMAT_BLACKLIST: FrozenSet[str] = frozenset({
     'DDD', 'WW', 'W', 'Q', 'J',
     # 기타 Oracle 포맷
     'TZH', 'TZM', 'TZR', 'TZD', 'CC', 'SCC', 'SYYYY', 'BC', 'AD',
-})
+}))
 
 # DB2 특수 레지스터 (CURRENT XXX 형태로 사용됨)
-DB2_SPECIAL_REGISTERS: FrozenSet[str] = frozenset({
+DB2_SPECIAL_REGISTERS: FrozenSet[str] = frozenset(map(sys.intern, {
     'CURRENT', 'DATE', 'TIME', 'TIMESTAMP', 'USER', 'SCHEMA', 'PATH',
     'TIMEZONE', 'CLIENT_ACCTNG', 'CLIENT_APPLNAME', 'CLIENT_USERID', 'CLIENT_WRKSTNNAME',
-})
+}))
 
 # PostgreSQL 형변환 연산자 뒤에 오는 타입명 (::type 패턴)
 # 주의: PostgreSQL에서는 콜론 두 개 (::)가 형변환이므로 :type 형태로 추출되지 않음
 # 하지만 일부 Pro*C 코드에서 혼용되는 경우를 대비
-POSTGRESQL_TYPE_BLACKLIST: FrozenSet[str] = frozenset({
+POSTGRESQL_TYPE_BLACKLIST: FrozenSet[str] = frozenset(map(sys.intern, {
     'INTEGER', 'INT', 'BIGINT', 'SMALLINT', 'NUMERIC', 'DECIMAL', 'REAL', 'FLOAT',
     'VARCHAR', 'CHAR', 'TEXT', 'BOOLEAN', 'BOOL', 'DATE', 'TIME', 'TIMESTAMP',
     'JSON', 'JSONB', 'UUID', 'BYTEA', 'INTERVAL',
-})
+}))
 
 # 단일 문자 변수 중 일반적으로 상수로 사용되는 패턴
 # 주의: 이 목록은 필요에 따라 확장/축소 가능
-SINGLE_CHAR_CONSTANT_BLACKLIST: FrozenSet[str] = frozenset({
+SINGLE_CHAR_CONSTANT_BLACKLIST: FrozenSet[str] = frozenset(map(sys.intern, {
     # 일반적으로 NULL, YES/NO, TRUE/FALSE 등의 약어로 사용
     'N', 'Y',
-})
+}))
 
 
-@dataclass
+# 블랙리스트 종류별 비트 플래그
+_BLACKLIST_TIME = 1
+_BLACKLIST_DB2 = 2
+_BLACKLIST_POSTGRESQL = 4
+_BLACKLIST_SINGLE_CHAR = 8
+
+# 키워드 → 소속 블랙리스트 비트마스크 (여러 목록에 속하면 OR)
+_KEYWORD_FLAGS: Dict[str, int] = {}
+for _flag, _keywords in (
+    (_BLACKLIST_TIME, DEFAULT_TIME_FORMAT_BLACKLIST),
+    (_BLACKLIST_DB2, DB2_SPECIAL_REGISTERS),
+    (_BLACKLIST_POSTGRESQL, POSTGRESQL_TYPE_BLACKLIST),
+    (_BLACKLIST_SINGLE_CHAR, SINGLE_CHAR_CONSTANT_BLACKLIST),
+):
+    for _kw in _keywords:
+        _KEYWORD_FLAGS[_kw] = _KEYWORD_FLAGS.get(_kw, 0) | _flag
+del _flag, _keywords, _kw
+
+
+# Python 3.10+에서는 dataclass에 __slots__를 생성 (인스턴스 __dict__ 제거)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=16)
+def _combined_blacklist(mask: int) -> FrozenSet[str]:
+    """비트마스크에 해당하는 기본 블랙리스트 결합 (조합별 16개 결과를 공유)"""
+    return frozenset(kw for kw, flags in _KEYWORD_FLAGS.items() if flags & mask)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SQLExtractorConfig:
     """SQL 추출기 설정
     
@@ -79,6 +112,9 @@ class SQLExtractorConfig:
     # SQL 주석 파일 생성 여부
     GENERATE_SQL_COMMENTED_FILE: bool = True
     
+    # 출력 경로 (file_manager가 없을 때 사용)
+    OUTPUT_PATH: str = "./output"
+    
     # 제외할 include 파일
     EXCLUDE_INCLUDES: Tuple[str, ...] = ("afc_svc.h", "afc_bam.h", "atmi.h")
     
@@ -115,29 +151,40 @@ class SQLExtractorConfig:
     # 문자열 리터럴 내부 호스트 변수 무시 여부
     IGNORE_VARS_IN_STRING_LITERALS: bool = True
     
-    def get_combined_blacklist(self) -> Set[str]:
+    # 커스텀 블랙리스트 포함 결과 캐시: ((마스크, 커스텀 키워드), frozenset)
+    _blacklist_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def get_combined_blacklist(self) -> FrozenSet[str]:
         """활성화된 모든 블랙리스트를 결합하여 반환
         
+        결과는 현재 블랙리스트 설정값 기준으로 캐시되며,
+        설정이 바뀌지 않는 한 같은 frozenset 객체를 반환합니다.
+        
         Returns:
-            호스트 변수로 인식하지 않을 키워드 집합 (대문자)
+            호스트 변수로 인식하지 않을 키워드 집합 (대문자, 변경 불가)
         """
-        combined = set()
-        
+        dialect = self.DBMS_DIALECT.lower()
+        mask = 0
         if self.USE_TIME_FORMAT_BLACKLIST:
-            combined.update(DEFAULT_TIME_FORMAT_BLACKLIST)
-        
-        # DB2 dialect이면 자동 활성화
-        if self.USE_DB2_SPECIAL_REGISTERS_BLACKLIST or self.DBMS_DIALECT.lower() == 'db2':
-            combined.update(DB2_SPECIAL_REGISTERS)
+            mask |= _BLACKLIST_TIME
+        # DB2 / PostgreSQL dialect이면 자동 활성화
+        if self.USE_DB2_SPECIAL_REGISTERS_BLACKLIST or dialect == 'db2':
+            mask |= _BLACKLIST_DB2
+        if self.USE_POSTGRESQL_TYPE_BLACKLIST or dialect == 'postgresql':
+            mask |= _BLACKLIST_POSTGRESQL
+        if self.USE_SINGLE_CHAR_BLACKLIST:
+            mask |= _BLACKLIST_SINGLE_CHAR
         
-        if self.USE_POSTGRESQL_TYPE_BLACKLIST or self.DBMS_DIALECT.lower() == 'postgresql':
-            combined.update(POSTGRESQL_TYPE_BLACKLIST)
+        base = _combined_blacklist(mask)
+        if not self.CUSTOM_HOST_VAR_BLACKLIST:
+            return base
         
-        if self.USE_SINGLE_CHAR_BLACKLIST:
-            combined.update(SINGLE_CHAR_CONSTANT_BLACKLIST)
+        key = (mask, frozenset(self.CUSTOM_HOST_VAR_BLACKLIST))
+        cached = self._blacklist_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         
         # 커스텀 블랙리스트 추가 (대문자로 변환)
-        combined.update(kw.upper() for kw in self.CUSTOM_HOST_VAR_BLACKLIST)
-        
-        return combined
-
+        result = base | frozenset(sys.intern(kw.upper()) for kw in key[1])
+        self._blacklist_cache = (key, result)
+        return result
@@ -8,10 +8,79 @@ DECLARE CURSOR + OPEN + FETCH INTO + CLOSE 문을
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
 
+# ============================================================================
+# 정규식 패턴 (모듈 로드 시 1회 컴파일)
+# ============================================================================
+
+_DECLARE_RE = re.compile(r'DECLARE\s+(\w+)\s+CURSOR', re.IGNORECASE)
+_CURSOR_FOR_RE = re.compile(r'CURSOR\s+FOR\s+(.+)', re.IGNORECASE | re.DOTALL)
+_EXEC_SQL_RE = re.compile(r'^\s*EXEC\s+SQL\s+', re.IGNORECASE)
+_INTO_RE = re.compile(r'INTO\s+(.+?)(?:;|$)', re.IGNORECASE | re.DOTALL)
+_INTO_SPLIT_RE = re.compile(r'INTO\s+(.+?)(?:FROM|WHERE|$)', re.IGNORECASE | re.DOTALL)
+_HOST_VAR_RE = re.compile(r':(\w+(?:\.\w+)?)')
+_FROM_RE = re.compile(r'\bFROM\b', re.IGNORECASE)
+
+# 커서 그룹에 연결되는 SQL 타입 (DECLARE 제외)
+_CURSOR_STMT_TYPES = frozenset({'open', 'fetch_into', 'fetch', 'close'})
+
+
+def _is_word_char(ch: str) -> bool:
+    """정규식 \\w 와 같은 단어 문자 여부 (빈 문자열은 False)"""
+    return ch.isalnum() or ch == '_'
+
+
+def _find_from_keyword(sql: str) -> int:
+    """단어 경계의 FROM 위치 (대소문자 무시, 없으면 -1)
+    
+    대문자화한 문자열에서 str.find로 찾고 앞뒤 문자만 확인합니다.
+    대문자화로 길이가 바뀌는 문자(ß 등)가 있으면 정규식으로 찾습니다.
+    """
+    upper = sql.upper()
+    if len(upper) != len(sql):
+        match = _FROM_RE.search(sql)
+        return match.start() if match else -1
+    
+    idx = upper.find('FROM')
+    while idx >= 0:
+        if not _is_word_char(upper[idx - 1:idx]) and not _is_word_char(upper[idx + 4:idx + 5]):
+            return idx
+        idx = upper.find('FROM', idx + 1)
+    return -1
+
+
+# DECLARE/FETCH 문 분석 결과 캐시 크기 (같은 SQL 텍스트 반복 시 재사용)
+_STATEMENT_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _cursor_query(declare_sql: str) -> Tuple[str, int]:
+    """DECLARE CURSOR FOR 뒤의 쿼리와 쿼리 내 FROM 위치 추출 (캐시, FROM 없으면 -1)"""
+    match = _CURSOR_FOR_RE.search(declare_sql)
+    if match:
+        query = match.group(1).strip()
+        # EXEC SQL 제거
+        query = _EXEC_SQL_RE.sub('', query)
+        # 끝의 세미콜론 제거
+        query = query.rstrip(';').strip()
+        return query, _find_from_keyword(query)
+    return "", -1
+
+
+@lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _into_vars(fetch_sql: str) -> Tuple[str, ...]:
+    """FETCH ... INTO 문에서 변수 추출 (캐시, 변경 불가 튜플)"""
+    match = _INTO_RE.search(fetch_sql)
+    if match:
+        # 호스트 변수 추출 (:var_name)
+        return tuple(_HOST_VAR_RE.findall(match.group(1)))
+    return ()
+
+
 @dataclass
 class CursorGroup:
     """커서 관련 SQL 그룹"""
@@ -56,34 +125,58 @@ class CursorMerger:
             CursorGroup 목록
         """
         groups = []
-        cursor_declares = {}
-        
-        # 1단계: DECLARE CURSOR 찾기
-        for block in sql_blocks:
-            sql_type = block.get('sql_type', '').lower()
-            if sql_type == 'declare_cursor':
-                cursor_name = self._extract_cursor_name(block)
-                if cursor_name:
-                    cursor_declares[cursor_name] = CursorGroup(
-                        cursor_name=cursor_name,
-                        declare_sql=block
-                    )
-        
-        # 2단계: 관련 OPEN, FETCH, CLOSE 찾기
-        for block in sql_blocks:
-            sql_type = block.get('sql_type', '').lower()
+        
+        # 라인 순서로 처리 (OPEN/FETCH/CLOSE는 항상 해당 DECLARE 뒤에 위치)
+        ordered_blocks = sorted(sql_blocks, key=lambda b: b.get('line_start', 0))
+        
+        # 블록별 SQL 타입은 호출당 한 번만 소문자화
+        sql_types = [block.get('sql_type', '').lower() for block in ordered_blocks]
+        
+        # 1단계: DECLARE CURSOR의 커서 이름 수집 (블록 순서와 같은 위치, DECLARE 아니면 None)
+        declare_names = [
+            self._extract_cursor_name(block) if sql_type == 'declare_cursor' else None
+            for block, sql_type in zip(ordered_blocks, sql_types)
+        ]
+        unique_names = {name for name in declare_names if name}
+        if not unique_names:
+            return []
+        
+        # 커서 이름들을 하나의 정규식으로 묶어 블록당 한 번만 검색
+        names_re = re.compile(
+            r'\b(' + '|'.join(map(re.escape, unique_names)) + r')\b',
+            re.IGNORECASE
+        )
+        
+        # 2단계: 라인 순서대로 진행하며 관련 OPEN, FETCH, CLOSE 연결
+        # 같은 이름의 커서가 다시 DECLARE되면 이후 문장은 새 그룹에 연결
+        active = {}  # 소문자 커서 이름 → 현재 유효한 CursorGroup
+        for block, sql_type, cursor_name in zip(ordered_blocks, sql_types, declare_names):
+            if cursor_name:
+                group = CursorGroup(cursor_name=cursor_name, declare_sql=block)
+                groups.append(group)
+                active[cursor_name.lower()] = group
+                continue
+            
+            if sql_type not in _CURSOR_STMT_TYPES:
+                continue
+            
             sql_text = block.get('sql', '') or block.get('text', '')
+            match = names_re.search(sql_text)
+            if not match:
+                continue
+            
+            group = active.get(match.group(1).lower())
+            if group is None:
+                continue
             
-            for cursor_name, group in cursor_declares.items():
-                if cursor_name.upper() in sql_text.upper():
-                    if sql_type == 'open':
-                        group.open_sql = block
-                    elif sql_type in ['fetch_into', 'fetch']:
-                        group.fetch_sqls.append(block)
-                    elif sql_type == 'close':
-                        group.close_sql = block
-        
-        return list(cursor_declares.values())
+            if sql_type == 'open':
+                group.open_sql = block
+            elif sql_type == 'close':
+                group.close_sql = block
+            else:
+                group.fetch_sqls.append(block)
+        
+        return groups
     
     def merge(self, group: CursorGroup) -> MergedCursorSQL:
         """
@@ -97,19 +190,16 @@ class CursorMerger:
         """
         # DECLARE에서 기본 쿼리 추출
         declare_sql = group.declare_sql.get('sql', '') or group.declare_sql.get('text', '')
-        base_query = self._extract_cursor_query(declare_sql)
+        base_query, from_pos = _cursor_query(declare_sql)
         
-        # FETCH에서 출력 변수 추출
-        output_vars = []
+        # FETCH에서 출력 변수 추출 (dict로 순서 유지 중복 제거)
+        seen_vars = {}
         original_fetch = ""
         for fetch in group.fetch_sqls:
             fetch_sql = fetch.get('sql', '') or fetch.get('text', '')
             original_fetch = fetch_sql
-            vars_from_fetch = self._extract_into_vars(fetch_sql)
-            output_vars.extend(vars_from_fetch)
-        
-        # 중복 제거
-        output_vars = list(dict.fromkeys(output_vars))
+            seen_vars.update(dict.fromkeys(self._extract_into_vars(fetch_sql)))
+        output_vars = list(seen_vars)
         
         # 입력 변수 추출 (WHERE 절 등)
         input_vars = self._extract_input_vars(base_query)
@@ -118,7 +208,7 @@ class CursorMerger:
         merged_sql = base_query
         if output_vars:
             into_clause = "INTO " + ", ".join([f":{v}" for v in output_vars])
-            merged_sql = self._insert_into_clause(base_query, into_clause)
+            merged_sql = self._insert_into_clause(base_query, into_clause, from_pos)
         
         return MergedCursorSQL(
             cursor_name=group.cursor_name,
@@ -133,53 +223,54 @@ class CursorMerger:
     def _extract_cursor_name(self, block: Dict) -> Optional[str]:
         """DECLARE 문에서 커서 이름 추출"""
         sql = block.get('sql', '') or block.get('text', '')
-        match = re.search(r'DECLARE\s+(\w+)\s+CURSOR', sql, re.IGNORECASE)
+        match = _DECLARE_RE.search(sql)
         return match.group(1) if match else None
     
     def _extract_cursor_query(self, declare_sql: str) -> str:
         """DECLARE CURSOR FOR 뒤의 쿼리 추출"""
-        match = re.search(r'CURSOR\s+FOR\s+(.+)', declare_sql, re.IGNORECASE | re.DOTALL)
-        if match:
-            query = match.group(1).strip()
-            # EXEC SQL 제거
-            query = re.sub(r'^\s*EXEC\s+SQL\s+', '', query, flags=re.IGNORECASE)
-            # 끝의 세미콜론 제거
-            query = query.rstrip(';').strip()
-            return query
-        return ""
+        return _cursor_query(declare_sql)[0]
     
     def _extract_into_vars(self, fetch_sql: str) -> List[str]:
         """FETCH ... INTO 문에서 변수 추출"""
-        match = re.search(r'INTO\s+(.+?)(?:;|$)', fetch_sql, re.IGNORECASE | re.DOTALL)
-        if match:
-            into_part = match.group(1)
-            # 호스트 변수 추출 (:var_name)
-            vars_found = re.findall(r':(\w+(?:\.\w+)?)', into_part)
-            return vars_found
-        return []
+        return list(_into_vars(fetch_sql))
     
     def _extract_input_vars(self, sql: str) -> List[str]:
         """SQL에서 입력 변수 추출"""
         # INTO 절 이전 또는 WHERE/VALUES 등의 입력 위치
-        # 간단히 모든 :var 추출 후 INTO 절 변수 제외
-        all_vars = re.findall(r':(\w+(?:\.\w+)?)', sql)
+        # 모든 :var를 한 번에 훑으면서 INTO 절 범위 안/밖으로 분류
+        into_match = _INTO_SPLIT_RE.search(sql)
+        into_start, into_end = into_match.span(1) if into_match else (-1, -1)
         
-        # INTO 절 변수 찾기
-        into_match = re.search(r'INTO\s+(.+?)(?:FROM|WHERE|$)', sql, re.IGNORECASE | re.DOTALL)
-        into_vars = []
-        if into_match:
-            into_vars = re.findall(r':(\w+(?:\.\w+)?)', into_match.group(1))
+        candidates = {}
+        into_vars = set()
+        for match in _HOST_VAR_RE.finditer(sql):
+            if into_start <= match.start() < into_end:
+                into_vars.add(match.group(1))
+            else:
+                candidates[match.group(1)] = None
         
         # INTO 절 변수 제외
-        input_vars = [v for v in all_vars if v not in into_vars]
-        return list(dict.fromkeys(input_vars))
+        return [v for v in candidates if v not in into_vars]
     
-    def _insert_into_clause(self, sql: str, into_clause: str) -> str:
-        """SQL에 INTO 절 삽입"""
+    def _insert_into_clause(
+        self,
+        sql: str,
+        into_clause: str,
+        from_pos: Optional[int] = None
+    ) -> str:
+        """
+        SQL에 INTO 절 삽입
+        
+        Args:
+            sql: SELECT 쿼리
+            into_clause: 삽입할 INTO 절
+            from_pos: 이미 알고 있는 FROM 위치 (-1이면 없음, None이면 검색)
+        """
         # FROM 앞에 삽입
-        from_match = re.search(r'\bFROM\b', sql, re.IGNORECASE)
-        if from_match:
-            return sql[:from_match.start()] + into_clause + " " + sql[from_match.start():]
+        if from_pos is None:
+            from_pos = _find_from_keyword(sql)
+        if from_pos >= 0:
+            return sql[:from_pos] + into_clause + " " + sql[from_pos:]
         
         # FROM이 없으면 끝에 추가
         return sql + " " + into_clause
@@ -9,10 +9,29 @@ sql_extractor로 통합.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
+# sprintf 포맷 지정자 패턴 (%% 는 리터럴 %, 모듈 로드 시 1회 컴파일)
+_FMT_SPEC_RE = re.compile(r'%%|%[-+0-9.]*[a-zA-Z]')
+
+# 인자 분리용 토큰: 문자열 리터럴(닫는 따옴표 없음 허용), 괄호, 쉼표
+# (그 외 문자는 finditer가 C 레벨에서 건너뜀)
+_ARG_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"?|\'(?:[^\'\\]|\\.)*\'?|[(),]', re.DOTALL)
+_ARG_SPECIAL_CHARS_RE = re.compile(r'["\'()]')
+
+# 문자열 리터럴 값 캐시 최대 항목 수 (초과 시 오래된 항목부터 제거)
+_LITERAL_CACHE_MAX = 4096
+
+
+@lru_cache(maxsize=64)
+def _func_call_re(func_name: str):
+    """함수 호출 패턴 func(...) 컴파일 (함수명별 1회)"""
+    return re.compile(rf'{re.escape(func_name)}\s*\((.+)\)', re.DOTALL)
+
+
 @dataclass
 class DynamicSQL:
     """동적 SQL 정보"""
@@ -42,11 +61,15 @@ class DynamicSQLExtractor:
         )
     """
     
+    # 추적 대상 C 문자열 함수
+    _STRING_FUNCTIONS = frozenset({
+        'strcpy', 'strncpy', 'strcat', 'strncat',
+        'sprintf', 'snprintf', 'memcpy'
+    })
+    
     def __init__(self):
-        self._string_functions = {
-            'strcpy', 'strncpy', 'strcat', 'strncat', 
-            'sprintf', 'snprintf', 'memcpy'
-        }
+        # C 문자열 리터럴(따옴표 포함) → 내용, 반복 등장하는 SQL 조각 재사용
+        self._literal_cache: Dict[str, str] = {}
     
     def extract_dynamic_sql(
         self,
@@ -100,48 +123,49 @@ class DynamicSQLExtractor:
         c_elements: List[Dict],
         before_line: int,
         function_name: Optional[str]
-    ) -> List[Dict]:
-        """관련 C 요소 필터링"""
-        filtered = []
+    ) -> List[Tuple[str, str]]:
+        """
+        관련 C 요소 필터링
         
-        for el in c_elements:
-            # 라인 범위 체크
-            line_end = el.get('line_end', el.get('line_start', 0))
-            if line_end >= before_line:
-                continue
-            
-            # 함수 범위 체크
-            if function_name and el.get('function') != function_name:
-                continue
-            
-            # 함수 호출 타입만
-            if el.get('type') == 'function_call':
-                filtered.append(el)
+        추적 대상 문자열 함수 호출만 골라 필요한 필드(함수명, 원본 코드)를
+        한 번에 꺼내 두므로, 이후 추적 루프에서는 딕셔너리 조회가 없습니다.
         
-        # 라인 순서 정렬
-        filtered.sort(key=lambda x: x.get('line_start', 0))
-        return filtered
+        Returns:
+            라인 순서로 정렬된 (함수명, raw_content) 목록
+        """
+        string_functions = self._STRING_FUNCTIONS
+        # 함수 호출 타입 → 함수명 → 함수 범위 → 라인 범위 순으로 검사하고,
+        # 정렬 키(line_start)를 함께 담아 튜플 비교로 정렬 (동일 라인은 원래 순서 유지)
+        decorated = [
+            (el.get('line_start', 0), idx, el.get('name', ''), el.get('raw_content', ''))
+            for idx, el in enumerate(c_elements)
+            if el.get('type') == 'function_call'
+            and el.get('name', '') in string_functions
+            and (not function_name or el.get('function') == function_name)
+            and el.get('line_end', el.get('line_start', 0)) < before_line
+        ]
+        decorated.sort()
+        return [(name, raw_content) for _, _, name, raw_content in decorated]
     
     def _track_string_operations(
         self,
-        elements: List[Dict],
+        calls: List[Tuple[str, str]],
         target_var: str
     ) -> Tuple[Dict[str, str], List[str]]:
         """
         문자열 연산 추적
         
+        Args:
+            calls: _filter_relevant_elements가 반환한 (함수명, raw_content) 목록
+            target_var: 추적 대상 변수명
+        
         Returns:
             (변수-값 딕셔너리, 연산 목록)
         """
         var_values: Dict[str, str] = {}
         operations: List[str] = []
         
-        for el in elements:
-            func_name = el.get('name', '')
-            if func_name not in self._string_functions:
-                continue
-            
-            raw_content = el.get('raw_content', '')
+        for func_name, raw_content in calls:
             args = self._parse_c_args(raw_content, func_name)
             
             if not args:
@@ -181,7 +205,7 @@ class DynamicSQLExtractor:
     def _parse_c_args(self, raw_content: str, func_name: str) -> List[str]:
         """C 함수 호출에서 인자 파싱"""
         # 함수 호출 패턴: func(arg1, arg2, ...)
-        match = re.search(rf'{func_name}\s*\((.+)\)', raw_content, re.DOTALL)
+        match = _func_call_re(func_name).search(raw_content)
         if not match:
             return []
         
@@ -190,36 +214,29 @@ class DynamicSQLExtractor:
     
     def _split_args(self, arg_str: str) -> List[str]:
         """인자 문자열을 쉼표로 분리 (따옴표, 괄호 고려)"""
+        # 따옴표/괄호가 없으면 모든 쉼표가 구분자 (마지막 빈 조각은 제외)
+        if not _ARG_SPECIAL_CHARS_RE.search(arg_str):
+            args = arg_str.split(',')
+            if not args[-1]:
+                args.pop()
+            return [arg.strip() for arg in args]
+        
         args = []
-        current = []
-        in_quote = False
-        quote_char = ''
+        start = 0
         paren_depth = 0
         
-        for char in arg_str:
-            if in_quote:
-                current.append(char)
-                if char == quote_char and (len(current) < 2 or current[-2] != '\\'):
-                    in_quote = False
-            else:
-                if char in '"\'':
-                    in_quote = True
-                    quote_char = char
-                    current.append(char)
-                elif char == '(':
-                    paren_depth += 1
-                    current.append(char)
-                elif char == ')':
-                    paren_depth -= 1
-                    current.append(char)
-                elif char == ',' and paren_depth == 0:
-                    args.append(''.join(current).strip())
-                    current = []
-                else:
-                    current.append(char)
+        for match in _ARG_TOKEN_RE.finditer(arg_str):
+            token = match.group()
+            if token == '(':
+                paren_depth += 1
+            elif token == ')':
+                paren_depth -= 1
+            elif token == ',' and paren_depth == 0:
+                args.append(arg_str[start:match.start()].strip())
+                start = match.end()
         
-        if current:
-            args.append(''.join(current).strip())
+        if start < len(arg_str):
+            args.append(arg_str[start:].strip())
         
         return args
     
@@ -227,14 +244,20 @@ class DynamicSQLExtractor:
         """인자 값 해석"""
         arg = arg.strip()
         
-        # 문자열 리터럴
-        if (arg.startswith('"') and arg.endswith('"')) or \
-           (arg.startswith("'") and arg.endswith("'")):
-            return arg[1:-1]
+        # 변수 조회 (sprintf/strcat 인자는 대부분 변수)
+        value = var_values.get(arg)
+        if value is not None:
+            return value
         
-        # 변수 조회
-        if arg in var_values:
-            return var_values[arg]
+        # 문자열 리터럴
+        if arg and arg[0] == arg[-1] and arg[0] in '"\'':
+            value = self._literal_cache.get(arg)
+            if value is None:
+                value = arg[1:-1]
+                if len(self._literal_cache) >= _LITERAL_CACHE_MAX:
+                    del self._literal_cache[next(iter(self._literal_cache))]
+                self._literal_cache[arg] = value
+            return value
         
         # 알 수 없는 값
         return "?"
@@ -246,22 +269,18 @@ class DynamicSQLExtractor:
         var_values: Dict[str, str]
     ) -> str:
         """sprintf 시뮬레이션"""
-        parts = re.split(r'(%[-+0-9.]*[a-zA-Z])', fmt)
-        result = []
-        arg_idx = 0
+        if '%' not in fmt:
+            return fmt
+        
+        remaining = iter(args)
         
-        for part in parts:
-            if part.startswith('%') and part != '%%':
-                if arg_idx < len(args):
-                    val = self._resolve_value(args[arg_idx], var_values)
-                    result.append(val)
-                    arg_idx += 1
-                else:
-                    result.append('?')
-            else:
-                result.append(part)
+        def replace_spec(match) -> str:
+            if match.group() == '%%':
+                return '%'
+            arg = next(remaining, None)
+            return '?' if arg is None else self._resolve_value(arg, var_values)
         
-        return ''.join(result)
+        return _FMT_SPEC_RE.sub(replace_spec, fmt)
     
     def _calculate_confidence(self, operations: List[str]) -> float:
         """재구성 신뢰도 계산"""
@@ -273,6 +292,12 @@ class DynamicSQLExtractor:
         penalty = len(operations) * 0.05
         
         # ? 플레이스홀더가 있으면 신뢰도 감소
-        placeholder_penalty = sum(1 for op in operations if '?' in str(op)) * 0.1
+        placeholder_count = 0
+        for op in operations:
+            if '?' in op:
+                placeholder_count += 1
+        placeholder_penalty = placeholder_count * 0.1
         
-        return max(0.0, min(1.0, base - penalty - placeholder_penalty))
+        # 감점만 있으므로 상한(1.0)은 넘지 않음, 하한만 보정
+        confidence = base - penalty - placeholder_penalty
+        return confidence if confidence > 0.0 else 0.0
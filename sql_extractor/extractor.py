@@ -7,9 +7,24 @@ Tree-sitter 기반 추출과 규칙 기반 타입 결정을 사용합니다.
 
 import re
 import os
+import string
 import logging
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple, Callable
 
+try:
+    import yaml
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .types import SqlType, ExtractedSQL, HostVariable, HostVariableType, VariableDirection
 from .config import SQLExtractorConfig
 from .registry import SQLTypeRegistry, HostVariableRegistry
@@ -25,6 +40,83 @@ from .dynamic_sql_extractor import DynamicSQLExtractor, DynamicSQL
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# 정규식 패턴 (모듈 로드 시 1회 컴파일)
+# ============================================================================
+
+_DECLARE_SECTION_RE = re.compile(
+    r"EXEC SQL BEGIN DECLARE SECTION;([\s\S]*?)EXEC SQL END DECLARE SECTION;"
+)
+# 정규식 fallback 스캐너 토큰: 주석, 문자열 리터럴, 세미콜론, EXEC SQL 시작
+# C 영역에서는 문자 리터럴도 한 줄 안에서만 인정하고 ('#if 0' 안의 it's 등),
+# EXEC SQL 내부에서만 여러 줄 SQL 문자열을 허용 ('' 이스케이프는 인접한 두 리터럴로 처리됨)
+_SCAN_TOKEN_PATTERN = (
+    r"(?P<block_comment>/\*[\s\S]*?\*/)"
+    r"|(?P<line_comment>//[^\n]*)"
+    r"|(?P<string>\"(?:[^\"\\\n]|\\.)*\"|{quoted})"
+    r"|(?P<semicolon>;)"
+    r"|(?P<exec_sql>EXEC\s+SQL\b)"
+)
+_C_SCAN_TOKEN_RE = re.compile(
+    _SCAN_TOKEN_PATTERN.format(quoted=r"'(?:[^'\\\n]|\\.)*'"), re.IGNORECASE
+)
+_SQL_SCAN_TOKEN_RE = re.compile(
+    _SCAN_TOKEN_PATTERN.format(quoted=r"'(?:[^'\\]|\\.)*'"), re.IGNORECASE
+)
+_SQL_CALL_RE = re.compile(r'sql_call\("(sql_\d+)",\s*"[^"]+"\);')
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_]\w*")
+
+# map_sql_to_functions의 함수 파일 동시 읽기 스레드 수 상한
+_FILE_SCAN_MAX_WORKERS = 8
+# 코드별 SQL 블록 추출 결과 캐시 크기 (파일 단위로 몇 개만 유지)
+_BLOCK_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=32)
+def _compile_format(template: str, fields: Tuple[str, ...]) -> Callable[..., str]:
+    """str.format 템플릿을 fields 순서의 위치 인자 렌더러로 변환
+    
+    {name} 형태의 단순 필드만 있으면 %-포맷 문자열로 한 번 변환해 두고,
+    변환/포맷 지정자나 fields에 없는 필드가 있으면 str.format을 그대로 사용합니다.
+    """
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        parsed = None
+    
+    if parsed is not None and all(
+        name is None or (name in fields and not spec and conversion is None)
+        for _, name, spec, conversion in parsed
+    ):
+        percent_template = "".join(
+            literal.replace("%", "%%") + ("%s" if name is not None else "")
+            for literal, name, _, _ in parsed
+        )
+        order = tuple(fields.index(name) for _, name, _, _ in parsed if name is not None)
+        if order == tuple(range(len(fields))):
+            return lambda *values: percent_template % values
+        return lambda *values: percent_template % tuple(values[i] for i in order)
+    
+    return lambda *values: template.format(**dict(zip(fields, values)))
+
+
+# ============================================================================
+# sql_calls.yaml 출력용 Dumper (libyaml C 구현이 있으면 사용)
+# ============================================================================
+
+if HAS_YAML:
+    class _LiteralStr(str):
+        """YAML 블록 스칼라(|)로 출력할 문자열"""
+    
+    class _SQLCallsDumper(getattr(yaml, 'CSafeDumper', yaml.SafeDumper)):
+        """SQL 문을 블록 스칼라로 출력하는 Dumper"""
+    
+    _SQLCallsDumper.add_representer(
+        _LiteralStr,
+        lambda dumper, data: dumper.represent_scalar('tag:yaml.org,2002:str', str(data), style='|')
+    )
+
+
 class SQLExtractor:
     """SQL 관련 코드 분해
     
@@ -100,6 +192,9 @@ class SQLExtractor:
         self._comment_marker: Optional[SQLCommentMarker] = None
         self._cursor_merger: Optional[CursorMerger] = None
         self._dynamic_sql_extractor: Optional[DynamicSQLExtractor] = None
+        
+        # 최근 추출한 SQL 블록 캐시: (use_tree_sitter, code) -> 블록 목록
+        self._block_cache: Dict[Tuple[bool, str], List[SQLBlock]] = {}
     
     def decompose_declare_section(
         self, code: str, file_key: str, program_dict: Dict
@@ -114,35 +209,27 @@ class SQLExtractor:
         Returns:
             DECLARE SECTION이 제거된 코드
         """
-        matches = list(
-            re.finditer(
-                r"EXEC SQL BEGIN DECLARE SECTION;([\s\S]*?)EXEC SQL END DECLARE SECTION;",
-                code,
-            )
-        )
-        
-        result_code = code
-        if matches:
-            program_dict["declare_section_files"] = []
+        matches = list(_DECLARE_SECTION_RE.finditer(code))
+        if not matches:
+            return code
+        
+        # 모든 DECLARE SECTION 파일은 같은 디렉토리에 저장
+        sql_dir = os.path.join(self._get_output_path(), file_key, "sql")
+        os.makedirs(sql_dir, exist_ok=True)
+        
+        declare_files = program_dict["declare_section_files"] = []
+        edits = []
+        for i, m in enumerate(matches):
+            file_path = os.path.join(sql_dir, f"declare_section_{i}.c")
+            section = m.group(0)
             
-            for i, m in enumerate(matches):
-                output_path = self._get_output_path()
-                file_path = os.path.join(
-                    output_path,
-                    file_key,
-                    "sql",
-                    f"declare_section_{i}.c",
-                )
-                
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(m.group(0))
-                
-                program_dict["declare_section_files"].append(file_path)
-                result_code = self._find_and_replace(result_code, m.group(0), "")
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(section)
+            
+            declare_files.append(file_path)
+            edits.append((m.start(), m.end(), section, ""))
         
-        return result_code
+        return self._splice(code, edits)
     
     def decompose_sql(
         self, code: str, file_key: str, program_dict: Dict, variables: List[Dict] = None
@@ -159,15 +246,13 @@ class SQLExtractor:
             SQL이 sql_call()로 대체된 코드
         """
         asis_sqls = []
-        result_code = code
+        replacements = []
         
         # Tree-sitter 또는 정규식으로 SQL 추출
-        if self.use_tree_sitter:
-            sql_blocks = self._extract_with_tree_sitter(code)
-        else:
-            sql_blocks = self._extract_with_regex(code)
+        sql_blocks = self._extract_sql_blocks(code)
         
         name_count = {"select": 0, "insert": 0, "update": 0, "delete": 0}
+        render_call = _compile_format(self.config.SQL_CALL_FORMAT, ("sql_id", "sql_name"))
         
         for i, block in enumerate(sql_blocks):
             # SQL 타입 결정 (규칙 기반)
@@ -175,15 +260,14 @@ class SQLExtractor:
             sql_type = result.value
             
             if sql_type == "include":
-                result_code = self._find_and_replace(result_code, block.text, "")
+                replacements.append((block, ""))
                 continue
             
             sql_id = f"sql_{i}"
             sql_name = self._generate_sql_name(sql_type, name_count)
             
             # 호스트 변수 추출
-            host_vars = self.host_var_registry.extract_all(block.text)
-            input_vars, output_vars = self.host_var_registry.classify_by_direction(
+            host_vars, input_vars, output_vars = self.host_var_registry.extract_and_classify(
                 block.text, sql_type
             )
             
@@ -204,17 +288,33 @@ class SQLExtractor:
             # SQL 호출로 교체
             indent = self._get_indent(block.text)
             replacement = (
-                indent + self.config.SQL_CALL_FORMAT.format(
-                    sql_id=sql_id, sql_name=sql_name
-                ) + "\n"
+                indent + render_call(sql_id, sql_name) + "\n"
             )
-            result_code = self._find_and_replace(result_code, block.text, replacement)
+            replacements.append((block, replacement))
         
         # SQL 호출 정보 저장
         if asis_sqls:
             self._save_sql_calls(asis_sqls, file_key)
         
-        return result_code
+        return self._replace_blocks(code, replacements)
+    
+    def _extract_sql_blocks(self, code: str) -> List[SQLBlock]:
+        """SQL 블록 추출 (Tree-sitter 또는 정규식)
+        
+        decompose_sql, create_sql_commented_version, extract_with_mybatis_conversion이
+        같은 코드를 연달아 처리하므로 최근 결과를 코드 문자열 기준으로 재사용합니다.
+        """
+        key = (self.use_tree_sitter, code)
+        blocks = self._block_cache.get(key)
+        if blocks is None:
+            if self.use_tree_sitter:
+                blocks = self._extract_with_tree_sitter(code)
+            else:
+                blocks = self._extract_with_regex(code)
+            if len(self._block_cache) >= _BLOCK_CACHE_SIZE:
+                del self._block_cache[next(iter(self._block_cache))]
+            self._block_cache[key] = blocks
+        return list(blocks)
     
     def _extract_with_tree_sitter(self, code: str) -> List[SQLBlock]:
         """Tree-sitter로 SQL 추출"""
@@ -225,93 +325,59 @@ class SQLExtractor:
     def _extract_with_regex(self, code: str) -> List[SQLBlock]:
         """정규식으로 SQL 추출 (fallback)
         
-        개선: 주석 내 EXEC SQL 제외, 문자열 내 세미콜론 고려
+        주석/문자열/세미콜론/EXEC SQL을 하나의 정규식으로 한 번에 훑습니다.
+        주석과 문자열 리터럴은 토큰 단위로 건너뛰므로 주석 내 EXEC SQL,
+        문자열 내 세미콜론은 자연히 무시됩니다. EXEC SQL 밖(C 영역)과
+        안(SQL 영역)은 작은따옴표 리터럴 규칙이 달라 토큰 정규식을 바꿔 씁니다.
         """
-        import re
-        
         blocks = []
-        
-        # C 주석 영역 찾기
-        comment_ranges = []
-        for match in re.finditer(r'/\*[\s\S]*?\*/', code):
-            comment_ranges.append((match.start(), match.end()))
-        for match in re.finditer(r'//[^\n]*', code):
-            comment_ranges.append((match.start(), match.end()))
-        
-        def is_in_comment(pos):
-            for start, end in comment_ranges:
-                if start <= pos < end:
-                    return True
-            return False
-        
-        def find_sql_end(start_pos):
-            """문자열 리터럴을 고려하여 세미콜론 찾기"""
-            in_string = False
-            quote_char = None
-            i = start_pos
-            
-            while i < len(code):
-                char = code[i]
-                
-                if char in ("'", '"'):
-                    if not in_string:
-                        in_string = True
-                        quote_char = char
-                    elif char == quote_char:
-                        if i > 0 and code[i-1] != '\\':
-                            if i + 1 < len(code) and code[i+1] == char:
-                                i += 1
-                            else:
-                                in_string = False
+        sql_start = -1
+        # 블록은 앞에서부터 순서대로 나오므로 줄 번호는 직전 위치부터 증분 계산
+        line_pos = 0
+        line_no = 1
+        
+        pos = 0
+        while True:
+            scanner = _SQL_SCAN_TOKEN_RE if sql_start >= 0 else _C_SCAN_TOKEN_RE
+            match = scanner.search(code, pos)
+            if match is None:
+                break
+            pos = match.end()
+            kind = match.lastgroup
+            if kind == 'exec_sql':
+                if sql_start < 0:
+                    sql_start = match.start()
+            elif kind == 'semicolon' and sql_start >= 0:
+                end_pos = match.end()
+                text = code[sql_start:end_pos]
                 
-                if char == ';' and not in_string:
-                    return i + 1
+                start_line = line_no + code.count('\n', line_pos, sql_start)
+                end_line = start_line + text.count('\n')
+                line_pos, line_no = end_pos, end_line
                 
-                i += 1
-            return -1
-        
-        # EXEC SQL 시작점 찾기
-        for match in re.finditer(r'EXEC\s+SQL\b', code, re.IGNORECASE):
-            start_pos = match.start()
-            
-            # 주석 내에 있으면 스킵
-            if is_in_comment(start_pos):
-                continue
-            
-            # 세미콜론까지 찾기
-            end_pos = find_sql_end(start_pos)
-            if end_pos == -1:
-                continue
-            
-            text = code[start_pos:end_pos]
-            if not text.strip():
-                continue
-            
-            start_line = code[:start_pos].count('\n') + 1
-            end_line = code[:end_pos].count('\n') + 1
-            
-            blocks.append(SQLBlock(
-                text=text,
-                start_byte=start_pos,
-                end_byte=end_pos,
-                start_line=start_line,
-                end_line=end_line,
-                containing_function=None
-            ))
+                blocks.append(SQLBlock(
+                    text=text,
+                    start_byte=sql_start,
+                    end_byte=end_pos,
+                    start_line=start_line,
+                    end_line=end_line,
+                    containing_function=None
+                ))
+                sql_start = -1
         
         return blocks
     
     def create_sql_commented_version(self, code: str, file_key: str) -> str:
         """SQL 구문을 주석으로 표시한 버전 생성"""
-        result_code = code
+        replacements = []
         
-        if self.use_tree_sitter:
-            sql_blocks = self._extract_with_tree_sitter(code)
-        else:
-            sql_blocks = self._extract_with_regex(code)
+        sql_blocks = self._extract_sql_blocks(code)
         
         name_count = {"select": 0, "insert": 0, "update": 0, "delete": 0}
         sql_counter = 0
+        render_comment = _compile_format(
+            self.config.SQL_COMMENT_FORMAT, ("sql_id", "sql_type", "desc")
+        )
         
         for block in sql_blocks:
             try:
@@ -319,36 +385,26 @@ class SQLExtractor:
                 sql_type = result.value
                 
                 if sql_type == "include":
-                    result_code = self._find_and_replace(result_code, block.text, "")
+                    replacements.append((block, ""))
                     continue
                 
                 indent = self._get_indent(block.text)
                 sql_id = f"sql_{sql_counter}"
                 
-                comment = self.config.SQL_COMMENT_FORMAT.format(
-                    sql_id=sql_id, 
-                    sql_type=sql_type.upper(), 
-                    desc="설명 없음"
-                )
+                comment = render_comment(sql_id, sql_type.upper(), "설명 없음")
                 
-                result_code = self._find_and_replace(
-                    result_code, block.text, indent + comment
-                )
+                replacements.append((block, indent + comment))
                 sql_counter += 1
                 
             except Exception as e:
                 logger.warning(f"SQL 주석 처리 실패: {e}")
                 indent = self._get_indent(block.text)
                 sql_id = f"sql_{sql_counter}"
-                comment = self.config.SQL_COMMENT_FORMAT.format(
-                    sql_id=sql_id, sql_type="UNKNOWN", desc="설명 없음"
-                )
-                result_code = self._find_and_replace(
-                    result_code, block.text, indent + comment
-                )
+                comment = render_comment(sql_id, "UNKNOWN", "설명 없음")
+                replacements.append((block, indent + comment))
                 sql_counter += 1
         
-        return result_code
+        return self._replace_blocks(code, replacements)
     
     def map_sql_to_functions(
         self, file_key: str, funcs: List[Dict]
@@ -357,29 +413,39 @@ class SQLExtractor:
         sql_to_function_map = {}
         output_path = self._get_output_path()
         
-        # 함수 파일들 스캔
+        # 함수 파일 목록은 디렉토리를 한 번만 읽어 확인
+        func_dir = os.path.join(output_path, file_key, "func")
+        try:
+            with os.scandir(func_dir) as entries:
+                existing_files = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            existing_files = set()
+        
+        # 함수 파일들 스캔 (같은 함수는 한 번만 읽음)
+        targets = []
+        scanned = set()
         for func in funcs:
             func_name = func.get("function_name") or func.get("name")
-            if not func_name:
-                continue
-                
-            func_file_path = os.path.join(
-                output_path, file_key, "func", f"func_{func_name}.c"
-            )
-            
-            if not os.path.exists(func_file_path):
+            if not func_name or func_name in scanned:
                 continue
+            scanned.add(func_name)
             
-            try:
-                with open(func_file_path, "r", encoding="utf-8") as f:
-                    func_code = f.read()
-                
-                sql_call_pattern = r'sql_call\("(sql_\d+)",\s*"[^"]+"\);'
-                for sql_id in re.findall(sql_call_pattern, func_code):
-                    sql_to_function_map[sql_id] = func_name
-                    
-            except Exception as e:
-                logger.warning(f"함수 파일 읽기 실패: {func_file_path}: {e}")
+            file_name = f"func_{func_name}.c"
+            if file_name in existing_files:
+                targets.append((func_name, os.path.join(func_dir, file_name)))
+        
+        # 파일 읽기는 I/O 대기가 대부분이므로 스레드로 겹쳐 수행 (결과는 입력 순서대로 병합)
+        paths = [path for _, path in targets]
+        if len(paths) > 1:
+            workers = min(_FILE_SCAN_MAX_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                scanned_ids = list(executor.map(self._scan_func_file, paths))
+        else:
+            scanned_ids = [self._scan_func_file(path) for path in paths]
+        
+        for (func_name, _), sql_ids in zip(targets, scanned_ids):
+            for sql_id in sql_ids:
+                sql_to_function_map[sql_id] = func_name
         
         # 클래스 파일 스캔
         class_file_path = os.path.join(output_path, file_key, f"{file_key}.c")
@@ -389,8 +455,7 @@ class SQLExtractor:
                 with open(class_file_path, "r", encoding="utf-8") as f:
                     class_code = f.read()
                 
-                sql_call_pattern = r'sql_call\("(sql_\d+)",\s*"[^"]+"\);'
-                for sql_id in re.findall(sql_call_pattern, class_code):
+                for sql_id in _SQL_CALL_RE.findall(class_code):
                     if sql_id not in sql_to_function_map:
                         sql_to_function_map[sql_id] = None
                         
@@ -399,6 +464,15 @@ class SQLExtractor:
         
         return sql_to_function_map
     
+    def _scan_func_file(self, func_file_path: str) -> List[str]:
+        """함수 파일에서 sql_call()의 SQL ID 목록 추출"""
+        try:
+            with open(func_file_path, "r", encoding="utf-8") as f:
+                return _SQL_CALL_RE.findall(f.read())
+        except Exception as e:
+            logger.warning(f"함수 파일 읽기 실패: {func_file_path}: {e}")
+            return []
+    
     def _generate_sql_name(self, sql_type: str, name_count: Dict) -> str:
         """SQL 이름 생성"""
         if sql_type in name_count:
@@ -414,8 +488,7 @@ class SQLExtractor:
     
     def _get_indent(self, text: str) -> str:
         """텍스트에서 들여쓰기 추출"""
-        match = re.match(r"^[\s]*", text)
-        return match.group(0) if match else ""
+        return text[:len(text) - len(text.lstrip())]
     
     def _get_output_path(self) -> str:
         """출력 경로 반환"""
@@ -429,6 +502,39 @@ class SQLExtractor:
             return self.code_analyzer.find_and_replace(text, old, new)
         return text.replace(old, new, 1)
     
+    def _replace_blocks(self, code: str, replacements: List[Tuple[SQLBlock, str]]) -> str:
+        """SQL 블록들을 원본 위치 기준으로 한 번에 치환"""
+        return self._splice(
+            code,
+            [(block.start_byte, block.end_byte, block.text, new) for block, new in replacements]
+        )
+    
+    def _splice(self, code: str, edits: List[Tuple[int, int, str, str]]) -> str:
+        """(시작, 끝, 원본 텍스트, 치환 문자열) 목록을 한 번에 적용
+        
+        편집은 소스 순서대로 주어진다고 가정하고, 사이 코드와 치환 문자열을
+        모아 한 번에 join합니다. 오프셋이 문자 위치와 맞지 않으면
+        (tree-sitter의 UTF-8 바이트 오프셋 등) 직전 치환 위치 이후에서 텍스트를 찾습니다.
+        code_analyzer가 find_and_replace를 제공하면 기존처럼 순차 치환합니다.
+        """
+        if self.code_analyzer and hasattr(self.code_analyzer, 'find_and_replace'):
+            for _, _, old, new in edits:
+                code = self._find_and_replace(code, old, new)
+            return code
+        
+        parts = []
+        cursor = 0
+        for start, end, old, new in edits:
+            if start < cursor or code[start:end] != old:
+                start = code.find(old, cursor)
+                if start < 0:
+                    continue
+            parts.append(code[cursor:start])
+            parts.append(new)
+            cursor = start + len(old)
+        parts.append(code[cursor:])
+        return "".join(parts)
+    
     def _save_sql_calls(self, sql_data: List[Dict], file_key: str):
         """SQL 호출 정보 저장"""
         output_path = self._get_output_path()
@@ -436,25 +542,21 @@ class SQLExtractor:
         
         os.makedirs(os.path.dirname(sql_yaml_path), exist_ok=True)
         
-        try:
-            import yaml
-            
-            class LiteralStr(str):
-                pass
-            
-            def literal_representer(dumper, data):
-                return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
-            
-            yaml.add_representer(LiteralStr, literal_representer)
-            
-            for item in sql_data:
-                if 'sql' in item and item['sql']:
-                    item['sql'] = LiteralStr(item['sql'])
-            
+        if HAS_YAML:
+            # 레코드 단위로 리스트 항목을 이어 쓰므로 전체 YAML 노드 트리를 한 번에 만들지 않음
             with open(sql_yaml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(sql_data, f, allow_unicode=True, default_flow_style=False)
-                
-        except ImportError:
+                for item in sql_data:
+                    if item.get('sql'):
+                        item = dict(item, sql=_LiteralStr(item['sql']))
+                    yaml.dump(
+                        [item], f, Dumper=_SQLCallsDumper,
+                        allow_unicode=True, default_flow_style=False
+                    )
+        elif HAS_ORJSON:
+            # orjson은 bytes(UTF-8)를 반환하며 indent=2 json.dump와 같은 형식
+            with open(sql_yaml_path.replace('.yaml', '.json'), 'wb') as f:
+                f.write(orjson.dumps(sql_data, option=orjson.OPT_INDENT_2))
+        else:
             import json
             with open(sql_yaml_path.replace('.yaml', '.json'), 'w', encoding='utf-8') as f:
                 json.dump(sql_data, f, ensure_ascii=False, indent=2)
@@ -538,49 +640,47 @@ class SQLExtractor:
         marker = self.get_comment_marker(template=comment_template)
         cursor_merger = self.get_cursor_merger()
         
-        result_code = code
         mybatis_sqls = []
+        replacements = []
         
         # SQL 블록 추출
-        if self.use_tree_sitter:
-            sql_blocks = self._extract_with_tree_sitter(code)
-        else:
-            sql_blocks = self._extract_with_regex(code)
+        sql_blocks = self._extract_sql_blocks(code)
+        
+        # SQL 타입은 블록당 한 번만 결정
+        type_results = [self.sql_type_registry.determine_type(b.text) for b in sql_blocks]
         
         # 커서 그룹 찾기
         block_dicts = [{
             'sql': b.text,
             'text': b.text,
-            'sql_type': self.sql_type_registry.determine_type(b.text).value,
+            'sql_type': result.value,
             'line_start': b.start_line,
             'line_end': b.end_line,
             'function_name': b.containing_function,
-        } for b in sql_blocks]
+        } for b, result in zip(sql_blocks, type_results)]
         
         cursor_groups = cursor_merger.find_cursor_groups(block_dicts)
-        merged_cursor_names = set()
-        for group in cursor_groups:
-            merged_cursor_names.add(group.cursor_name)
+        merged_cursor_names = {group.cursor_name.upper() for group in cursor_groups}
         
-        for block in sql_blocks:
-            # SQL 타입 결정
-            result = self.sql_type_registry.determine_type(block.text)
+        for block, result in zip(sql_blocks, type_results):
             sql_type = result.value
             
             # INCLUDE, DECLARE_SECTION 등은 스킵
             if sql_type in ["include", "declare_section_begin", "declare_section_end"]:
-                result_code = self._find_and_replace(result_code, block.text, "")
+                replacements.append((block, ""))
                 continue
             
             # 커서 관련 문은 병합 처리 (OPEN/FETCH/CLOSE는 스킵)
             if sql_type in ["open", "close", "fetch_into"]:
                 # 커서 이름이 병합 대상인지 확인
-                is_merged = any(name.upper() in block.text.upper() for name in merged_cursor_names)
+                is_merged = not merged_cursor_names.isdisjoint(
+                    _IDENTIFIER_RE.findall(block.text.upper())
+                )
                 if is_merged:
                     # 주석만 남기고 제거
                     comment = marker.mark("cursor_op", sql_type, function_name=block.containing_function)
                     indent = self._get_indent(block.text)
-                    result_code = self._find_and_replace(result_code, block.text, indent + comment + "\n")
+                    replacements.append((block, indent + comment + "\n"))
                     continue
             
             # ID 생성
@@ -636,9 +736,9 @@ class SQLExtractor:
             )
             indent = self._get_indent(block.text)
             replacement = indent + comment + "\n"
-            result_code = self._find_and_replace(result_code, block.text, replacement)
+            replacements.append((block, replacement))
         
-        return result_code, mybatis_sqls
+        return self._replace_blocks(code, replacements), mybatis_sqls
     
     def extract_dynamic_sql(
         self,
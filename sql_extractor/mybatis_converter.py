@@ -6,9 +6,12 @@ Pro*C SQL을 MyBatis XML 형식으로 변환합니다.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Callable
 from dataclasses import dataclass, field
 
+from .sql_text import remove_into_clause
+
 # ColumnAliasMapper (지연 import로 순환 참조 방지)
 _alias_mapper = None
 
@@ -94,6 +97,39 @@ TIME_FORMAT_PATTERNS = [
     r"TO_DATE\s*\([^)]*'[^']*:[^']*'", # TO_DATE(..., 'format:with:colons')
 ]
 
+# 변환 단계별 정규식 (모듈 로드 시 1회 컴파일)
+_EXEC_SQL_RE = re.compile(r'EXEC\s+SQL\s+', re.IGNORECASE)
+_REMAINING_HOSTVAR = r':(?P<hv>\w+(?:\.\w+)?(?:\[\w+\])?(?::\w+)?)'
+
+
+@lru_cache(maxsize=256)
+def _compile_host_var_scanner(literals: tuple) -> "re.Pattern":
+    """
+    시간 포맷 / 명시적 입력 변수 / 그 외 호스트 변수를 한 번에 찾는 정규식 컴파일
+    
+    매칭 그룹: tfmt(시간 포맷, 그대로 유지), known(literals 중 하나), hv(그 외 호스트 변수).
+    같은 위치에서는 시간 포맷이 우선하며, literals는 긴 문자열을 먼저 배치하여
+    :id 가 :id_list 의 접두어로 먼저 매칭되는 것을 방지합니다.
+    """
+    parts = ['(?P<tfmt>(?i:' + '|'.join(TIME_FORMAT_PATTERNS) + '))']
+    if literals:
+        ordered = sorted(literals, key=len, reverse=True)
+        parts.append('(?P<known>' + '|'.join(map(re.escape, ordered)) + ')')
+    parts.append(_REMAINING_HOSTVAR)
+    return re.compile('|'.join(parts))
+
+
+@lru_cache(maxsize=4096)
+def _to_param_name(var_name: str) -> str:
+    """
+    호스트 변수명(콜론 제외)을 파라미터명으로 정규화
+    
+    :var:ind → var (인디케이터 제거), :arr[i] → arr (배열 인덱스 제거),
+    :struct.field → struct_field (구조체 필드)
+    """
+    var_name = var_name.partition(':')[0].partition('[')[0]
+    return var_name.replace('.', '_') if '.' in var_name else var_name
+
 
 class MyBatisConverter:
     """
@@ -134,10 +170,6 @@ class MyBatisConverter:
         """
         self.input_formatter = input_formatter or default_input_formatter
         self.output_formatter = output_formatter or default_output_formatter
-        self._time_format_regex = re.compile(
-            '|'.join(TIME_FORMAT_PATTERNS), 
-            re.IGNORECASE
-        )
         self._alias_mapper = None  # 지연 초기화
         self._add_column_aliases = True  # alias 추가 활성화
     
@@ -192,16 +224,10 @@ class MyBatisConverter:
         if sql_type in ["select", "fetch_into"]:
             converted = self.remove_into_clause(converted)
         
-        # 5. 시간 포맷 보호 (임시 치환)
-        converted, time_placeholders = self._protect_time_formats(converted)
-        
-        # 6. 호스트 변수 변환
+        # 5. 호스트 변수 변환 (시간 포맷 문자열 내부는 제외)
         converted = self._convert_host_variables(converted, input_vars)
         
-        # 7. 시간 포맷 복원
-        converted = self._restore_time_formats(converted, time_placeholders)
-        
-        # 8. 정리
+        # 6. 정리
         converted = self._cleanup_sql(converted)
         
         # 출력 필드 처리
@@ -233,89 +259,56 @@ class MyBatisConverter:
         Returns:
             INTO 절이 제거된 SQL
         """
-        # INTO ... FROM 패턴
-        pattern = r'\bINTO\s+[^F]+(?=\bFROM\b)'
-        result = re.sub(pattern, '', sql, flags=re.IGNORECASE | re.DOTALL)
-        
-        # INTO ... WHERE 패턴 (FROM 없는 경우)
-        if 'FROM' not in sql.upper():
-            pattern = r'\bINTO\s+[^W]+(?=\bWHERE\b)'
-            result = re.sub(pattern, '', result, flags=re.IGNORECASE | re.DOTALL)
-        
-        return result
+        return remove_into_clause(sql)
     
     def determine_mybatis_type(self, sql_type: str) -> str:
         """SQL 타입을 MyBatis 태그 타입으로 변환"""
         return self.TYPE_MAPPING.get(sql_type, "select")
     
     def _remove_exec_sql(self, sql: str) -> str:
-        """EXEC SQL 제거"""
-        return re.sub(r'^\s*EXEC\s+SQL\s+', '', sql, flags=re.IGNORECASE)
-    
-    def _protect_time_formats(self, sql: str) -> tuple:
-        """시간 포맷 문자열을 임시 플레이스홀더로 치환"""
-        placeholders = {}
-        counter = 0
-        
-        def replace_match(match):
-            nonlocal counter
-            placeholder = f"__TIME_FMT_{counter}__"
-            placeholders[placeholder] = match.group(0)
-            counter += 1
-            return placeholder
-        
-        protected = self._time_format_regex.sub(replace_match, sql)
-        return protected, placeholders
-    
-    def _restore_time_formats(self, sql: str, placeholders: dict) -> str:
-        """임시 플레이스홀더를 원래 시간 포맷으로 복원"""
-        for placeholder, original in placeholders.items():
-            sql = sql.replace(placeholder, original)
-        return sql
+        """선행 EXEC SQL 제거"""
+        text = sql.lstrip()
+        head = text[:9].upper()
+        # 일반적인 'EXEC SQL ' 형태는 정규식 없이 처리
+        if head == 'EXEC SQL ':
+            return text[9:].lstrip()
+        if not head.startswith('EXEC'):
+            return sql
+        match = _EXEC_SQL_RE.match(text)
+        return text[match.end():] if match else sql
     
     def _convert_host_variables(self, sql: str, input_vars: List[str]) -> str:
-        """호스트 변수를 MyBatis 형식으로 변환"""
-        result = sql
-        
-        # 입력 변수 변환
-        for var in input_vars:
-            var_name = self._strip_colon(var)
-            # 인디케이터 처리 (:var:ind → var만 사용)
-            if ':' in var_name:
-                var_name = var_name.split(':')[0]
-            
-            # 배열 인덱스 처리 (:arr[i] → arr)
-            if '[' in var_name:
-                var_name = var_name.split('[')[0]
-            
-            # 구조체 필드 처리 (:struct.field → struct_field)
-            var_name = var_name.replace('.', '_')
-            
-            mybatis_var = self.input_formatter(var_name)
-            
-            # 원본 변수 패턴 매칭 및 치환
-            pattern = re.escape(var)
-            result = re.sub(pattern, mybatis_var, result)
-        
-        # 남은 호스트 변수도 변환 (명시적 목록에 없는 경우)
-        remaining_pattern = r':(\w+(?:\.\w+)?(?:\[\w+\])?(?::\w+)?)'
+        """
+        호스트 변수를 MyBatis 형식으로 변환
         
-        def replace_remaining(match):
-            full_var = match.group(1)
-            var_name = full_var
-            # 인디케이터 제거
-            if ':' in var_name:
-                var_name = var_name.split(':')[0]
-            # 배열 인덱스 제거
-            if '[' in var_name:
-                var_name = var_name.split('[')[0]
-            # 구조체 필드 처리
-            var_name = var_name.replace('.', '_')
-            return self.input_formatter(var_name)
+        시간 포맷('HH24:MI:SS' 등)과 호스트 변수를 한 번의 스캔으로 찾아,
+        시간 포맷은 그대로 두고 호스트 변수만 치환합니다.
+        """
+        # 입력 변수: 원본 변수 → MyBatis 파라미터 매핑
+        mapping = {
+            var: self.input_formatter(_to_param_name(self._strip_colon(var)))
+            for var in input_vars if var
+        }
+        scanner = _compile_host_var_scanner(tuple(mapping))
         
-        result = re.sub(remaining_pattern, replace_remaining, result)
+        parts = []
+        pos = 0
+        for match in scanner.finditer(sql):
+            kind = match.lastgroup
+            if kind == 'tfmt':
+                continue
+            parts.append(sql[pos:match.start()])
+            if kind == 'known':
+                parts.append(mapping[match.group()])
+            else:
+                # 남은 호스트 변수 (명시적 목록에 없는 경우)
+                parts.append(self.input_formatter(_to_param_name(match.group('hv'))))
+            pos = match.end()
         
-        return result
+        if not parts:
+            return sql
+        parts.append(sql[pos:])
+        return ''.join(parts)
     
     def _strip_colon(self, var: str) -> str:
         """호스트 변수에서 선행 콜론 제거"""
@@ -323,10 +316,8 @@ class MyBatisConverter:
     
     def _cleanup_sql(self, sql: str) -> str:
         """SQL 정리 (공백, 세미콜론 등)"""
-        # 연속 공백 축소
-        sql = re.sub(r'\s+', ' ', sql)
-        # 앞뒤 공백 제거
-        sql = sql.strip()
+        # 연속 공백 축소 + 앞뒤 공백 제거 (split/join 한 번으로 처리)
+        sql = ' '.join(sql.split())
         # 끝의 세미콜론 제거
         sql = sql.rstrip(';')
         return sql
@@ -53,7 +53,7 @@ class ArrayDMLRelationshipPlugin(SQLRelationshipPlugin):
             array_host_vars = self._extract_array_variables(el)
             
             # DML 유형 결정
-            dml_type = el.get('sql_type', 'UNKNOWN').upper()
+            dml_type = el.get('sql_type', 'UNKNOWN')
             if dml_type not in ['INSERT', 'UPDATE', 'DELETE']:
                 # 원시 콘텐츠에서 추출 시도
                 raw = el.get('raw_content', '').upper()
@@ -11,6 +11,12 @@ from typing import List, Dict, Optional
 from .base import SQLRelationshipPlugin
 
 
+# 커서 관계 추출용 정규식 (모듈 로드 시 1회 컴파일)
+_FROM_RE = re.compile(r'\bFROM\b', re.IGNORECASE)
+_DECLARE_CURSOR_RE = re.compile(r'DECLARE\s+(\w+)\s+CURSOR', re.IGNORECASE)
+_CURSOR_FOR_RE = re.compile(r'CURSOR\s+FOR\s+(.+)', re.IGNORECASE | re.DOTALL)
+
+
 class CursorRelationshipPlugin(SQLRelationshipPlugin):
     """
     Pro*C 코드에서 커서 관계를 감지하는 플러그인입니다.
@@ -24,15 +30,21 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
     
     def can_handle(self, sql_elements: List[Dict]) -> bool:
         """DECLARE CURSOR 문이 존재하는지 확인합니다."""
-        return any(self._is_declare_cursor(el) for el in sql_elements)
+        for el in sql_elements:
+            if (el.get('sql_type') == 'DECLARE' and
+                    'CURSOR' in el.get('normalized_sql', '').upper()):
+                return True
+        return False
     
     def extract_relationships(self, sql_elements: List[Dict], all_elements: List[Dict] = None) -> List[Dict]:
         """SQL 요소에서 커서 관계를 추출합니다."""
         relationships = []
         cursor_counter = {}
         
-        for declare_el in sql_elements:
-            if not self._is_declare_cursor(declare_el):
+        index = self._index_by_type(sql_elements)
+        
+        for sql_upper, declare_el in self._entries_after(index, 'DECLARE'):
+            if 'CURSOR' not in sql_upper:
                 continue
             
             cursor_name = self._extract_cursor_name(declare_el)
@@ -51,42 +63,44 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
             fetch_elements = []
             
             # OPEN 문 검색
-            open_el = self._find_statement(sql_elements, 'OPEN', cursor_name, after_line=declare_el['line_start'])
+            open_el = self._find_statement(index, 'OPEN', cursor_name, after_line=declare_el['line_start'])
             if open_el:
                 related_sql_ids.append(open_el['sql_id'])
             
             # FETCH 문 검색
-            fetch_els = self._find_all_statements(sql_elements, 'FETCH', cursor_name, after_line=declare_el['line_start'])
+            fetch_els = self._find_all_statements(index, 'FETCH', cursor_name, after_line=declare_el['line_start'])
+            all_output_vars = []
+            seen_output_vars = set()
             for fetch_el in fetch_els:
                 related_sql_ids.append(fetch_el['sql_id'])
                 fetch_elements.append(fetch_el)
+                # 출력 변수는 순서를 유지하면서 중복 제거
+                for var in fetch_el.get('output_host_vars', ()):
+                    if var not in seen_output_vars:
+                        seen_output_vars.add(var)
+                        all_output_vars.append(var)
             
             # CLOSE 문 검색
-            close_el = self._find_statement(sql_elements, 'CLOSE', cursor_name, after_line=declare_el['line_start'])
+            close_el = self._find_statement(index, 'CLOSE', cursor_name, after_line=declare_el['line_start'])
             if close_el:
                 related_sql_ids.append(close_el['sql_id'])
             
             cursor_query = self._extract_cursor_query(declare_el)
             
-            all_input_vars = list(declare_el.get('input_host_vars', []))
-            all_output_vars = []
-            for fetch_el in fetch_elements:
-                all_output_vars.extend(fetch_el.get('output_host_vars', []))
-            
-            all_input_vars = list(dict.fromkeys(all_input_vars))
-            all_output_vars = list(dict.fromkeys(all_output_vars))
+            all_input_vars = list(dict.fromkeys(declare_el.get('input_host_vars', [])))
             
             is_loop_based = len(fetch_elements) > 1 or self._is_likely_in_loop(fetch_elements)
             
             # 병합된 SQL 생성
             merged_sql = cursor_query
             if all_output_vars:
-                into_clause = "INTO " + ", ".join([f":{v}" for v in all_output_vars])
-                from_match = re.search(r'\bFROM\b', merged_sql, re.IGNORECASE)
+                into_clause = "INTO :" + ", :".join(all_output_vars)
+                from_match = _FROM_RE.search(merged_sql)
                 if from_match:
-                    merged_sql = merged_sql[:from_match.start()] + into_clause + " " + merged_sql[from_match.start():]
+                    pos = from_match.start()
+                    merged_sql = f"{merged_sql[:pos]}{into_clause} {merged_sql[pos:]}"
                 else:
-                    merged_sql = merged_sql + " " + into_clause
+                    merged_sql = f"{merged_sql} {into_clause}"
 
             metadata = {
                 'cursor_name': cursor_name,
@@ -107,43 +121,35 @@ class CursorRelationshipPlugin(SQLRelationshipPlugin):
         
         return relationships
     
-    def _is_declare_cursor(self, element: Dict) -> bool:
-        """Check if element is a DECLARE CURSOR statement."""
-        return (element.get('sql_type', '').upper() == 'DECLARE' and 
-                'CURSOR' in element.get('normalized_sql', '').upper())
-    
     def _extract_cursor_name(self, element: Dict) -> Optional[str]:
         """Extract cursor name from DECLARE statement."""
         normalized = element.get('normalized_sql', '')
-        match = re.search(r'DECLARE\s+(\w+)\s+CURSOR', normalized, re.IGNORECASE)
+        match = _DECLARE_CURSOR_RE.search(normalized)
         return match.group(1) if match else None
     
     def _extract_cursor_query(self, declare_el: Dict) -> str:
         """Extract the SELECT query from DECLARE CURSOR statement."""
         sql = declare_el.get('normalized_sql', '')
-        match = re.search(r'CURSOR\s+FOR\s+(.+)', sql, re.IGNORECASE | re.DOTALL)
+        match = _CURSOR_FOR_RE.search(sql)
         return match.group(1).strip() if match else ''
     
-    def _find_statement(self, sql_elements: List[Dict], stmt_type: str, 
+    def _find_statement(self, index: Dict, stmt_type: str, 
                        cursor_name: str, after_line: int) -> Optional[Dict]:
         """Find a specific cursor-related statement (OPEN/CLOSE)."""
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                cursor_name in el.get('normalized_sql', '')):
+        name = cursor_name.upper()
+        for sql_upper, el in self._entries_after(index, stmt_type, after_line):
+            if name in sql_upper:
                 return el
         return None
     
-    def _find_all_statements(self, sql_elements: List[Dict], stmt_type: str,
+    def _find_all_statements(self, index: Dict, stmt_type: str,
                             cursor_name: str, after_line: int) -> List[Dict]:
         """Find all statements of a type referencing the cursor."""
-        results = []
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                cursor_name in el.get('normalized_sql', '')):
-                results.append(el)
-        return results
+        name = cursor_name.upper()
+        return [
+            el for sql_upper, el in self._entries_after(index, stmt_type, after_line)
+            if name in sql_upper
+        ]
     
     def _is_likely_in_loop(self, fetch_elements: List[Dict]) -> bool:
         """FETCH가 루프 내에 있을 가능성이 있는지 확인하는 휴리스틱."""
@@ -8,12 +8,22 @@ C 문자열 조작 함수 추적은 DynamicSQLExtractor에 위임합니다.
 """
 
 import re
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from typing import List, Dict, Optional, Tuple
 
 from .base import SQLRelationshipPlugin
 from ..dynamic_sql_extractor import DynamicSQLExtractor
 
 
+# 동적 SQL 관계 추출용 정규식 (모듈 로드 시 1회 컴파일)
+_PREPARE_NAME_RE = re.compile(r'PREPARE\s+(\w+)\s+FROM', re.IGNORECASE)
+_PREPARE_FROM_RE = re.compile(r'FROM\s+(.+)', re.IGNORECASE)
+_LITERAL_FROM_RE = re.compile(r'FROM\s+([\'"])(.*?)\1', re.IGNORECASE | re.DOTALL)
+_WS_RE = re.compile(r'\s+')
+# EXECUTE/DEALLOCATE 문이 참조하는 statement 이름 (대문자 SQL 대상)
+_STMT_REF_RE = re.compile(r'\b(?:EXECUTE|DEALLOCATE)\s+(?:PREPARE\s+)?(\w+)')
+
+
 class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
     """
     Pro*C 코드에서 동적 SQL 관계를 감지하는 플러그인입니다.
@@ -32,17 +42,20 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
 
     def can_handle(self, sql_elements: List[Dict]) -> bool:
         """PREPARE 문이 존재하는지 확인합니다."""
-        return any(el.get('sql_type', '').upper() == 'PREPARE' for el in sql_elements)
+        for el in sql_elements:
+            if el.get('sql_type') == 'PREPARE':
+                return True
+        return False
     
     def extract_relationships(self, sql_elements: List[Dict], all_elements: List[Dict] = None) -> List[Dict]:
         """동적 SQL 관계를 추출합니다."""
         relationships = []
         stmt_counter = {}
         
-        for prepare_el in sql_elements:
-            if prepare_el.get('sql_type', '').upper() != 'PREPARE':
-                continue
-            
+        index = self._index_by_type(sql_elements)
+        refs = self._index_by_statement_name(index, ('EXECUTE', 'DEALLOCATE'))
+        
+        for _, prepare_el in self._entries_after(index, 'PREPARE'):
             stmt_name = self._extract_statement_name(prepare_el)
             if not stmt_name:
                 continue
@@ -59,14 +72,21 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
             execute_elements = []
             
             execute_els = self._find_all_statements(
-                sql_elements, 'EXECUTE', stmt_name, after_line=prepare_el['line_start']
+                refs, 'EXECUTE', stmt_name, after_line=prepare_el['line_start']
             )
+            # EXECUTE 문의 모든 파라미터 집계 (순서를 유지하면서 중복 제거)
+            all_parameters = []
+            seen_parameters = set()
             for exec_el in execute_els:
                 related_sql_ids.append(exec_el['sql_id'])
                 execute_elements.append(exec_el)
+                for param in exec_el.get('input_host_vars', ()):
+                    if param not in seen_parameters:
+                        seen_parameters.add(param)
+                        all_parameters.append(param)
             
             deallocate_el = self._find_statement(
-                sql_elements, 'DEALLOCATE', stmt_name, after_line=prepare_el['line_start']
+                refs, 'DEALLOCATE', stmt_name, after_line=prepare_el['line_start']
             )
             if deallocate_el:
                 related_sql_ids.append(deallocate_el['sql_id'])
@@ -74,12 +94,6 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
             sql_source = self._extract_sql_source(prepare_el)
             is_literal = not sql_source.startswith(':')
             
-            all_parameters = []
-            for exec_el in execute_elements:
-                params = exec_el.get('input_host_vars', [])
-                all_parameters.extend(params)
-            all_parameters = list(dict.fromkeys(all_parameters))
-            
             metadata = {
                 'statement_name': stmt_name,
                 'sql_source': sql_source,
@@ -126,13 +140,13 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
     def _extract_statement_name(self, prepare_el: Dict) -> Optional[str]:
         """Extract statement name from PREPARE statement."""
         sql = prepare_el.get('normalized_sql', '')
-        match = re.search(r'PREPARE\s+(\w+)\s+FROM', sql, re.IGNORECASE)
+        match = _PREPARE_NAME_RE.search(sql)
         return match.group(1) if match else None
     
     def _extract_sql_source(self, prepare_el: Dict) -> str:
         """Extract the SQL source (host var or literal) from PREPARE."""
         sql = prepare_el.get('normalized_sql', '')
-        match = re.search(r'FROM\s+(.+)', sql, re.IGNORECASE)
+        match = _PREPARE_FROM_RE.search(sql)
         if match:
             source = match.group(1).strip()
             return source.rstrip(';').strip()
@@ -141,29 +155,43 @@ class DynamicSQLRelationshipPlugin(SQLRelationshipPlugin):
     def _extract_literal_sql(self, prepare_el: Dict) -> str:
         """Extract literal SQL string if source is a literal."""
         raw = prepare_el.get('raw_content', '')
-        match = re.search(r'FROM\s+([\'"])(.*?)\1', raw, re.IGNORECASE | re.DOTALL)
+        match = _LITERAL_FROM_RE.search(raw)
         if match:
             sql = match.group(2)
-            return re.sub(r'\s+', ' ', sql).strip()
+            return _WS_RE.sub(' ', sql).strip()
         return ''
     
-    def _find_statement(self, sql_elements: List[Dict], stmt_type: str,
+    def _index_by_statement_name(self, index: Dict, stmt_types: Tuple[str, ...]) -> Dict[Tuple[str, str], Tuple[List[int], List[Dict]]]:
+        """
+        stmt_types 요소를 (sql_type, 참조 statement 이름) 별로 묶습니다.
+        
+        index 묶음이 이미 라인 순이므로 각 묶음도 라인 순으로 유지됩니다.
+        
+        Returns:
+            {(sql_type, 대문자 statement 이름): (line_start 목록, 요소 목록)}
+        """
+        refs = {}
+        for stmt_type in stmt_types:
+            for sql_upper, el in self._entries_after(index, stmt_type):
+                match = _STMT_REF_RE.search(sql_upper)
+                if not match:
+                    continue
+                lines, elements = refs.setdefault((stmt_type, match.group(1)), ([], []))
+                lines.append(el.get('line_start', 0))
+                elements.append(el)
+        return refs
+    
+    def _find_statement(self, refs: Dict, stmt_type: str,
                        stmt_name: str, after_line: int) -> Optional[Dict]:
         """Find a specific statement referencing the prepared statement."""
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                stmt_name in el.get('normalized_sql', '')):
-                return el
-        return None
+        statements = self._find_all_statements(refs, stmt_type, stmt_name, after_line)
+        return statements[0] if statements else None
     
-    def _find_all_statements(self, sql_elements: List[Dict], stmt_type: str,
+    def _find_all_statements(self, refs: Dict, stmt_type: str,
                             stmt_name: str, after_line: int) -> List[Dict]:
         """Find all statements of a type referencing the prepared statement."""
-        results = []
-        for el in sql_elements:
-            if (el.get('sql_type', '').upper() == stmt_type.upper() and
-                el.get('line_start', 0) > after_line and
-                stmt_name in el.get('normalized_sql', '')):
-                results.append(el)
-        return results
+        bucket = refs.get((stmt_type, stmt_name.upper()))
+        if bucket is None:
+            return []
+        lines, elements = bucket
+        return elements[bisect_right(lines, after_line):]
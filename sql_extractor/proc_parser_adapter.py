@@ -15,6 +15,12 @@ from .types import ExtractedSQL
 
 logger = logging.getLogger(__name__)
 
+# SQL 정규화용 정규식 (모듈 로드 시 1회 컴파일)
+_EXEC_SQL_RE = re.compile(r'^\s*EXEC\s+SQL\s+', re.IGNORECASE)
+_FOR_ARRAY_RE = re.compile(r'^\s*FOR\s+:?\w+(?:\[[^\]]+\])?\s+', re.IGNORECASE)
+_INTO_FROM_RE = re.compile(r'\bINTO\s+[^;]+?\s+FROM\b', re.IGNORECASE | re.DOTALL)
+_INTO_TAIL_RE = re.compile(r'\bINTO\s+[^;]+', re.IGNORECASE)
+
 
 class ProcParserSQLAdapter:
     """
@@ -195,37 +201,25 @@ class ProcParserSQLAdapter:
         """
         sql = raw_sql.strip()
         
-        # EXEC SQL 제거
-        sql = re.sub(r'^\s*EXEC\s+SQL\s+', '', sql, flags=re.IGNORECASE)
+        # EXEC SQL 제거 (EXEC로 시작할 때만 정규식 실행)
+        if sql[:4].upper() == 'EXEC':
+            sql = _EXEC_SQL_RE.sub('', sql)
         
         # FOR :array_size 절 제거 (Array DML)
-        sql = re.sub(r'^\s*FOR\s+:?\w+(?:\[[^\]]+\])?\s+', '', sql, flags=re.IGNORECASE)
+        if sql[:3].upper() == 'FOR':
+            sql = _FOR_ARRAY_RE.sub('', sql)
         
         # INTO 절 제거 (SELECT, FETCH)
-        if sql_type and sql_type.lower() in ['select', 'fetch', 'fetch_into']:
+        sql_type_lower = sql_type.lower() if sql_type else ''
+        if sql_type_lower in ('select', 'fetch', 'fetch_into') and 'INTO' in sql.upper():
             # INTO ... FROM 패턴
-            sql = re.sub(
-                r'\bINTO\s+[^;]+?\s+FROM\b',
-                'FROM',
-                sql,
-                flags=re.IGNORECASE | re.DOTALL
-            )
+            sql = _INTO_FROM_RE.sub('FROM', sql)
             # FETCH cursor INTO ... 에서 INTO 이후 제거
-            if sql_type.lower() in ['fetch', 'fetch_into']:
-                sql = re.sub(
-                    r'\bINTO\s+[^;]+',
-                    '',
-                    sql,
-                    flags=re.IGNORECASE
-                )
-        
-        # 세미콜론 제거
-        sql = sql.rstrip(';').strip()
-        
-        # 공백 정규화
-        sql = re.sub(r'\s+', ' ', sql)
+            if sql_type_lower != 'select':
+                sql = _INTO_TAIL_RE.sub('', sql)
         
-        return sql
+        # 세미콜론 제거 후 공백 정규화
+        return ' '.join(sql.rstrip(';').split())
 
 
 def get_proc_parser_adapter(config: SQLExtractorConfig = None) -> ProcParserSQLAdapter:
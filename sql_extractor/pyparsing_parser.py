@@ -9,6 +9,7 @@ pyparsing이 없는 환경에서는 정규식 기반 fallback을 사용합니다
 
 import re
 import logging
+import sys
 from typing import Dict, List, Optional, Any, Set
 
 from .types import SqlType, HostVariable, HostVariableType, VariableDirection
@@ -71,8 +72,8 @@ class PyparsingProCParser:
             r':([\w$#@]+)(?:\[[\w\d]+\])?(?:\.[\w$#@]+)?(?::[\w$#@]+)?'
         )
         
-        # 호스트 변수 블랙리스트 (config에서 가져옴)
-        self._host_var_blacklist: Set[str] = self.config.get_combined_blacklist()
+        # 호스트 변수 블랙리스트 (config에서 가져옴, add/remove를 위해 가변 복사본 사용)
+        self._host_var_blacklist: Set[str] = set(self.config.get_combined_blacklist())
         
         # 문자열 리터럴 패턴 (시간 포맷 등을 찾기 위함)
         self.string_literal_pattern = re.compile(r"'[^']*'")
@@ -579,7 +580,7 @@ class PyparsingProCParser:
         Example:
             parser.add_to_blacklist({'MY_CONSTANT', 'ANOTHER_KEYWORD'})
         """
-        self._host_var_blacklist.update(kw.upper() for kw in keywords)
+        self._host_var_blacklist.update(sys.intern(kw.upper()) for kw in keywords)
     
     def remove_from_blacklist(self, keywords: set) -> None:
         """블랙리스트에서 키워드 제거
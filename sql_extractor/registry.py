@@ -4,7 +4,8 @@
 SQL 타입 및 호스트 변수 규칙을 등록하고 관리합니다.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import re
 import logging
 
 from .rules.base import SQLTypeRule, HostVariableRule, RuleMatch
@@ -13,6 +14,18 @@ from .rules.host_variable_rules import DEFAULT_HOST_VARIABLE_RULES
 
 logger = logging.getLogger(__name__)
 
+# INTO 절 (SELECT/FETCH의 출력 변수 구간)
+_INTO_CLAUSE_RE = re.compile(r'\bINTO\b([\s\S]*?)(?:\bFROM\b|\bWHERE\b|;|$)', re.IGNORECASE)
+
+# SQL 텍스트별 호스트 변수 추출 결과 캐시 크기
+_HOST_VAR_CACHE_SIZE = 1024
+
+# EXEC SQL 시작 위치와 그 다음 첫 키워드 (사이의 블록 주석은 건너뜀)
+_EXEC_SQL_RE = re.compile(r'EXEC\s+SQL', re.IGNORECASE)
+_LEADING_KEYWORD_RE = re.compile(
+    r'EXEC\s+SQL\s+(?:/\*.*?\*/\s*)*(\w+)', re.IGNORECASE | re.DOTALL
+)
+
 
 class SQLTypeRegistry:
     """SQL 타입 규칙 레지스트리
@@ -36,6 +49,9 @@ class SQLTypeRegistry:
     
     def __init__(self):
         self._rules: List[SQLTypeRule] = []
+        # 첫 키워드별 검사 대상 규칙 (우선순위 순), 키워드 무관 규칙
+        self._rules_by_keyword: Dict[str, List[SQLTypeRule]] = {}
+        self._generic_rules: List[SQLTypeRule] = []
     
     def register(self, rule: SQLTypeRule) -> None:
         """규칙 등록
@@ -63,6 +79,42 @@ class SQLTypeRegistry:
     def _sort_rules(self) -> None:
         """우선순위로 규칙 정렬 (높은 것 먼저)"""
         self._rules.sort(key=lambda r: r.priority, reverse=True)
+        self._build_keyword_index()
+    
+    def _build_keyword_index(self) -> None:
+        """첫 키워드별 규칙 목록 생성
+        
+        leading_keywords가 없는 규칙은 모든 키워드 목록에 포함됩니다.
+        """
+        keywords = set()
+        for rule in self._rules:
+            if rule.leading_keywords:
+                keywords.update(rule.leading_keywords)
+        
+        self._generic_rules = [r for r in self._rules if r.leading_keywords is None]
+        self._rules_by_keyword = {
+            keyword: [
+                r for r in self._rules
+                if r.leading_keywords is None or keyword in r.leading_keywords
+            ]
+            for keyword in keywords
+        }
+    
+    def _candidate_rules(self, sql_text: str) -> List[SQLTypeRule]:
+        """SQL 텍스트에 대해 검사할 규칙 목록 (우선순위 순)"""
+        exec_match = _EXEC_SQL_RE.search(sql_text)
+        if exec_match is None:
+            return self._generic_rules
+        # EXEC SQL이 여러 번 나오면 첫 키워드만으로 판단할 수 없으므로 전체 검사
+        if _EXEC_SQL_RE.search(sql_text, exec_match.end()):
+            return self._rules
+        
+        keyword_match = _LEADING_KEYWORD_RE.match(sql_text, exec_match.start())
+        if keyword_match is None:
+            return self._generic_rules
+        return self._rules_by_keyword.get(
+            keyword_match.group(1).upper(), self._generic_rules
+        )
     
     def load_defaults(self) -> None:
         """기본 규칙 로드"""
@@ -78,12 +130,14 @@ class SQLTypeRegistry:
     def clear(self) -> None:
         """모든 규칙 제거"""
         self._rules.clear()
+        self._build_keyword_index()
     
     def determine_type(self, sql_text: str) -> RuleMatch:
         """SQL 타입 결정
         
         등록된 규칙을 우선순위 순서로 적용하여
         첫 번째 매칭되는 규칙의 값을 반환합니다.
+        EXEC SQL 다음 첫 키워드로 leading_keywords가 맞지 않는 규칙은 건너뜁니다.
         
         Args:
             sql_text: EXEC SQL 구문 전체 텍스트
@@ -91,7 +145,7 @@ class SQLTypeRegistry:
         Returns:
             RuleMatch: 매칭 결과 (매칭 없으면 value="unknown")
         """
-        for rule in self._rules:
+        for rule in self._candidate_rules(sql_text):
             try:
                 result = rule.match(sql_text)
                 if result.matched:
@@ -156,6 +210,9 @@ class HostVariableRegistry:
         # pyparsing 파서 (지연 초기화)
         self._pyparsing_parser = None
         self._use_pyparsing: Optional[bool] = None
+        
+        # SQL 텍스트 -> 추출된 호스트 변수 (같은 SQL이 반복되는 생성 코드용)
+        self._extract_cache: Dict[str, Tuple[Dict[str, Any], ...]] = {}
     
     def _init_parser(self) -> None:
         """파서 초기화 (지연 로딩)"""
@@ -204,6 +261,7 @@ class HostVariableRegistry:
             rule: 등록할 규칙
         """
         self._rules.append(rule)
+        self._extract_cache.clear()
         logger.debug(f"Registered host variable rule: {rule.name}")
     
     def register_many(self, rules: List[HostVariableRule]) -> None:
@@ -214,6 +272,7 @@ class HostVariableRegistry:
         """
         for rule in rules:
             self._rules.append(rule)
+        self._extract_cache.clear()
         logger.debug(f"Registered {len(rules)} host variable rules")
     
     def load_defaults(self) -> None:
@@ -224,6 +283,7 @@ class HostVariableRegistry:
     def clear(self) -> None:
         """모든 규칙 제거"""
         self._rules.clear()
+        self._extract_cache.clear()
     
     def extract_all(self, sql_text: str) -> List[Dict[str, Any]]:
         """SQL에서 모든 호스트 변수 추출
@@ -235,16 +295,29 @@ class HostVariableRegistry:
             sql_text: SQL 텍스트
         
         Returns:
-            호스트 변수 정보 딕셔너리 목록
+            호스트 변수 정보 딕셔너리 목록 (같은 SQL 텍스트는 캐시된 딕셔너리를 공유)
         """
+        return list(self._extract_cached(sql_text))
+    
+    def _extract_cached(self, sql_text: str) -> Tuple[Dict[str, Any], ...]:
+        """SQL 텍스트별 호스트 변수 추출 (캐시)"""
+        variables = self._extract_cache.get(sql_text)
+        if variables is not None:
+            return variables
+        
         self._init_parser()
         
         # pyparsing 모드
         if self._use_pyparsing and self._pyparsing_parser:
-            return self._extract_with_pyparsing(sql_text)
-        
+            variables = tuple(self._extract_with_pyparsing(sql_text))
         # regex 모드
-        return self._extract_with_regex(sql_text)
+        else:
+            variables = tuple(self._extract_with_regex(sql_text))
+        
+        if len(self._extract_cache) >= _HOST_VAR_CACHE_SIZE:
+            del self._extract_cache[next(iter(self._extract_cache))]
+        self._extract_cache[sql_text] = variables
+        return variables
     
     def _extract_with_pyparsing(self, sql_text: str) -> List[Dict[str, Any]]:
         """pyparsing 기반 호스트 변수 추출"""
@@ -330,15 +403,30 @@ class HostVariableRegistry:
         Returns:
             (input_vars, output_vars) 튜플
         """
-        all_vars = self.extract_all(sql_text)
+        _, input_vars, output_vars = self.extract_and_classify(sql_text, sql_type)
+        return input_vars, output_vars
+    
+    def extract_and_classify(
+        self,
+        sql_text: str,
+        sql_type: str
+    ) -> tuple[List[Dict], List[Dict], List[Dict]]:
+        """호스트 변수 추출과 입력/출력 분류를 한 번에 수행
+        
+        extract_all()과 classify_by_direction()을 모두 필요로 하는 호출자용입니다.
+        
+        Args:
+            sql_text: SQL 텍스트
+            sql_type: SQL 타입 (select, fetch_into 등)
+        
+        Returns:
+            (all_vars, input_vars, output_vars) 튜플
+        """
+        all_vars = list(self._extract_cached(sql_text))
         
         # SELECT나 FETCH의 INTO 절 변수는 OUTPUT
         if sql_type in ('select', 'fetch_into'):
-            into_match = re.search(
-                r'\bINTO\b([\s\S]*?)(?:\bFROM\b|\bWHERE\b|;|$)', 
-                sql_text, 
-                re.IGNORECASE
-            )
+            into_match = _INTO_CLAUSE_RE.search(sql_text)
             
             if into_match:
                 into_start = into_match.start(1)
@@ -353,16 +441,12 @@ class HostVariableRegistry:
                     else:
                         input_vars.append(var)
                 
-                return input_vars, output_vars
+                return all_vars, input_vars, output_vars
         
         # 그 외 모든 변수는 INPUT
-        return all_vars, []
+        return all_vars, list(all_vars), []
     
     @property
     def rule_count(self) -> int:
         """등록된 규칙 수"""
         return len(self._rules)
-
-
-# re import for classify_by_direction
-import re
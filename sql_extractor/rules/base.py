@@ -5,7 +5,7 @@ SQL 타입 결정 및 호스트 변수 추출 규칙의 기본 인터페이스
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet
 from dataclasses import dataclass, field
 import re
 
@@ -33,7 +33,8 @@ class SQLTypeRule(ABC):
     1. 이 클래스를 상속
     2. name, priority, pattern 속성 정의
     3. match() 메서드 구현 (선택적, 기본은 pattern 매칭)
-    4. SQLTypeRegistry에 등록
+    4. leading_keywords 지정 (선택적, EXEC SQL 다음 첫 키워드가 이 중 하나일 때만 검사)
+    5. SQLTypeRegistry에 등록
     
     Example:
         class MergeRule(SQLTypeRule):
@@ -44,6 +45,9 @@ class SQLTypeRule(ABC):
         registry.register(MergeRule())
     """
     
+    # EXEC SQL 바로 다음 키워드(대문자) 집합. None이면 모든 구문에 대해 검사
+    leading_keywords: Optional[FrozenSet[str]] = None
+    
     @property
     @abstractmethod
     def name(self) -> str:
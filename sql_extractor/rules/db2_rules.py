@@ -15,6 +15,8 @@ class SelectWithURRule(SQLTypeRule):
     DB2에서 잠금 없이 데이터를 읽는 격리 수준입니다.
     """
     
+    leading_keywords = frozenset({'SELECT'})
+    
     @property
     def name(self) -> str:
         return "select"
@@ -46,6 +48,8 @@ class SelectWithCSRule(SQLTypeRule):
     DB2의 기본 격리 수준입니다.
     """
     
+    leading_keywords = frozenset({'SELECT'})
+    
     @property
     def name(self) -> str:
         return "select"
@@ -74,6 +78,8 @@ class SelectWithCSRule(SQLTypeRule):
 class SelectWithRSRule(SQLTypeRule):
     """SELECT ... WITH RS 규칙 (Read Stability)"""
     
+    leading_keywords = frozenset({'SELECT'})
+    
     @property
     def name(self) -> str:
         return "select"
@@ -102,6 +108,8 @@ class SelectWithRSRule(SQLTypeRule):
 class SelectWithRRRule(SQLTypeRule):
     """SELECT ... WITH RR 규칙 (Repeatable Read)"""
     
+    leading_keywords = frozenset({'SELECT'})
+    
     @property
     def name(self) -> str:
         return "select"
@@ -133,6 +141,8 @@ class FetchFirstRule(SQLTypeRule):
     결과 행 수를 제한하는 DB2 구문입니다.
     """
     
+    leading_keywords = frozenset({'SELECT'})
+    
     @property
     def name(self) -> str:
         return "select"
@@ -168,6 +178,8 @@ class OptimizeForRule(SQLTypeRule):
     쿼리 최적화 힌트입니다.
     """
     
+    leading_keywords = frozenset({'SELECT'})
+    
     @property
     def name(self) -> str:
         return "select"
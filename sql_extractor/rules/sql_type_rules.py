@@ -12,6 +12,8 @@ from .base import SQLTypeRule, RuleMatch
 class IncludeRule(SQLTypeRule):
     """EXEC SQL INCLUDE 규칙"""
     
+    leading_keywords = frozenset({'INCLUDE'})
+    
     @property
     def name(self) -> str:
         return "include"
@@ -28,6 +30,8 @@ class IncludeRule(SQLTypeRule):
 class DeclareSectionBeginRule(SQLTypeRule):
     """BEGIN DECLARE SECTION 규칙"""
     
+    leading_keywords = frozenset({'BEGIN'})
+    
     @property
     def name(self) -> str:
         return "declare_section_begin"
@@ -47,6 +51,8 @@ class DeclareSectionBeginRule(SQLTypeRule):
 class DeclareSectionEndRule(SQLTypeRule):
     """END DECLARE SECTION 규칙"""
     
+    leading_keywords = frozenset({'END'})
+    
     @property
     def name(self) -> str:
         return "declare_section_end"
@@ -66,6 +72,8 @@ class DeclareSectionEndRule(SQLTypeRule):
 class DeclareCursorRule(SQLTypeRule):
     """DECLARE CURSOR 규칙"""
     
+    leading_keywords = frozenset({'DECLARE'})
+    
     @property
     def name(self) -> str:
         return "declare_cursor"
@@ -85,6 +93,8 @@ class DeclareCursorRule(SQLTypeRule):
 class OpenCursorRule(SQLTypeRule):
     """OPEN CURSOR 규칙"""
     
+    leading_keywords = frozenset({'OPEN'})
+    
     @property
     def name(self) -> str:
         return "open"
@@ -101,6 +111,8 @@ class OpenCursorRule(SQLTypeRule):
 class CloseCursorRule(SQLTypeRule):
     """CLOSE CURSOR 규칙"""
     
+    leading_keywords = frozenset({'CLOSE'})
+    
     @property
     def name(self) -> str:
         return "close"
@@ -117,6 +129,8 @@ class CloseCursorRule(SQLTypeRule):
 class FetchIntoRule(SQLTypeRule):
     """FETCH INTO 규칙"""
     
+    leading_keywords = frozenset({'FETCH'})
+    
     @property
     def name(self) -> str:
         return "fetch_into"
@@ -136,6 +150,8 @@ class FetchIntoRule(SQLTypeRule):
 class SelectRule(SQLTypeRule):
     """SELECT 규칙"""
     
+    leading_keywords = frozenset({'SELECT'})
+    
     @property
     def name(self) -> str:
         return "select"
@@ -156,6 +172,8 @@ class SelectRule(SQLTypeRule):
 class InsertRule(SQLTypeRule):
     """INSERT 규칙"""
     
+    leading_keywords = frozenset({'INSERT'})
+    
     @property
     def name(self) -> str:
         return "insert"
@@ -172,6 +190,8 @@ class InsertRule(SQLTypeRule):
 class UpdateRule(SQLTypeRule):
     """UPDATE 규칙"""
     
+    leading_keywords = frozenset({'UPDATE'})
+    
     @property
     def name(self) -> str:
         return "update"
@@ -188,6 +208,8 @@ class UpdateRule(SQLTypeRule):
 class DeleteRule(SQLTypeRule):
     """DELETE 규칙"""
     
+    leading_keywords = frozenset({'DELETE'})
+    
     @property
     def name(self) -> str:
         return "delete"
@@ -204,6 +226,8 @@ class DeleteRule(SQLTypeRule):
 class CommitRule(SQLTypeRule):
     """COMMIT 규칙"""
     
+    leading_keywords = frozenset({'COMMIT'})
+    
     @property
     def name(self) -> str:
         return "commit"
@@ -220,6 +244,8 @@ class CommitRule(SQLTypeRule):
 class RollbackRule(SQLTypeRule):
     """ROLLBACK 규칙"""
     
+    leading_keywords = frozenset({'ROLLBACK'})
+    
     @property
     def name(self) -> str:
         return "rollback"
@@ -236,6 +262,8 @@ class RollbackRule(SQLTypeRule):
 class PrepareRule(SQLTypeRule):
     """PREPARE 규칙 (동적 SQL)"""
     
+    leading_keywords = frozenset({'PREPARE'})
+    
     @property
     def name(self) -> str:
         return "prepare"
@@ -252,6 +280,8 @@ class PrepareRule(SQLTypeRule):
 class ExecuteRule(SQLTypeRule):
     """EXECUTE 규칙 (동적 SQL)"""
     
+    leading_keywords = frozenset({'EXECUTE'})
+    
     @property
     def name(self) -> str:
         return "execute"
@@ -268,6 +298,8 @@ class ExecuteRule(SQLTypeRule):
 class ConnectRule(SQLTypeRule):
     """CONNECT 규칙"""
     
+    leading_keywords = frozenset({'CONNECT'})
+    
     @property
     def name(self) -> str:
         return "connect"
@@ -284,6 +316,8 @@ class ConnectRule(SQLTypeRule):
 class WheneverRule(SQLTypeRule):
     """WHENEVER 규칙"""
     
+    leading_keywords = frozenset({'WHENEVER'})
+    
     @property
     def name(self) -> str:
         return "whenever"
@@ -300,6 +334,8 @@ class WheneverRule(SQLTypeRule):
 class DisconnectRule(SQLTypeRule):
     """DISCONNECT 규칙"""
     
+    leading_keywords = frozenset({'DISCONNECT'})
+    
     @property
     def name(self) -> str:
         return "disconnect"
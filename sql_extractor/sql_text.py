@@ -0,0 +1,69 @@
+"""
+SQL 텍스트 처리 헬퍼 모듈
+
+여러 변환기(MyBatisConverter, ColumnAliasMapper 등)가 공유하는
+정규식 없는 키워드 검색과 INTO 절 제거 함수를 제공합니다.
+"""
+
+import string
+
+
+# ASCII 문자만 대문자로 바꾸는 변환표 (문자열 길이 보존)
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+
+def find_keyword(text: str, word: str, start: int = 0) -> int:
+    """
+    대문자 text에서 start 이후 단어 경계로 둘러싸인 word의 위치를 찾음
+    
+    Returns:
+        위치 (없으면 -1)
+    """
+    length = len(word)
+    pos = text.find(word, start)
+    while pos >= 0:
+        before = text[pos - 1] if pos else ' '
+        after = text[pos + length] if pos + length < len(text) else ' '
+        if not (before.isalnum() or before == '_') and not (after.isalnum() or after == '_'):
+            return pos
+        pos = text.find(word, pos + 1)
+    return -1
+
+
+def remove_into_clause(sql: str) -> str:
+    """
+    SELECT ... INTO :vars ... FROM 구문에서 INTO 절 제거
+    
+    INTO 위치에서 앞으로 다음 FROM(FROM이 없는 SQL이면 WHERE)까지 잘라냅니다.
+    
+    Args:
+        sql: SQL 문자열
+    
+    Returns:
+        INTO 절이 제거된 SQL (INTO 절이 없으면 입력 문자열 그대로)
+    """
+    # 키워드는 대문자 사본에서 str.find로 찾고 원본과 같은 위치로 자름
+    upper = sql.upper()
+    if len(upper) != len(sql):
+        upper = sql.translate(_ASCII_UPPER)
+    
+    into = find_keyword(upper, 'INTO')
+    if into < 0:
+        return sql
+    end_word = 'FROM' if find_keyword(upper, 'FROM') >= 0 else 'WHERE'
+    
+    parts = []
+    pos = 0
+    while into >= 0:
+        next_pos = into + 4
+        if next_pos < len(upper) and upper[next_pos].isspace():
+            end = find_keyword(upper, end_word, next_pos)
+            if end >= 0:
+                parts.append(sql[pos:into])
+                pos = next_pos = end
+        into = find_keyword(upper, 'INTO', next_pos)
+    
+    if not parts:
+        return sql
+    parts.append(sql[pos:])
+    return ''.join(parts)
@@ -77,7 +77,7 @@ class ExtractedSQL:
     # === 기본 식별 정보 ===
     type: str = "sql"                      # 요소 타입 (항상 "sql")
     sql_id: str = ""                       # 고유 ID (sql_001, sql_002, ...)
-    sql_type: str = ""                     # SQL 타입 (SELECT, INSERT, FETCH, ...)
+    sql_type: str = ""                     # SQL 타입, 대문자 (SELECT, INSERT, FETCH, ...)
     
     # === 내용 ===
     raw_content: str = ""                  # 원본 Pro*C SQL 전체 (EXEC SQL ... ;)
@@ -6,7 +6,8 @@ SQL 관계 플러그인 인터페이스
 (예: 커서 작업, 동적 SQL, 트랜잭션)를 감지하고 추출합니다.
 """
 
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from typing import List, Dict, Optional, Tuple
 from abc import ABC, abstractmethod
 
 
@@ -68,3 +69,42 @@ class SQLRelationshipPlugin(ABC):
             포맷된 관계 ID (예: "cursor_emp_cursor_001")
         """
         return f"{relationship_type.lower()}_{identifier}_{counter:03d}"
+    
+    def _index_by_type(self, sql_elements: List[Dict]) -> Dict[str, Tuple[List[int], List[Tuple[str, Dict]]]]:
+        """
+        SQL 요소를 대문자 sql_type별로 묶고 각 묶음을 line_start 순으로 정렬합니다.
+        
+        extract_relationships 시작 시 한 번 생성하여 _entries_after 조회에 사용합니다.
+        sql_type은 추출 단계에서 이미 대문자로 저장되므로 그대로 키로 사용하고,
+        normalized_sql의 대문자 변환은 요소당 한 번만 수행합니다.
+        
+        Returns:
+            {sql_type: (line_start 목록, (대문자 normalized_sql, 요소) 목록)}
+        """
+        buckets = {}
+        for el in sql_elements:
+            buckets.setdefault(el.get('sql_type', ''), []).append(el)
+        
+        index = {}
+        for sql_type, elements in buckets.items():
+            elements.sort(key=lambda el: el.get('line_start', 0))
+            index[sql_type] = (
+                [el.get('line_start', 0) for el in elements],
+                [(el.get('normalized_sql', '').upper(), el) for el in elements],
+            )
+        return index
+    
+    def _entries_after(self, index: Dict[str, Tuple[List[int], List[Tuple[str, Dict]]]],
+                       sql_type: str, after_line: Optional[int] = None) -> List[Tuple[str, Dict]]:
+        """
+        index에서 sql_type 요소를 라인 순으로 반환합니다.
+        
+        after_line이 주어지면 그 이후에 시작하는 요소만 반환합니다.
+        """
+        bucket = index.get(sql_type)
+        if bucket is None:
+            return []
+        lines, entries = bucket
+        if after_line is None:
+            return entries
+        return entries[bisect_right(lines, after_line):]
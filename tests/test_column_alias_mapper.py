@@ -0,0 +1,230 @@
+"""
+column_alias_mapper 모듈 테스트
+
+SELECT/RETURNING 컬럼 alias 추가를 sqlglot 경로와 regex fallback 경로 모두에서 테스트합니다.
+"""
+
+import os
+import sys
+
+import pytest
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_extractor import column_alias_mapper
+from sql_extractor.column_alias_mapper import ColumnAliasMapper, snake_to_camel
+
+
+@pytest.fixture(params=[True, False], ids=["sqlglot", "regex"])
+def mapper(request, monkeypatch):
+    """sqlglot 사용 여부별 매퍼"""
+    if request.param and not column_alias_mapper.HAS_SQLGLOT:
+        pytest.skip("sqlglot 미설치")
+    monkeypatch.setattr(column_alias_mapper, "HAS_SQLGLOT", request.param)
+    return ColumnAliasMapper()
+
+
+class TestSnakeToCamel:
+    """snake_to_camel 포맷터 테스트"""
+
+    def test_basic(self):
+        assert snake_to_camel(":out_emp_name") == "outEmpName"
+        assert snake_to_camel("emp_name") == "empName"
+
+    def test_single_word(self):
+        assert snake_to_camel(":name") == "name"
+
+    def test_uppercase_and_repeated_underscores(self):
+        assert snake_to_camel(":H_USER_ID") == "hUserId"
+        assert snake_to_camel("a__b_") == "aB"
+        assert snake_to_camel("col_1st") == "col1st"
+
+
+class TestAddAliases:
+    """add_aliases 테스트"""
+
+    def test_simple_select(self, mapper):
+        result = mapper.add_aliases(
+            "SELECT emp_name, emp_age FROM employees",
+            [":out_name", ":out_age"]
+        )
+        assert result == "SELECT emp_name AS outName, emp_age AS outAge FROM employees"
+
+    def test_exec_sql_select_into(self, mapper):
+        result = mapper.add_aliases(
+            "EXEC SQL SELECT emp_name, emp_age INTO :out_name, :out_age FROM employees WHERE id = :id;",
+            [":out_name", ":out_age"]
+        )
+        assert result.startswith("SELECT emp_name AS outName, emp_age AS outAge FROM employees")
+        assert "INTO" not in result
+
+    def test_simple_select_keeps_formatting(self, mapper):
+        # 단순 SELECT는 sqlglot 재생성 없이 원본 형식을 유지
+        result = mapper.add_aliases("select a, b from t where c = 1", [":o_a", ":o_b"])
+        assert result == "select a AS oA, b AS oB from t where c = 1"
+
+    def test_into_list_with_f(self, mapper):
+        # INTO 변수명에 f가 있어도 INTO 절 이후 컬럼에 alias 적용
+        result = mapper.add_aliases("SELECT a, b INTO :buf, :out_fee FROM t", [":buf", ":out_fee"])
+        assert result.startswith("SELECT a AS buf, b AS outFee")
+        assert "a AS outF" in mapper.add_aliases("SELECT a INTO :out_f FROM t", [":out_f"])
+
+    @pytest.mark.parametrize("overwrite", [False, True])
+    def test_keyword_expression_columns(self, mapper, overwrite):
+        # CURRENT TIMESTAMP, PRIOR col은 alias가 붙은 컬럼이 아닌 하나의 식
+        mapper.overwrite_existing = overwrite
+        result = mapper.add_aliases(
+            "EXEC SQL SELECT CURRENT TIMESTAMP, emp_name INTO :h_ts, :h_name FROM sysibm.sysdummy1;",
+            [":h_ts", ":h_name"]
+        )
+        assert result.startswith("SELECT CURRENT TIMESTAMP AS hTs, emp_name AS hName FROM sysibm.sysdummy1")
+        result = mapper.add_aliases("SELECT CURRENT TIMESTAMP, nvl(a, 0) FROM t", [":ts", ":x"])
+        assert result.startswith("SELECT CURRENT TIMESTAMP AS ts, ")
+        result = mapper.add_aliases("SELECT PRIOR ename, b FROM t", [":x", ":y"])
+        assert result == "SELECT PRIOR ename AS x, b AS y FROM t"
+
+    def test_implicit_alias_kept(self, mapper):
+        # AS 없이 붙은 alias는 중복 alias를 붙이지 않음
+        assert mapper.add_aliases("SELECT a b, c FROM t", [":x", ":y"]) == "SELECT a b, c AS y FROM t"
+        result = mapper.add_aliases("SELECT DISTINCT a, b FROM t", [":x", ":y"])
+        assert result == "SELECT DISTINCT a AS x, b AS y FROM t"
+        result = mapper.add_aliases("SELECT CURRENT DATE d, b FROM t", [":x", ":y"])
+        assert result == "SELECT CURRENT DATE d, b AS y FROM t"
+
+    def test_implicit_alias_overwrite(self, mapper):
+        mapper.overwrite_existing = True
+        result = mapper.add_aliases("select a old_a, b from t", [":n_a", ":n_b"])
+        assert result == "select a nA, b AS nB from t"
+        result = mapper.add_aliases("SELECT CURRENT TIMESTAMP, PRIOR ename FROM t", [":ts", ":x"])
+        assert result == "SELECT CURRENT TIMESTAMP AS ts, PRIOR ename AS x FROM t"
+
+    def test_declare_cursor(self, mapper):
+        result = mapper.add_aliases(
+            "EXEC SQL DECLARE c1 CURSOR FOR SELECT a, b FROM t WHERE x = :x",
+            [":o_a", ":o_b"]
+        )
+        assert result == "DECLARE c1 CURSOR FOR SELECT a AS oA, b AS oB FROM t WHERE x = :x"
+
+    def test_nested_function_column(self, mapper):
+        result = mapper.add_aliases("SELECT nvl(a, 0), b FROM t", [":x_y", ":z"], "select")
+        assert "AS xY" in result
+        assert "b AS z" in result
+
+    def test_returning_clause(self, mapper):
+        result = mapper.add_aliases(
+            "INSERT INTO t (a) VALUES (1) RETURNING id, name INTO :o_id, :o_name",
+            [":o_id", ":o_name"]
+        )
+        assert result == "INSERT INTO t (a) VALUES (1) RETURNING id AS oId, name AS oName"
+
+    def test_returning_clause_keeps_semicolon(self, mapper):
+        result = mapper.add_aliases(
+            "UPDATE t SET a = 1 WHERE b = :b RETURNING id INTO :o_id;",
+            [":o_id"]
+        )
+        assert result == "UPDATE t SET a = 1 WHERE b = :b RETURNING id AS oId;"
+
+    def test_no_output_vars(self, mapper):
+        sql = "SELECT a FROM t"
+        assert mapper.add_aliases(sql, []) == sql
+
+    def test_non_aliasable_type(self, mapper):
+        sql = "DELETE FROM t WHERE a = :a"
+        assert mapper.add_aliases(sql, [":a"]) == sql
+
+    def test_unknown_type_without_select(self, mapper):
+        sql = "COMMIT WORK RELEASE"
+        assert mapper.add_aliases(sql, [":a"], "unknown") == sql
+
+    def test_result_cache(self, mapper):
+        sql = "SELECT a, b FROM t"
+        first = mapper.add_aliases(sql, [":o_a", ":o_b"])
+        assert mapper.add_aliases(sql, [":o_a", ":o_b"]) is first
+        # 포맷터가 바뀌면 캐시된 결과를 재사용하지 않음
+        mapper.alias_formatter = lambda v: v.lstrip(':').upper()
+        assert mapper.add_aliases(sql, [":o_a", ":o_b"]) == "SELECT a AS O_A, b AS O_B FROM t"
+
+
+class TestSqlglotAstCache:
+    """sqlglot AST 캐시 테스트"""
+
+    def test_simple_select_strips_semicolon(self):
+        if not column_alias_mapper.HAS_SQLGLOT:
+            pytest.skip("sqlglot 미설치")
+        # regex 단축 경로도 sqlglot 경로와 같이 끝 세미콜론 제거
+        mapper = ColumnAliasMapper()
+        result = mapper.add_aliases("EXEC SQL DECLARE c1 CURSOR FOR SELECT a, b FROM t;", [":o_a", ":o_b"])
+        assert result == "DECLARE c1 CURSOR FOR SELECT a AS oA, b AS oB FROM t"
+        result = mapper.add_aliases("SELECT a, nvl(b, 0) FROM t;", [":o_a", ":o_b"])
+        assert result == "SELECT a AS oA, nvl(b, 0) AS oB FROM t"
+
+    def test_ast_reused_between_add_and_extract(self):
+        if not column_alias_mapper.HAS_SQLGLOT:
+            pytest.skip("sqlglot 미설치")
+        mapper = ColumnAliasMapper()
+        sql = "SELECT nvl(a, 0), b FROM t"
+        mapper.extract_select_columns(sql)
+        assert len(mapper._ast_cache) == 1
+        first = mapper.add_aliases(sql, [":x", ":y"])
+        # 캐시된 AST는 변경되지 않아야 함 (복사본 사용)
+        assert mapper.extract_select_columns(sql) == ["COALESCE(a, 0)", "b"]
+        assert len(mapper._ast_cache) == 1
+        assert "AS x" in first
+
+    def test_alias_spliced_into_original_sql(self):
+        if not column_alias_mapper.HAS_SQLGLOT:
+            pytest.skip("sqlglot 미설치")
+        # 복잡한 SELECT도 원본 SQL 텍스트(함수명, 대소문자)를 유지한 채 alias만 삽입
+        mapper = ColumnAliasMapper(overwrite_existing=True)
+        result = mapper.add_aliases(
+            "select nvl(a, 0) old_a, 'x,y', b from t where (c = 1)",
+            [":n_a", ":n_c", ":n_b"]
+        )
+        assert result == "select nvl(a, 0) nA, 'x,y' AS nC, b AS nB from t where (c = 1)"
+
+
+class TestExtractSelectColumns:
+    """extract_select_columns 테스트"""
+
+    def test_simple(self, mapper):
+        assert mapper.extract_select_columns("SELECT a, b FROM t") == ["a", "b"]
+
+    def test_split_respects_parentheses(self, mapper):
+        columns = mapper.extract_select_columns("SELECT nvl(a, 0), b FROM t")
+        assert len(columns) == 2
+
+
+class TestDetectSqlType:
+    """_detect_sql_type 테스트"""
+
+    @pytest.mark.parametrize("sql,expected", [
+        ("SELECT a FROM t", "select"),
+        ("EXEC SQL SELECT a INTO :a FROM t", "select"),
+        ("EXEC SQL DECLARE c1 CURSOR FOR SELECT a FROM t", "declare_cursor"),
+        ("  insert into t values (1)", "insert"),
+        ("EXEC SQL UPDATE t SET a = 1", "update"),
+        ("DELETE FROM t", "delete"),
+        ("EXEC SQL FETCH c1 INTO :a", "fetch_into"),
+        ("EXEC SQL /* c */ DECLARE c1 CURSOR FOR SELECT a FROM t", "declare_cursor"),
+        ("EXEC SQL -- " + "x" * 80 + "\n SELECT a INTO :a FROM t", "select"),
+        ("/* c */ EXEC SQL /* d */ UPDATE t SET a = 1", "update"),
+        ("COMMIT", "unknown"),
+    ])
+    def test_detect(self, sql, expected):
+        assert ColumnAliasMapper()._detect_sql_type(sql) == expected
+
+
+class TestNeedsAlias:
+    """needs_alias 테스트"""
+
+    def test_needs_alias(self):
+        mapper = ColumnAliasMapper()
+        for sql_type in ("select", "declare_cursor", "fetch_into", "insert", "update", "delete"):
+            assert mapper.needs_alias(sql_type) is True
+        assert mapper.needs_alias("unknown") is False
+        assert mapper.needs_alias("commit") is False
+
+    def test_type_sets(self):
+        assert ColumnAliasMapper.ALIASABLE_TYPES == {"select", "declare_cursor", "fetch_into"}
+        assert ColumnAliasMapper.RETURNING_TYPES == {"insert", "update", "delete"}
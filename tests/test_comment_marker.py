@@ -0,0 +1,60 @@
+"""
+comment_marker 모듈 테스트
+"""
+
+import os
+import sys
+
+import pytest
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_extractor.comment_marker import (
+    SQLCommentMarker,
+    create_marker,
+    detailed_comment_formatter,
+)
+
+
+class TestSQLCommentMarker:
+    """SQLCommentMarker 테스트"""
+
+    def test_default(self):
+        assert SQLCommentMarker().mark("select_0", "select") == "/* sql extracted: select_0 */"
+
+    def test_detailed(self):
+        marker = SQLCommentMarker(formatter=detailed_comment_formatter)
+        comment = marker.mark("select_0", "select", function_name="get_user", line_start=42)
+        assert comment == "/* sql extracted: select_0 | type: select | func: get_user | line: 42 */"
+
+    def test_styles(self):
+        assert create_marker("mybatis").mark("select_0", "select") == "/* @mybatis:select_0 (select) */"
+        assert create_marker("c_style").mark("select_0", "select") == "// SQL_MARKER: select_0"
+
+    def test_builtin_formatter_ignores_kwargs(self):
+        marker = create_marker("mybatis")
+        assert marker.mark("select_0", "select", function_name="main") == "/* @mybatis:select_0 (select) */"
+        marker.set_formatter(detailed_comment_formatter)
+        assert "func: main" in marker.mark("select_0", "select", function_name="main")
+
+    def test_template(self):
+        marker = SQLCommentMarker(format_template="/* sql: {sql_id} - {sql_type} {{raw}} */")
+        assert marker.mark("select_0", "select") == "/* sql: select_0 - select {raw} */"
+
+    def test_template_with_kwargs(self):
+        marker = create_marker(custom_template="/* {sql_id} @ {function_name} */")
+        assert marker.mark("select_0", "select", function_name="main") == "/* select_0 @ main */"
+
+    def test_template_with_format_spec(self):
+        marker = SQLCommentMarker(format_template="/* {sql_id} line {line_start:04d} */")
+        assert marker.mark("select_0", "select", line_start=7) == "/* select_0 line 0007 */"
+
+    def test_template_missing_field(self):
+        marker = SQLCommentMarker(format_template="/* {unknown} */")
+        with pytest.raises(KeyError):
+            marker.mark("select_0", "select")
+
+    def test_mark_with_call(self):
+        result = SQLCommentMarker().mark_with_call("select_0", "getUser")
+        assert result == '/* sql extracted: select_0 */\nsql_call("select_0", "getUser");'
@@ -0,0 +1,108 @@
+"""
+cursor_merger 모듈 테스트
+
+DECLARE/OPEN/FETCH/CLOSE 그룹화와 SELECT INTO 병합을 테스트합니다.
+"""
+
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_extractor.cursor_merger import CursorMerger
+
+
+def _blocks():
+    return [
+        {'sql_type': 'declare_cursor',
+         'sql': "EXEC SQL DECLARE emp_cur CURSOR FOR SELECT id, name FROM emp WHERE dept = :h_dept;"},
+        {'sql_type': 'open', 'sql': "EXEC SQL OPEN emp_cur;"},
+        {'sql_type': 'fetch_into', 'sql': "EXEC SQL FETCH emp_cur INTO :h_id, :h_name;"},
+        {'sql_type': 'close', 'sql': "EXEC SQL CLOSE emp_cur;"},
+        {'sql_type': 'select', 'sql': "EXEC SQL SELECT 1 INTO :x FROM dual;"},
+    ]
+
+
+class TestFindCursorGroups:
+    """find_cursor_groups 테스트"""
+
+    def test_group(self):
+        groups = CursorMerger().find_cursor_groups(_blocks())
+        assert len(groups) == 1
+        group = groups[0]
+        assert group.cursor_name == 'emp_cur'
+        assert group.open_sql['sql_type'] == 'open'
+        assert len(group.fetch_sqls) == 1
+        assert group.close_sql['sql_type'] == 'close'
+
+    def test_cursor_name_prefix_not_confused(self):
+        blocks = [
+            {'sql_type': 'declare_cursor', 'sql': "DECLARE c1 CURSOR FOR SELECT a FROM t"},
+            {'sql_type': 'declare_cursor', 'sql': "DECLARE c10 CURSOR FOR SELECT b FROM u"},
+            {'sql_type': 'open', 'sql': "OPEN C10"},
+            {'sql_type': 'fetch_into', 'sql': "FETCH c1 INTO :c1_a"},
+        ]
+        c1, c10 = CursorMerger().find_cursor_groups(blocks)
+        assert c1.open_sql is None
+        assert c10.open_sql is blocks[2]
+        assert c1.fetch_sqls == [blocks[3]]
+        assert c10.fetch_sqls == []
+
+    def test_redeclared_cursor_gets_own_group(self):
+        blocks = [
+            {'sql_type': 'declare_cursor', 'sql': "DECLARE c1 CURSOR FOR SELECT a FROM t", 'line_start': 1},
+            {'sql_type': 'fetch_into', 'sql': "FETCH c1 INTO :a", 'line_start': 3},
+            {'sql_type': 'declare_cursor', 'sql': "DECLARE c1 CURSOR FOR SELECT b FROM u", 'line_start': 10},
+            {'sql_type': 'fetch_into', 'sql': "FETCH c1 INTO :b", 'line_start': 12},
+        ]
+        first, second = CursorMerger().find_cursor_groups(blocks)
+        assert first.fetch_sqls == [blocks[1]]
+        assert second.fetch_sqls == [blocks[3]]
+
+    def test_statement_before_declare_ignored(self):
+        blocks = [
+            {'sql_type': 'open', 'sql': "OPEN c1", 'line_start': 1},
+            {'sql_type': 'declare_cursor', 'sql': "DECLARE c1 CURSOR FOR SELECT a FROM t", 'line_start': 5},
+            {'sql_type': 'open', 'sql': "OPEN c1", 'line_start': 7},
+        ]
+        group, = CursorMerger().find_cursor_groups(blocks)
+        assert group.open_sql is blocks[2]
+
+    def test_no_declare(self):
+        assert CursorMerger().find_cursor_groups(_blocks()[1:]) == []
+
+
+class TestMerge:
+    """merge 테스트"""
+
+    def test_merge(self):
+        merger = CursorMerger()
+        merged = merger.merge(merger.find_cursor_groups(_blocks())[0])
+        assert merged.merged_sql == "SELECT id, name INTO :h_id, :h_name FROM emp WHERE dept = :h_dept"
+        assert merged.input_vars == ['h_dept']
+        assert merged.output_vars == ['h_id', 'h_name']
+        assert merged.is_loop_based is False
+
+    def test_merge_multiple_fetches_dedup(self):
+        blocks = _blocks()
+        blocks.insert(3, {'sql_type': 'fetch', 'sql': "EXEC SQL FETCH emp_cur INTO :h_id, :h_rec.code;"})
+        merger = CursorMerger()
+        merged = merger.merge(merger.find_cursor_groups(blocks)[0])
+        assert merged.output_vars == ['h_id', 'h_name', 'h_rec.code']
+        assert merged.is_loop_based is True
+        assert merged.original_fetch == "EXEC SQL FETCH emp_cur INTO :h_id, :h_rec.code;"
+
+    def test_input_vars_exclude_into(self):
+        sql = "SELECT a INTO :o_a FROM t WHERE b = :i_b AND c = :i_b"
+        assert CursorMerger()._extract_input_vars(sql) == ['i_b']
+
+    def test_input_vars_into_name_containing_from(self):
+        sql = "SELECT a INTO :h_from_date FROM t WHERE b = :i_b"
+        assert CursorMerger()._extract_input_vars(sql) == ['i_b']
+
+    def test_insert_into_clause_word_boundary(self):
+        merger = CursorMerger()
+        sql = "select from_date, a_from from t"
+        assert merger._insert_into_clause(sql, "INTO :x") == "select from_date, a_from INTO :x from t"
+        assert merger._insert_into_clause("SELECT 1", "INTO :x") == "SELECT 1 INTO :x"
@@ -0,0 +1,129 @@
+"""
+dynamic_sql_extractor 모듈 테스트
+
+strcpy/strcat/sprintf 추적을 통한 동적 SQL 재구성을 테스트합니다.
+"""
+
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_extractor.dynamic_sql_extractor import DynamicSQLExtractor
+
+
+def _call(name, raw, line, function="f"):
+    return {'type': 'function_call', 'name': name, 'raw_content': raw,
+            'line_start': line, 'line_end': line, 'function': function}
+
+
+class TestExtractDynamicSql:
+    """extract_dynamic_sql 테스트"""
+
+    def test_strcpy_strcat(self):
+        elements = [
+            _call('strcpy', 'strcpy(sql_stmt, "SELECT * ")', 1),
+            _call('strcat', 'strcat(sql_stmt, "FROM emp")', 2),
+        ]
+        result = DynamicSQLExtractor().extract_dynamic_sql("sql_stmt", elements, 10, "f")
+        assert result.reconstructed_sql == "SELECT * FROM emp"
+        assert result.source_operations == [
+            'strcpy(sql_stmt, "SELECT * ")',
+            'strcat(sql_stmt, "FROM emp")',
+        ]
+
+    def test_sprintf(self):
+        elements = [
+            _call('strcpy', 'strcpy(tbl, "emp")', 1),
+            _call('sprintf', 'sprintf(sql_stmt, "SELECT %s FROM %s WHERE x = %5.2f", "a, b", tbl)', 2),
+        ]
+        result = DynamicSQLExtractor().extract_dynamic_sql("sql_stmt", elements, 10)
+        assert result.reconstructed_sql == "SELECT a, b FROM emp WHERE x = ?"
+
+    def test_snprintf(self):
+        elements = [_call('snprintf', 'snprintf(buf, sizeof(buf), "DELETE FROM %s", "t")', 1)]
+        result = DynamicSQLExtractor().extract_dynamic_sql("buf", elements, 10)
+        assert result.reconstructed_sql == "DELETE FROM t"
+
+    def test_ignores_later_lines_and_other_functions(self):
+        elements = [
+            _call('strcpy', 'strcpy(s, "A")', 1),
+            _call('strcpy', 'strcpy(s, "B")', 20),
+            _call('strcpy', 'strcpy(s, "C")', 2, function="g"),
+        ]
+        result = DynamicSQLExtractor().extract_dynamic_sql("s", elements, 10, "f")
+        assert result.reconstructed_sql == "A"
+
+    def test_elements_applied_in_line_order(self):
+        elements = [
+            _call('strcat', 'strcat(s, " FROM t")', 3),
+            {'type': 'declaration', 'name': 'strcpy', 'line_start': 1},
+            _call('strcpy', 'strcpy(s, "SELECT a")', 2),
+        ]
+        result = DynamicSQLExtractor().extract_dynamic_sql("s", elements, 10)
+        assert result.reconstructed_sql == "SELECT a FROM t"
+
+    def test_not_found(self):
+        elements = [_call('strcpy', 'strcpy(other, "A")', 1)]
+        assert DynamicSQLExtractor().extract_dynamic_sql("s", elements, 10) is None
+
+
+class TestSimulateSprintf:
+    """_simulate_sprintf 테스트"""
+
+    def test_literal_percent(self):
+        result = DynamicSQLExtractor()._simulate_sprintf(
+            "SELECT * FROM %s WHERE name LIKE '%%%s%%'", ['"t"', '"kim"'], {}
+        )
+        assert result == "SELECT * FROM t WHERE name LIKE '%kim%'"
+
+    def test_missing_args(self):
+        assert DynamicSQLExtractor()._simulate_sprintf("%s-%d", ['"a"'], {}) == "a-?"
+
+
+class TestResolveValue:
+    """_resolve_value 테스트"""
+
+    def test_literal_reused(self):
+        extractor = DynamicSQLExtractor()
+        first = extractor._resolve_value(' "SELECT * FROM " ', {})
+        assert first == "SELECT * FROM "
+        assert extractor._resolve_value('"SELECT * FROM "', {}) is first
+
+    def test_variable_and_unknown(self):
+        extractor = DynamicSQLExtractor()
+        assert extractor._resolve_value("tbl", {"tbl": "emp"}) == "emp"
+        assert extractor._resolve_value("tbl", {}) == "?"
+        assert extractor._resolve_value("'", {}) == ""
+
+
+class TestCalculateConfidence:
+    """_calculate_confidence 테스트"""
+
+    def test_confidence(self):
+        extractor = DynamicSQLExtractor()
+        assert extractor._calculate_confidence([]) == 0.0
+        assert extractor._calculate_confidence(["strcpy(s, a)"]) == 0.95
+        assert abs(extractor._calculate_confidence(["strcpy(s, ?)", "x"]) - 0.8) < 1e-9
+        assert extractor._calculate_confidence(["?"] * 10) == 0.0
+
+
+class TestSplitArgs:
+    """_split_args 테스트"""
+
+    def test_quotes_and_parentheses(self):
+        args = DynamicSQLExtractor()._split_args('buf, sizeof(a, b), "x, \\"y\\"", \'c\'')
+        assert args == ['buf', 'sizeof(a, b)', '"x, \\"y\\""', "'c'"]
+
+    def test_escaped_backslash_closes_quote(self):
+        # C 리터럴 "C:\\" 는 백슬래시 한 개로 끝나는 문자열
+        args = DynamicSQLExtractor()._split_args('buf, "C:\\\\", x')
+        assert args == ['buf', '"C:\\\\"', 'x']
+
+    def test_trailing_comma(self):
+        assert DynamicSQLExtractor()._split_args('a,') == ['a']
+        assert DynamicSQLExtractor()._split_args('a, ') == ['a', '']
+
+    def test_nested_parentheses(self):
+        assert DynamicSQLExtractor()._split_args('f(g(1, 2), 3), z') == ['f(g(1, 2), 3)', 'z']
@@ -9,7 +9,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from header_parser import TypedefStructParser, STPParser, HeaderParser
-from shared_config import snake_to_camel, find_count_field
+from shared_config import snake_to_camel, snake_to_camel_batch, find_count_field, get_java_type, get_jdbc_type
 
 
 class TestSnakeToCamel:
@@ -30,6 +30,10 @@ class TestSnakeToCamel:
         # 언더스코어로 시작하는 경우
         result = snake_to_camel("a_nxt_sqno")
         assert result == "aNxtSqno"
+        
+    def test_batch_conversion(self):
+        names = ["user_name", "a_nxt_sqno", "user_name", "name"]
+        assert snake_to_camel_batch(names) == ["userName", "aNxtSqno", "userName", "name"]
 
 
 class TestTypedefStructParser:
@@ -142,6 +146,22 @@ class TestFindCountField:
         assert result == "totalItems"
 
 
+class TestTypeMapping:
+    """C 타입 → Java/JDBC 타입 매핑 테스트"""
+    
+    def test_exact_match(self):
+        assert get_java_type("int") == "Integer"
+        assert get_jdbc_type("unsigned long") == "NUMERIC"
+        
+    def test_case_and_whitespace_tolerant(self):
+        assert get_java_type(" Int ") == "Integer"
+        assert get_jdbc_type("UNSIGNED  SHORT") == "SMALLINT"
+        
+    def test_unknown_type_default(self):
+        assert get_java_type("my_struct_t") == "String"
+        assert get_jdbc_type("") == "VARCHAR"
+
+
 class TestHeaderParser:
     """HeaderParser 통합 테스트"""
     
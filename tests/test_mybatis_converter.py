@@ -0,0 +1,123 @@
+"""
+mybatis_converter 모듈 테스트
+
+EXEC SQL 제거, INTO 절 제거, 호스트 변수 변환을 테스트합니다.
+"""
+
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_extractor.mybatis_converter import MyBatisConverter
+
+
+def _converter():
+    converter = MyBatisConverter()
+    converter.set_alias_enabled(False)
+    return converter
+
+
+class TestConvertSql:
+    """convert_sql 테스트"""
+
+    def test_select_into(self):
+        result = _converter().convert_sql(
+            "EXEC SQL SELECT name INTO :out_name FROM users WHERE id = :in_id;",
+            "select", "select_0", [":in_id"], [":out_name"]
+        )
+        assert result.sql == "SELECT name FROM users WHERE id = #{in_id}"
+        assert result.mybatis_type == "select"
+        assert result.input_params == ["in_id"]
+        assert result.output_fields == ["out_name"]
+
+    def test_select_into_aliases_with_f(self):
+        converter = MyBatisConverter()
+        result = converter.convert_sql(
+            "SELECT a, b INTO :buf, :out_fee FROM t", "select", "select_0", [], [":buf", ":out_fee"]
+        )
+        assert result.sql == "SELECT a AS buf, b AS outFee FROM t"
+        result = converter.convert_sql("SELECT a INTO :out_f FROM t", "select", "select_0", [], [":out_f"])
+        assert result.sql == "SELECT a AS outF FROM t"
+
+    def test_time_format_protected(self):
+        result = _converter().convert_sql(
+            "SELECT TO_CHAR(d, 'HH24:MI:SS') FROM t WHERE id = :id", "select", "select_0", [":id"]
+        )
+        assert result.sql == "SELECT TO_CHAR(d, 'HH24:MI:SS') FROM t WHERE id = #{id}"
+
+
+class TestConvertHostVariables:
+    """_convert_host_variables 테스트"""
+
+    def test_prefix_variables(self):
+        # :id 가 :id_list 의 접두어로 먼저 치환되지 않아야 함
+        result = _converter()._convert_host_variables(
+            "WHERE a = :id AND b = :id_list", [":id", ":id_list"]
+        )
+        assert result == "WHERE a = #{id} AND b = #{id_list}"
+
+    def test_indicator_array_and_struct(self):
+        result = _converter()._convert_host_variables(
+            "VALUES (:v:ind, :arr[i], :rec.code, :other)", [":v:ind", ":arr[i]", ":rec.code"]
+        )
+        assert result == "VALUES (#{v}, #{arr}, #{rec_code}, #{other})"
+
+    def test_empty_var_ignored(self):
+        assert _converter()._convert_host_variables("a = :x", [""]) == "a = #{x}"
+
+    def test_input_var_without_colon(self):
+        result = _converter()._convert_host_variables("a = :p_ccy AND b = :p_ccy", ["p_ccy"])
+        assert result == "a = #{p_ccy} AND b = #{p_ccy}"
+
+    def test_time_format_colons_not_converted(self):
+        sql = "WHERE t = TO_DATE(x, 'YYYY-MM-DD HH24:MI:SS') AND y = :y"
+        result = _converter()._convert_host_variables(sql, [])
+        assert result == "WHERE t = TO_DATE(x, 'YYYY-MM-DD HH24:MI:SS') AND y = #{y}"
+
+
+class TestRemoveExecSql:
+    """_remove_exec_sql 테스트"""
+
+    def test_prefix_removed(self):
+        converter = _converter()
+        assert converter._remove_exec_sql("EXEC SQL SELECT 1") == "SELECT 1"
+        assert converter._remove_exec_sql("\n  exec\tsql\n  COMMIT") == "COMMIT"
+        assert converter._remove_exec_sql("EXEC SQL ") == ""
+
+    def test_not_prefix(self):
+        converter = _converter()
+        for sql in ("SELECT 1", "EXECSQL SELECT 1", "EXEC SQLX", "EXEC SQL", " EXECUTE s1"):
+            assert converter._remove_exec_sql(sql) == sql
+
+
+class TestCleanupSql:
+    """_cleanup_sql 테스트"""
+
+    def test_collapse_whitespace_and_semicolon(self):
+        sql = "\n  SELECT a,\n\t b\n  FROM t  ;"
+        assert _converter()._cleanup_sql(sql) == "SELECT a, b FROM t "
+        assert _converter()._cleanup_sql("COMMIT;") == "COMMIT"
+
+
+class TestRemoveIntoClause:
+    """remove_into_clause 테스트"""
+
+    def test_into_from(self):
+        converter = _converter()
+        assert converter.remove_into_clause("SELECT a INTO :x FROM t") == "SELECT a FROM t"
+        assert converter.remove_into_clause("select a into :ref, :h_from_date\n from t") == "select a from t"
+
+    def test_into_where_without_from(self):
+        assert _converter().remove_into_clause("FETCH c INTO :a, :w WHERE x") == "FETCH c WHERE x"
+
+    def test_no_into(self):
+        sql = "SELECT a FROM t WHERE b = 1"
+        assert _converter().remove_into_clause(sql) is sql
+
+    def test_keyword_word_boundary(self):
+        converter = _converter()
+        assert converter.remove_into_clause("SELECT into_x, a INTO :x FROM t") == "SELECT into_x, a FROM t"
+        assert converter.remove_into_clause("SELECT a INTO :x FROM_T") == "SELECT a INTO :x FROM_T"
+        assert converter.remove_into_clause("SELECT 'ß' INTO :x FROM t") == "SELECT 'ß' FROM t"
@@ -0,0 +1,54 @@
+"""
+proc_parser_adapter 모듈 테스트
+
+ProCParser용 SQL 요소 변환과 SQL 정규화를 테스트합니다.
+"""
+
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_extractor.proc_parser_adapter import ProcParserSQLAdapter
+
+
+SAMPLE = """
+void f() {
+    EXEC SQL DECLARE emp_cur CURSOR FOR SELECT id FROM emp;
+    EXEC SQL OPEN emp_cur;
+    EXEC SQL FETCH emp_cur INTO :h_id;
+    EXEC SQL SELECT name INTO :h_name FROM emp WHERE id = :h_id;
+    EXEC SQL COMMIT WORK;
+}
+"""
+
+
+class TestExtractSqlElements:
+    """extract_sql_elements_as_dicts 테스트"""
+
+    def test_sql_type_uppercase(self):
+        # 관계 플러그인은 sql_type을 대문자로 가정하고 그대로 비교함
+        elements = ProcParserSQLAdapter().extract_sql_elements_as_dicts(SAMPLE)
+        assert [el['sql_type'] for el in elements] == ['DECLARE', 'OPEN', 'FETCH', 'SELECT', 'COMMIT']
+
+
+class TestNormalizeSql:
+    """_normalize_sql 테스트"""
+
+    def test_exec_sql_and_whitespace(self):
+        adapter = ProcParserSQLAdapter()
+        assert adapter._normalize_sql("  exec sql\n  UPDATE t\n\tSET a = :a ;", "update") == "UPDATE t SET a = :a"
+        assert adapter._normalize_sql("EXECUTE s1 USING :h;", "execute") == "EXECUTE s1 USING :h"
+
+    def test_for_array_clause(self):
+        sql = "EXEC SQL FOR :n INSERT INTO t VALUES (:a);"
+        assert ProcParserSQLAdapter()._normalize_sql(sql, "insert") == "INSERT INTO t VALUES (:a)"
+
+    def test_into_removed_for_select_and_fetch(self):
+        adapter = ProcParserSQLAdapter()
+        sql = "EXEC SQL SELECT a\n INTO :x FROM t WHERE b = :b;"
+        assert adapter._normalize_sql(sql, "select") == "SELECT a FROM t WHERE b = :b"
+        assert adapter._normalize_sql("EXEC SQL FETCH c1 into :x, :y;", "fetch_into") == "FETCH c1"
+        # INSERT INTO는 유지
+        assert adapter._normalize_sql("INSERT INTO t VALUES (1)", "insert") == "INSERT INTO t VALUES (1)"
@@ -66,6 +66,13 @@ class TestSQLConverterAliasing(unittest.TestCase):
         self.assertIn("'2023-01-01 12:00:00'", result['normalized_sql'])
         self.assertEqual(len(result['input_host_vars']), 0)
 
+    def test_unquoted_time_edge_case(self):
+        # 숫자 바로 뒤의 :name은 호스트 변수가 아님 (예: 12:mi)
+        sql = "SELECT 12:mi FROM dual WHERE id = :user_id"
+        result = self.converter.normalize_sql(sql)
+        self.assertIn("12:mi", result['normalized_sql'])
+        self.assertEqual(result['input_host_vars'], [':user_id'])
+
     def test_complex_nested_sql(self):
         sql = """
         SELECT * FROM (
@@ -155,6 +162,22 @@ class TestSQLConverterAliasing(unittest.TestCase):
             result = converter.normalize_sql(sql)
             self.assertEqual(result['sql_type'], expected_type, f"Failed for: {sql}")
 
+    def test_alias_cache_reused(self):
+        """같은 호스트 변수는 convert를 한 번만 호출"""
+        calls = []
+
+        class CountingPlugin(SnakeToCamelPlugin):
+            def convert(self, name):
+                calls.append(name)
+                return super().convert(name)
+
+        converter = SQLConverter(naming_convention=CountingPlugin())
+        sql = "SELECT * FROM t WHERE a = :user_id OR b = :user_id"
+        result = converter.normalize_sql(sql)
+        converter.normalize_sql(sql)
+        self.assertEqual(result['normalized_sql'].count(":user_id AS userId"), 2)
+        self.assertEqual(calls, ['user_id'])
+
 if __name__ == '__main__':
     unittest.main()
 
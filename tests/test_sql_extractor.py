@@ -9,6 +9,7 @@ import sys
 import tempfile
 import shutil
 import re
+import json
 
 # 상위 디렉토리를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -30,6 +31,7 @@ from sql_extractor import (
 )
 from sql_extractor.rules.sql_type_rules import DEFAULT_SQL_TYPE_RULES
 from sql_extractor.rules.host_variable_rules import DEFAULT_HOST_VARIABLE_RULES
+from sql_extractor.extractor import _compile_format
 
 
 class TestSQLTypeRegistry:
@@ -103,6 +105,23 @@ class TestSQLTypeRegistry:
         result = self.registry.determine_type("EXEC SQL MERGE INTO users;")
         assert result.matched
         assert result.value == "merge"
+    
+    def test_leading_keyword_dispatch(self):
+        """첫 키워드로 검사 대상 규칙 축소 (주석 건너뜀, 키워드 무관 규칙 포함)"""
+        assert self.registry.determine_type("EXEC SQL /* hint */ SELECT 1 FROM dual;").value == "select"
+        assert self.registry.determine_type("exec sql\n  commit work;").value == "commit"
+        assert self.registry.determine_type("EXEC SQL FOO;").value == "unknown"
+        
+        class AnyRule(SQLTypeRule):
+            name = "any"
+            priority = 10
+            pattern = re.compile(r'EXEC\s+SQL', re.IGNORECASE)
+        
+        self.registry.register(AnyRule())
+        assert self.registry.determine_type("EXEC SQL FOO;").value == "any"
+        assert self.registry.determine_type("EXEC SQL DELETE FROM t;").value == "delete"
+        self.registry.clear()
+        assert self.registry.determine_type("EXEC SQL DELETE FROM t;").value == "unknown"
 
 
 class TestHostVariableRegistry:
@@ -167,6 +186,38 @@ class TestHostVariableRegistry:
         
         assert 'in_name' in input_names
         assert 'out_id' in output_names
+    
+    def test_extract_cached_per_text(self):
+        """같은 SQL 텍스트는 한 번만 추출, 규칙 변경 시 캐시 무효화"""
+        sql = "EXEC SQL SELECT a INTO :out_a FROM t WHERE b = :in_b;"
+        first = self.registry.extract_all(sql)
+        second = self.registry.extract_all(sql)
+        assert second == first and second is not first
+        
+        input_vars, output_vars = self.registry.classify_by_direction(sql, "select")
+        assert [v['var_name'] for v in input_vars] == ['in_b']
+        assert [v['var_name'] for v in output_vars] == ['out_a']
+        
+        # regex 모드에서는 규칙이 바뀌면 다시 추출
+        registry = HostVariableRegistry(config=SQLExtractorConfig(PARSER_MODE="regex"))
+        registry.load_defaults()
+        assert registry.extract_all(sql)
+        registry.clear()
+        assert registry.extract_all(sql) == []
+    
+    def test_extract_and_classify(self):
+        """추출과 분류를 한 번에 (classify_by_direction과 같은 결과)"""
+        sql = "EXEC SQL FETCH c1 INTO :o_a, :o_b;"
+        all_vars, input_vars, output_vars = self.registry.extract_and_classify(sql, "fetch_into")
+        assert [v['var_name'] for v in all_vars] == ['o_a', 'o_b']
+        assert input_vars == []
+        assert (input_vars, output_vars) == self.registry.classify_by_direction(sql, "fetch_into")
+        
+        all_vars, input_vars, output_vars = self.registry.extract_and_classify(
+            "EXEC SQL UPDATE t SET a = :a;", "update"
+        )
+        assert input_vars == all_vars and input_vars is not all_vars
+        assert output_vars == []
 
 
 class TestDB2Rules:
@@ -206,6 +257,60 @@ class TestDB2Rules:
         assert result.metadata.get('fetch_first') == 10
 
 
+class TestSQLExtractorConfig:
+    """SQLExtractorConfig 블랙리스트 테스트"""
+    
+    def test_combined_blacklist_default(self):
+        """기본 설정은 시간 포맷 블랙리스트만 포함"""
+        blacklist = SQLExtractorConfig().get_combined_blacklist()
+        assert 'HH24' in blacklist
+        assert 'CURRENT' not in blacklist
+    
+    def test_combined_blacklist_cached(self):
+        """설정이 같으면 같은 객체 반환"""
+        config = SQLExtractorConfig(CUSTOM_HOST_VAR_BLACKLIST={'my_const'})
+        first = config.get_combined_blacklist()
+        assert 'MY_CONST' in first
+        assert config.get_combined_blacklist() is first
+    
+    def test_combined_blacklist_follows_config_change(self):
+        """설정 변경 시 다시 계산"""
+        config = SQLExtractorConfig()
+        assert 'CURRENT' not in config.get_combined_blacklist()
+        config.DBMS_DIALECT = "db2"
+        assert 'CURRENT' in config.get_combined_blacklist()
+    
+    def test_combined_blacklist_shared_between_configs(self):
+        """같은 플래그 조합이면 설정 객체가 달라도 같은 집합 공유"""
+        first = SQLExtractorConfig(DBMS_DIALECT="postgresql").get_combined_blacklist()
+        second = SQLExtractorConfig(USE_POSTGRESQL_TYPE_BLACKLIST=True).get_combined_blacklist()
+        assert first is second
+        assert {'HH24', 'JSONB', 'DATE'} <= first
+
+
+class TestCompileFormat:
+    """_compile_format 테스트"""
+    
+    def test_matches_str_format(self):
+        config = SQLExtractorConfig()
+        render = _compile_format(config.SQL_CALL_FORMAT, ("sql_id", "sql_name"))
+        assert render("sql_0", "select_0") == config.SQL_CALL_FORMAT.format(
+            sql_id="sql_0", sql_name="select_0"
+        )
+    
+    def test_percent_braces_and_field_order(self):
+        render = _compile_format("{b}% {{a}} {a}-{b}", ("a", "b"))
+        assert render("x", "y") == "y% {a} x-y"
+    
+    def test_format_spec_falls_back(self):
+        render = _compile_format("{a:>3}|{b!r}", ("a", "b"))
+        assert render("x", "y") == "  x|'y'"
+    
+    def test_unknown_field(self):
+        with pytest.raises(KeyError):
+            _compile_format("{missing}", ("a",))("x")
+
+
 class TestSQLExtractor:
     """SQLExtractor 테스트"""
     
@@ -261,6 +366,148 @@ int main() { return 0; }
         assert 'EXEC SQL BEGIN DECLARE SECTION' not in result
         assert 'declare_section_files' in program_dict
 
+    
+    def test_extract_with_regex_skips_comments(self):
+        """정규식 fallback: 주석 내 EXEC SQL 제외, 문자열 내 세미콜론 무시"""
+        code = (
+            "/* EXEC SQL SELECT 1; // x */\n"
+            "// EXEC SQL DELETE FROM t;\n"
+            "int f() {\n"
+            "    EXEC SQL SELECT 'a;b' INTO :x FROM dual;\n"
+            "    /* done */ EXEC SQL COMMIT;\n"
+            "}\n"
+        )
+        blocks = self.extractor._extract_with_regex(code)
+        
+        assert [b.text for b in blocks] == [
+            "EXEC SQL SELECT 'a;b' INTO :x FROM dual;",
+            "EXEC SQL COMMIT;",
+        ]
+        assert [(b.start_line, b.end_line) for b in blocks] == [(4, 4), (5, 5)]
+        assert code[blocks[1].start_byte:blocks[1].end_byte] == blocks[1].text
+    
+    def test_extract_with_regex_skips_c_strings(self):
+        """정규식 fallback: C 문자열 내 EXEC SQL / 주석 기호 무시"""
+        code = (
+            'char *s = "EXEC SQL fake;";\n'
+            'printf("// not a comment");\n'
+            "EXEC SQL UPDATE t SET a = 1 /* ; */ WHERE b = 2;\n"
+        )
+        blocks = self.extractor._extract_with_regex(code)
+        
+        assert [b.text for b in blocks] == ["EXEC SQL UPDATE t SET a = 1 /* ; */ WHERE b = 2;"]
+        assert blocks[0].start_line == 3
+
+    def test_extract_with_regex_stray_apostrophe_in_c(self):
+        """정규식 fallback: C 영역의 짝 없는 작은따옴표가 다음 줄 SQL을 삼키지 않음"""
+        code = (
+            "#if 0\n"
+            " it's broken\n"
+            "#endif\n"
+            " EXEC SQL SELECT a INTO :b FROM t;\n"
+            "/* don't */\n"
+            " EXEC SQL UPDATE t SET a = 'x\n'' y' WHERE b = 1;\n"
+        )
+        blocks = self.extractor._extract_with_regex(code)
+
+        assert [b.text for b in blocks] == [
+            "EXEC SQL SELECT a INTO :b FROM t;",
+            "EXEC SQL UPDATE t SET a = 'x\n'' y' WHERE b = 1;",
+        ]
+        assert [(b.start_line, b.end_line) for b in blocks] == [(4, 4), (6, 7)]
+
+    def test_replace_blocks_uses_block_position(self):
+        """치환은 블록 위치 기준 (앞쪽 주석 속 같은 텍스트는 유지)"""
+        code = "/* EXEC SQL COMMIT; */\nEXEC SQL COMMIT;\nEXEC SQL COMMIT;\n"
+        blocks = self.extractor._extract_with_regex(code)
+        result = self.extractor._replace_blocks(code, [(blocks[0], "A"), (blocks[1], "B")])
+        assert result == "/* EXEC SQL COMMIT; */\nA\nB\n"
+    
+    def test_save_sql_calls_yaml(self):
+        """sql_calls.yaml은 하나의 리스트 문서로 저장되고 SQL은 블록 스칼라로 출력"""
+        yaml = pytest.importorskip("yaml")
+        self.config.OUTPUT_PATH = self.temp_dir
+        sql_data = [
+            {"id": "sql_0", "sql": "EXEC SQL SELECT a\n  INTO :a FROM t;", "input_vars": []},
+            {"id": "sql_1", "sql": "EXEC SQL COMMIT;", "metadata": {"dbms": "db2"}},
+        ]
+        self.extractor._save_sql_calls(sql_data, "prog")
+        
+        path = os.path.join(self.temp_dir, "prog", "sql", "sql_calls.yaml")
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        assert "sql: |-" in text
+        assert yaml.safe_load(text) == sql_data
+        assert type(sql_data[0]["sql"]) is str
+    
+    def test_save_sql_calls_json_fallback(self, monkeypatch):
+        """YAML 미설치 시 JSON 출력 (orjson 유무와 관계없이 같은 내용)"""
+        from sql_extractor import extractor as extractor_module
+        monkeypatch.setattr(extractor_module, "HAS_YAML", False)
+        self.config.OUTPUT_PATH = self.temp_dir
+        sql_data = [{"id": "sql_0", "sql": "EXEC SQL SELECT '한글' INTO :a FROM t;", "metadata": {"n": 1}}]
+        path = os.path.join(self.temp_dir, "prog", "sql", "sql_calls.json")
+        
+        outputs = []
+        for has_orjson in sorted({False, extractor_module.HAS_ORJSON}):
+            monkeypatch.setattr(extractor_module, "HAS_ORJSON", has_orjson)
+            self.extractor._save_sql_calls(sql_data, "prog")
+            with open(path, encoding="utf-8") as f:
+                outputs.append(f.read())
+        
+        assert json.loads(outputs[0]) == sql_data
+        assert len(set(outputs)) == 1
+    
+    def test_map_sql_to_functions(self):
+        """함수 파일 우선, 나머지는 클래스 파일에서 None으로 매핑"""
+        self.config.OUTPUT_PATH = self.temp_dir
+        func_dir = os.path.join(self.temp_dir, "prog", "func")
+        os.makedirs(func_dir)
+        with open(os.path.join(func_dir, "func_main.c"), "w", encoding="utf-8") as f:
+            f.write('sql_call("sql_0", "select_0");\n')
+        with open(os.path.join(func_dir, "func_sub.c"), "w", encoding="utf-8") as f:
+            f.write('sql_call("sql_2", "insert_0");\n')
+        with open(os.path.join(self.temp_dir, "prog", "prog.c"), "w", encoding="utf-8") as f:
+            f.write('sql_call("sql_0", "select_0");\nsql_call("sql_1", "update_0");\n')
+        
+        funcs = [{"function_name": "main"}, {"name": "main"}, {"name": "missing"}, {}, {"name": "sub"}]
+        result = self.extractor.map_sql_to_functions("prog", funcs)
+        assert result == {"sql_0": "main", "sql_2": "sub", "sql_1": None}
+        assert self.extractor.map_sql_to_functions("nothing", funcs) == {}
+    
+    def test_extract_sql_blocks_cached(self):
+        """같은 코드는 추출 결과를 재사용 (모드별 구분)"""
+        code = "int f() {\n    EXEC SQL COMMIT;\n}\n"
+        self.extractor.use_tree_sitter = False
+        calls = []
+        original = self.extractor._extract_with_regex
+        self.extractor._extract_with_regex = lambda c: calls.append(c) or original(c)
+        
+        first = self.extractor._extract_sql_blocks(code)
+        self.extractor.create_sql_commented_version(code, "prog")
+        assert self.extractor._extract_sql_blocks(code) == first
+        assert len(calls) == 1
+        
+        self.extractor._extract_sql_blocks(code + "\n")
+        assert len(calls) == 2
+    
+    def test_merged_cursor_ops_match_whole_name(self):
+        """병합된 커서 c1의 OPEN/FETCH/CLOSE만 제거 (c10은 별도 SQL)"""
+        code = (
+            "int f() {\n"
+            "    EXEC SQL DECLARE c1 CURSOR FOR SELECT a FROM t;\n"
+            "    EXEC SQL OPEN c1;\n"
+            "    EXEC SQL FETCH c1 INTO :a;\n"
+            "    EXEC SQL CLOSE C1;\n"
+            "    EXEC SQL CLOSE c10;\n"
+            "}\n"
+        )
+        self.extractor.use_tree_sitter = False
+        result, sqls = self.extractor.extract_with_mybatis_conversion(code, "prog")
+        assert result.count("cursor_op */") == 3
+        assert len(sqls) == 2
+        assert sqls[1].original_sql == "EXEC SQL CLOSE c10;"
+
 
 class TestTreeSitterExtractor:
     """TreeSitterSQLExtractor 테스트"""
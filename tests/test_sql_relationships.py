@@ -72,6 +72,46 @@ def test_cursor_relationship():
     print("✓ Cursor relationship test passed")
 
 
+def test_cursor_statements_after_declare():
+    """DECLARE 이후 라인의 OPEN/FETCH/CLOSE만 같은 커서로 묶이는지 테스트합니다."""
+    plugin = CursorRelationshipPlugin()
+    
+    def el(sql_id, sql_type, sql, line):
+        return {'sql_id': sql_id, 'sql_type': sql_type, 'normalized_sql': sql,
+                'input_host_vars': [], 'output_host_vars': [], 'line_start': line}
+    
+    sql_elements = [
+        el('s1', 'DECLARE', 'DECLARE c1 CURSOR FOR SELECT a FROM t', 10),
+        el('s2', 'OPEN', 'OPEN c1', 12),
+        el('s3', 'CLOSE', 'CLOSE c1', 14),
+        el('s4', 'DECLARE', 'DECLARE c1 CURSOR FOR SELECT b FROM u', 20),
+        el('s5', 'FETCH', 'FETCH c1', 24),
+        el('s6', 'OPEN', 'OPEN c1', 22),
+        el('s7', 'FETCH', 'FETCH c2', 25),
+    ]
+    
+    first, second = plugin.extract_relationships(sql_elements)
+    
+    assert first['sql_ids'] == ['s1', 's2', 's5', 's3']
+    assert second['sql_ids'] == ['s4', 's6', 's5']
+    assert second['relationship_id'] == 'cursor_c1_002'
+
+
+def test_cursor_name_case_insensitive():
+    """커서 이름을 대소문자 구분 없이 매칭하는지 테스트합니다."""
+    plugin = CursorRelationshipPlugin()
+    
+    sql_elements = [
+        {'sql_id': 's1', 'sql_type': 'DECLARE', 'line_start': 1,
+         'normalized_sql': 'DECLARE emp_cur CURSOR FOR SELECT a FROM t'},
+        {'sql_id': 's2', 'sql_type': 'OPEN', 'line_start': 2, 'normalized_sql': 'OPEN EMP_CUR'},
+        {'sql_id': 's3', 'sql_type': 'CLOSE', 'line_start': 3, 'normalized_sql': 'close Emp_Cur'},
+    ]
+    
+    rel, = plugin.extract_relationships(sql_elements)
+    assert rel['sql_ids'] == ['s1', 's2', 's3']
+
+
 def test_dynamic_sql_relationship():
     """동적 SQL 패턴 감지를 테스트합니다."""
     plugin = DynamicSQLRelationshipPlugin()
@@ -112,6 +152,47 @@ def test_dynamic_sql_relationship():
     print("✓ Dynamic SQL relationship test passed")
 
 
+def test_dynamic_sql_statement_name_exact_match():
+    """접두어가 같은 statement 이름의 EXECUTE를 혼동하지 않는지 테스트합니다."""
+    plugin = DynamicSQLRelationshipPlugin()
+    
+    sql_elements = [
+        {'sql_id': 's1', 'sql_type': 'PREPARE', 'line_start': 1, 'normalized_sql': 'PREPARE s1 FROM ?'},
+        {'sql_id': 's2', 'sql_type': 'PREPARE', 'line_start': 2, 'normalized_sql': 'PREPARE s10 FROM ?'},
+        {'sql_id': 's3', 'sql_type': 'EXECUTE', 'line_start': 3, 'normalized_sql': 'EXECUTE S10 USING ?'},
+        {'sql_id': 's4', 'sql_type': 'EXECUTE', 'line_start': 4, 'normalized_sql': 'execute s1'},
+        {'sql_id': 's5', 'sql_type': 'EXECUTE', 'line_start': 0, 'normalized_sql': 'EXECUTE s1'},
+    ]
+    
+    rel_s1, rel_s10 = plugin.extract_relationships(sql_elements)
+    assert rel_s1['sql_ids'] == ['s1', 's4']
+    assert rel_s10['sql_ids'] == ['s2', 's3']
+
+
+def test_simulate_sprintf():
+    """sprintf 지정자 치환과 '%%', 인자 부족 처리를 테스트합니다."""
+    plugin = DynamicSQLRelationshipPlugin()
+    
+    result = plugin._simulate_sprintf("SELECT * FROM %s WHERE a = %5.2f", ['"emp"', 'rate'], {'rate': '1.5'})
+    assert result == "SELECT * FROM emp WHERE a = 1.5"
+    assert plugin._simulate_sprintf("LIKE '%%%s%%'", ['"kim"'], {}) == "LIKE '%kim%'"
+    # 인자가 부족하면 지정자 유지, 지정자가 아닌 '%'는 그대로
+    assert plugin._simulate_sprintf("%s-%d", ['"a"'], {}) == "a-%d"
+    assert plugin._simulate_sprintf("100 % x %", ['"a"'], {}) == "100 % x %"
+
+
+def test_parse_c_args():
+    """C 함수 인자를 따옴표와 괄호를 고려해 분리하는지 테스트합니다."""
+    plugin = DynamicSQLRelationshipPlugin()
+    
+    args = plugin._parse_c_args('buf, sizeof(a, b), "x, \\"y\\"", \'c\'')
+    assert args == ['buf', 'sizeof(a, b)', '"x, \\"y\\""', "'c'"]
+    assert plugin._parse_c_args('f(g(1, 2), 3), z') == ['f(g(1, 2), 3)', 'z']
+    # 닫히지 않은 따옴표는 나머지 전체를 마지막 인자로 취급
+    assert plugin._parse_c_args('a, "b, c') == ['a', '"b, c']
+    assert plugin._parse_c_args('') == []
+
+
 def test_transaction_relationship():
     """트랜잭션 경계 감지를 테스트합니다."""
     plugin = TransactionRelationshipPlugin()
@@ -151,6 +232,35 @@ def test_transaction_relationship():
     print("✓ Transaction relationship test passed")
 
 
+def test_transaction_multiple_boundaries():
+    """여러 COMMIT/ROLLBACK 경계에서 각 문이 한 트랜잭션에만 묶이는지 테스트합니다."""
+    plugin = TransactionRelationshipPlugin()
+    
+    def el(sql_id, sql_type, line, function='f'):
+        return {'sql_id': sql_id, 'sql_type': sql_type, 'line_start': line, 'function': function}
+    
+    sql_elements = [
+        el('s1', 'CONNECT', 1),
+        el('s2', 'INSERT', 2),
+        el('s3', 'UPDATE', 3),
+        el('s4', 'COMMIT', 4),
+        el('s5', 'ROLLBACK', 5),
+        el('s6', 'DELETE', 6),
+        el('s7', 'ROLLBACK', 7),
+        el('s8', 'COMMIT', 8),
+        el('s9', 'INSERT', 1, function='g'),
+        el('s10', 'COMMIT', 2, function='g'),
+    ]
+    
+    rels = plugin.extract_relationships(sql_elements)
+    
+    assert [r['sql_ids'] for r in rels] == [['s2', 's3', 's4'], ['s6', 's7'], ['s9', 's10']]
+    assert [r['relationship_id'] for r in rels] == ['txn_f_001', 'txn_f_003', 'txn_g_005']
+    assert [r['metadata']['is_commit'] for r in rels] == [True, False, True]
+    assert [r['metadata']['has_rollback'] for r in rels] == [True, False, False]
+    assert [r['metadata']['statement_count'] for r in rels] == [2, 1, 1]
+
+
 def test_array_dml_relationship():
     """Array DML 패턴 감지를 테스트합니다."""
     plugin = ArrayDMLRelationshipPlugin()
@@ -188,8 +298,14 @@ if __name__ == '__main__':
     print("Running SQL Relationship Plugin Tests...\n")
     
     test_cursor_relationship()
+    test_cursor_statements_after_declare()
+    test_cursor_name_case_insensitive()
     test_dynamic_sql_relationship()
+    test_dynamic_sql_statement_name_exact_match()
+    test_simulate_sprintf()
+    test_parse_c_args()
     test_transaction_relationship()
+    test_transaction_multiple_boundaries()
     test_array_dml_relationship()
     
     print("\n✓ All tests passed!")
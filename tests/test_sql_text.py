@@ -0,0 +1,32 @@
+"""
+sql_text 모듈 테스트
+
+키워드 검색과 INTO 절 제거 헬퍼를 테스트합니다.
+"""
+
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sql_extractor.sql_text import find_keyword, remove_into_clause
+
+
+class TestFindKeyword:
+    """find_keyword 테스트"""
+
+    def test_word_boundary(self):
+        text = "SELECT INTO_X, A INTO :X FROM T"
+        assert find_keyword(text, 'INTO') == text.index('INTO :X')
+        assert find_keyword(text, 'FROM', 26) == -1
+        assert find_keyword("A_FROM FROM_B", 'FROM') == -1
+
+
+class TestRemoveIntoClause:
+    """remove_into_clause 테스트"""
+
+    def test_into_list_with_f(self):
+        assert remove_into_clause("SELECT a, b INTO :buf, :out_fee FROM t") == "SELECT a, b FROM t"
+        sql = "SELECT a FROM t"
+        assert remove_into_clause(sql) is sql